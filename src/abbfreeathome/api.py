@@ -1,19 +1,18 @@
 """Provides a class for interacting with the ABB-free@home API."""
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 import inspect
-import json
 import logging
 import os
 import ssl
-from typing import Any
+from typing import Any, NamedTuple
 from urllib.parse import urlparse
 
 try:
-    from aiohttp import TCPConnector, encode_basic_auth as _aiohttp_encode_basic_auth
+    from aiohttp import encode_basic_auth as _aiohttp_encode_basic_auth
 except ImportError:  # pragma: no cover - depends on the installed aiohttp version
-    from aiohttp import BasicAuth, TCPConnector
+    from aiohttp import BasicAuth
 
     _aiohttp_encode_basic_auth = None
 from aiohttp.client import ClientSession, ClientWebSocketResponse
@@ -29,17 +28,29 @@ import backoff
 from packaging.version import Version
 import voluptuous as vol
 
+from .codec import json_dumps, json_loads
+from .connection_pool import ConnectionPool, create_ssl_context
 from .exceptions import (
     BadRequestException,
     ClientConnectionError,
     ConnectionTimeoutException,
     ForbiddenAuthException,
+    FreeAtHomeException,
     InvalidApiResponseException,
     InvalidCredentialsException,
     InvalidHostException,
     SetDatapointFailureException,
     SslErrorException,
     UserNotFoundException,
+    WriteQueueFullException,
+)
+from .message import WebsocketMessage
+from .write_queue import (
+    DEFAULT_WRITE_QUEUE_MAX_SIZE,
+    DEFAULT_WRITE_QUEUE_WORKERS,
+    WriteQueue,
+    WriteQueueMetrics,
+    WriteQueueOverflowPolicy,
 )
 
 API_VERSION = "v1"
@@ -71,32 +82,39 @@ _LOGGER = logging.getLogger(__name__)
 class SSLContextMixin:
     """Mixin class to provide SSL context functionality."""
 
+    _connection_pool: ConnectionPool | None = None
+
     def __init__(self):
         """Initialize the SSL context mixin."""
         self._ssl_context: ssl.SSLContext | bool | None = None
 
-    def _create_ssl_context_sync(self, cafile: str) -> ssl.SSLContext:
-        """Create SSL context synchronously (for use in executor)."""
-        return ssl.create_default_context(cafile=cafile)
-
     async def _get_ssl_context(self) -> ssl.SSLContext | bool:
         """Get the SSL context for requests."""
         if self._ssl_context is not None:
             return self._ssl_context
 
-        if not self._verify_ssl:
-            self._ssl_context = False
-        elif self._ssl_cert_ca_file:
-            # Run SSL context creation in executor to avoid blocking the event loop
-            loop = asyncio.get_running_loop()
-            self._ssl_context = await loop.run_in_executor(
-                None, self._create_ssl_context_sync, self._ssl_cert_ca_file
+        if self._connection_pool is not None:
+            self._ssl_context = await self._connection_pool.get_ssl_context(
+                self._verify_ssl, self._ssl_cert_ca_file
             )
         else:
-            self._ssl_context = True
+            self._ssl_context = await create_ssl_context(
+                self._verify_ssl, self._ssl_cert_ca_file
+            )
 
         return self._ssl_context
 
+    def _get_client_session(self) -> ClientSession:
+        """Get the aiohttp ClientSession object."""
+        if self._client_session is None:
+            if self._connection_pool is not None:
+                self._client_session = self._connection_pool.get_client_session()
+            else:
+                self._client_session = ConnectionPool().get_client_session()
+                self._close_client_session = True
+
+        return self._client_session
+
 
 class FreeAtHomeSettings(SSLContextMixin):
     """Provides a class for fetching the settings from a ABB free@home SysAP."""
@@ -111,6 +129,7 @@ class FreeAtHomeSettings(SSLContextMixin):
         client_session: ClientSession = None,
         verify_ssl: bool = True,
         ssl_cert_ca_file: str | None = None,
+        connection_pool: ConnectionPool | None = None,
     ) -> None:
         """Initialize the FreeAtHomeSettings class."""
         super().__init__()
@@ -118,6 +137,7 @@ class FreeAtHomeSettings(SSLContextMixin):
         self._client_session: ClientSession = client_session
         self._verify_ssl: bool = verify_ssl
         self._ssl_cert_ca_file: str | None = ssl_cert_ca_file
+        self._connection_pool: ConnectionPool | None = connection_pool
 
     async def __aenter__(self):
         """Async enter and return self."""
@@ -142,7 +162,7 @@ class FreeAtHomeSettings(SSLContextMixin):
                 ) as resp,
             ):
                 _response_status = resp.status
-                _response_json = await resp.json()
+                _response_json = await resp.json(loads=json_loads)
         except AioHttpInvalidUrlClientError as e:
             raise InvalidHostException(self._host) from e
         except AioClientSSLError as e:
@@ -197,18 +217,28 @@ class FreeAtHomeSettings(SSLContextMixin):
         """Get the vesion running on SysAP."""
         return self.get_flag("name")
 
-    def _get_client_session(self) -> ClientSession:
-        """Get the aiohttp ClientSession object."""
-        if self._client_session is None:
-            _tcp_connector = TCPConnector(
-                limit=10,
-                limit_per_host=5,
-                ttl_dns_cache=300,
-            )
-            self._client_session = ClientSession(connector=_tcp_connector)
-            self._close_client_session = True
 
-        return self._client_session
+class DatapointWrite(NamedTuple):
+    """A datapoint value to set in the api."""
+
+    device_serial: str
+    channel_id: str
+    datapoint: str
+    value: str
+
+
+class _CoalescedWrite:
+    """A datapoint value waiting to be sent, replaced by newer values."""
+
+    def __init__(self, value: str) -> None:
+        """Initialize the _CoalescedWrite class."""
+        self.value: str = value
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.awaited: bool = False
+
+    def __repr__(self) -> str:
+        """Return a string representation of the write."""
+        return f"_CoalescedWrite(value={self.value!r})"
 
 
 class FreeAtHomeApi(SSLContextMixin):
@@ -229,6 +259,13 @@ class FreeAtHomeApi(SSLContextMixin):
         verify_ssl: bool = True,
         ssl_cert_ca_file: str | None = None,
         wait_for_result: bool = True,
+        coalesce_writes: bool = False,
+        write_queue_max_size: int = DEFAULT_WRITE_QUEUE_MAX_SIZE,
+        write_queue_workers: int = DEFAULT_WRITE_QUEUE_WORKERS,
+        write_queue_overflow_policy: WriteQueueOverflowPolicy = (
+            WriteQueueOverflowPolicy.block
+        ),
+        connection_pool: ConnectionPool | None = None,
     ) -> None:
         """
         Initialize the FreeAtHomeApi class.
@@ -251,17 +288,30 @@ class FreeAtHomeApi(SSLContextMixin):
                 (True) or use fire-and-forget mode (False). If set to
                 False, relies on websocket for state updates and errors
                 are only logged. Defaults to True.
+            coalesce_writes: Whether to coalesce writes to the same
+                datapoint. While a write is in flight, newer values replace
+                the pending value and only the latest value is sent once
+                the write completes. Defaults to False.
+            write_queue_max_size: The maximum number of fire-and-forget
+                writes waiting to be sent. Defaults to 100.
+            write_queue_workers: The number of fire-and-forget writes sent
+                concurrently. Defaults to 5.
+            write_queue_overflow_policy: What to do when a fire-and-forget
+                write is made while the queue is full. Defaults to block.
+            connection_pool: A connection pool shared with other api
+                instances, e.g. FreeAtHomeSettings, so connections and TLS
+                sessions to the SysAP are reused. The pool is closed by its
+                owner. Defaults to None.
 
         Note:
             When using fire-and-forget mode (i.e.,
-            ``wait_for_result=False``), background tasks may be created
-            to handle API requests. Before closing the API instance, you
-            must ensure that all pending background tasks are properly
-            awaited or cancelled to avoid resource leaks. This can be
-            done by using the API instance as an async context manager
-            (i.e., via ``async with`` which calls ``__aexit__``), or by
-            explicitly calling ``close_client_session()`` before program
-            exit.
+            ``wait_for_result=False``), writes are queued and sent by
+            background workers. Before closing the API instance, the
+            queued writes should be sent by calling ``drain()``. This is
+            done when using the API instance as an async context manager
+            (i.e., via ``async with`` which calls ``__aexit__``). Calling
+            ``close_client_session()`` stops the workers and discards any
+            queued writes.
 
         """
         super().__init__()
@@ -275,8 +325,18 @@ class FreeAtHomeApi(SSLContextMixin):
         self._ws_heartbeat = ws_heartbeat
         self._verify_ssl: bool = verify_ssl
         self._ssl_cert_ca_file: None | str = ssl_cert_ca_file
-        self._background_tasks: set[asyncio.Task] = set()
+        self._connection_pool: ConnectionPool | None = connection_pool
         self._wait_for_result = wait_for_result
+        self._coalesce_writes = coalesce_writes
+        self._coalesced_writes: dict[str, _CoalescedWrite] = {}
+        self._coalesced_keys: set[str] = set()
+        self._write_queue: WriteQueue = WriteQueue(
+            handler=self._set_datapoint_queued,
+            max_size=write_queue_max_size,
+            workers=write_queue_workers,
+            overflow_policy=write_queue_overflow_policy,
+            on_drop=self._set_datapoint_dropped,
+        )
 
     async def __aenter__(self):
         """Async enter and return self."""
@@ -284,11 +344,34 @@ class FreeAtHomeApi(SSLContextMixin):
 
     async def __aexit__(self, *_exc_info: object):
         """Close client session connections."""
+        await self.drain()
         await self.ws_close()
         await self.close_client_session()
 
+    @property
+    def host(self) -> str:
+        """Get the host of the SysAP."""
+        return self._host
+
+    @property
+    def write_queue_metrics(self) -> WriteQueueMetrics:
+        """Get the metrics of the fire-and-forget write queue."""
+        return self._write_queue.metrics
+
+    async def drain(self):
+        """Wait until all fire-and-forget writes are sent."""
+        await self._write_queue.drain()
+
     async def close_client_session(self):
         """Close the client session if created by FreeAtHome."""
+        await self._write_queue.close()
+
+        # The coalesced writes still pending won't be sent anymore
+        for _write in self._coalesced_writes.values():
+            _write.future.cancel()
+        self._coalesced_writes.clear()
+        self._coalesced_keys.clear()
+
         if self._client_session and self._close_client_session:
             await self._client_session.close()
 
@@ -352,51 +435,163 @@ class FreeAtHomeApi(SSLContextMixin):
                 True to wait for the API response before returning.
 
         Returns:
-            bool: True if the request was sent.
+            bool: True if the request was sent or queued.
+
+        Raises:
+            WriteQueueFullException: If the request should be queued, but the
+                queue is full and the overflow policy is raise.
 
         """
         if wait_for_result is None:
             wait_for_result = self._wait_for_result
 
+        if self._coalesce_writes:
+            _write = await self._coalesce_datapoint(
+                device_serial, channel_id, datapoint, value
+            )
+            if wait_for_result:
+                _write.awaited = True
+                # Shield the write, it's shared with callers of superseded values
+                await asyncio.shield(_write.future)
+            return True
+
         if wait_for_result:
             await self._set_datapoint_request(
                 device_serial, channel_id, datapoint, value
             )
             return True
 
-        # We don't want to wait for the api to return our request, instead send the
-        # request off into a background task and rely on the websocket for updates
-        task = asyncio.create_task(
-            self._set_datapoint_background(device_serial, channel_id, datapoint, value),
-            name=f"set_datapoint_{device_serial}_{channel_id}_{datapoint}",
-        )
-        self._background_tasks.add(task)
-        task.add_done_callback(self._set_datapoint_done_callback)
+        # We don't want to wait for the api to return our request, instead queue the
+        # request to be sent in the background and rely on the websocket for updates
+        await self._write_queue.put(device_serial, channel_id, datapoint, value)
         return True
 
-    def _set_datapoint_done_callback(self, task: asyncio.Task) -> None:
-        """Handle cleanup when a background task completes."""
-        self._background_tasks.discard(task)
-        _LOGGER.debug(
-            "Background task '%s' completed and removed from tracking set",
-            task.get_name(),
+    async def set_datapoints(
+        self,
+        writes: Iterable[DatapointWrite | tuple[str, str, str, str]],
+        wait_for_result: bool | None = None,
+    ) -> dict[str, FreeAtHomeException | None]:
+        """
+        Set many datapoints in the API at once.
+
+        The local api only accepts a single datapoint per request, so the writes
+        are sent concurrently through set_datapoint, sharing the connections of
+        the client session. Only the last value of a datapoint is sent.
+
+        Args:
+            writes: The writes as (device_serial, channel_id, datapoint, value).
+            wait_for_result: See set_datapoint.
+
+        Returns:
+            dict: The result per datapoint, keyed by
+                "device_serial.channel_id.datapoint", None if the value was set
+                or queued, otherwise the exception raised.
+
+        """
+        _writes = {
+            f"{_write[0]}.{_write[1]}.{_write[2]}": DatapointWrite(*_write)
+            for _write in writes
+        }
+
+        async def _set_datapoint(write: DatapointWrite) -> FreeAtHomeException | None:
+            try:
+                await self.set_datapoint(*write, wait_for_result=wait_for_result)
+            except FreeAtHomeException as e:
+                _LOGGER.warning("Failed to set datapoint %s: %s", write, e)
+                return e
+
+            return None
+
+        _results = await asyncio.gather(
+            *[_set_datapoint(_write) for _write in _writes.values()]
         )
 
-    async def _set_datapoint_background(
+        return dict(zip(_writes.keys(), _results, strict=True))
+
+    async def _coalesce_datapoint(
         self, device_serial: str, channel_id: str, datapoint: str, value: str
+    ) -> _CoalescedWrite:
+        """Queue a datapoint value, replacing any value not yet sent."""
+        _key = f"{device_serial}.{channel_id}.{datapoint}"
+
+        _write = self._coalesced_writes.get(_key)
+        if _write is not None:
+            _LOGGER.debug("Coalescing write of datapoint %s: %s", _key, value)
+            _write.value = value
+            return _write
+
+        _write = self._coalesced_writes[_key] = _CoalescedWrite(value)
+
+        # A datapoint is queued once, the worker sends the latest pending value
+        if _key not in self._coalesced_keys:
+            self._coalesced_keys.add(_key)
+            try:
+                await self._write_queue.put(device_serial, channel_id, datapoint, None)
+            except WriteQueueFullException:
+                self._coalesced_keys.discard(_key)
+                self._coalesced_writes.pop(_key, None)
+                raise
+
+        return _write
+
+    async def _set_datapoint_queued(
+        self, device_serial: str, channel_id: str, datapoint: str, value: str | None
     ):
-        """Set a specific datapoint in the api in the background."""
-        try:
+        """Send a write from the queue, None sends the coalesced values."""
+        if value is not None:
             await self._set_datapoint_request(
                 device_serial, channel_id, datapoint, value
             )
-        except Exception:  # noqa: BLE001
-            _LOGGER.exception(
-                "Failed to set datapoint %s/%s/%s",
-                device_serial,
-                channel_id,
-                datapoint,
+            return
+
+        _key = f"{device_serial}.{channel_id}.{datapoint}"
+        try:
+            await self._set_datapoint_coalesced(
+                _key, device_serial, channel_id, datapoint
             )
+        finally:
+            self._coalesced_keys.discard(_key)
+
+    def _set_datapoint_dropped(
+        self, device_serial: str, channel_id: str, datapoint: str, value: str | None
+    ):
+        """Fail the coalesced value of a write dropped from the queue."""
+        if value is not None:
+            return
+
+        _key = f"{device_serial}.{channel_id}.{datapoint}"
+        self._coalesced_keys.discard(_key)
+        _write = self._coalesced_writes.pop(_key, None)
+        if _write is not None:
+            _write.future.set_exception(
+                WriteQueueFullException(self._write_queue.max_size)
+            )
+            if not _write.awaited:
+                _write.future.exception()
+
+    async def _set_datapoint_coalesced(
+        self, key: str, device_serial: str, channel_id: str, datapoint: str
+    ):
+        """Send the latest value of a datapoint until no value is pending."""
+        _failure = None
+        while (_write := self._coalesced_writes.pop(key, None)) is not None:
+            try:
+                await self._set_datapoint_request(
+                    device_serial, channel_id, datapoint, _write.value
+                )
+            except Exception as e:  # noqa: BLE001
+                _write.future.set_exception(e)
+
+                # Nobody waits for the result in fire-and-forget mode
+                if not _write.awaited:
+                    _write.future.exception()
+                    _failure = e
+            else:
+                _write.future.set_result(True)
+
+        # Let the queue log and count a write nobody waited for
+        if _failure is not None:
+            raise _failure
 
     async def _set_datapoint_request(
         self, device_serial: str, channel_id: str, datapoint: str, value: str
@@ -423,25 +618,12 @@ class FreeAtHomeApi(SSLContextMixin):
         _response = await self._request(
             path=f"/api/rest/virtualdevice/{self._sysap_uuid}/{serial}",
             method="put",
-            data=json.dumps(data),
+            data=json_dumps(data),
         )
 
         _key, _items = list(_response[self._sysap_uuid]["devices"].items())[0]
         return {serial: _key}
 
-    def _get_client_session(self) -> ClientSession:
-        """Get the ClientSession aiohttp object."""
-        if self._client_session is None:
-            _tcp_connector = TCPConnector(
-                limit=10,
-                limit_per_host=5,
-                ttl_dns_cache=300,
-            )
-            self._client_session = ClientSession(connector=_tcp_connector)
-            self._close_client_session = True
-
-        return self._client_session
-
     def _handle_response_error(
         self, error: AioHttpClientResponseError, data: Any, path: str
     ):
@@ -489,7 +671,7 @@ class FreeAtHomeApi(SSLContextMixin):
                 _response_status = resp.status
                 _response_data = None
                 if resp.content_type == "application/json":
-                    _response_data = await resp.json()
+                    _response_data = await resp.json(loads=json_loads)
                 elif resp.content_type == "text/plain":
                     _response_data = await resp.text()
         except AioHttpInvalidUrlClientError as e:
@@ -503,6 +685,11 @@ class FreeAtHomeApi(SSLContextMixin):
 
         return _response_data
 
+    @property
+    def ws_heartbeat(self) -> int | None:
+        """Get the interval of the websocket heartbeat in seconds."""
+        return self._ws_heartbeat
+
     @property
     def ws_connected(self) -> bool:
         """Returns whether the websocket is connected."""
@@ -541,14 +728,18 @@ class FreeAtHomeApi(SSLContextMixin):
         await self._ws_response.close()
 
     async def ws_listen(
-        self, callback: Callable[[list], None] | None = None, retry_interval: int = 5
+        self,
+        callback: Callable[[WebsocketMessage], None] | None = None,
+        retry_interval: int = 5,
     ):  # pragma: no cover
         """Listen for events on the websocket."""
         while True:
             await self.ws_receive(callback, retry_interval)
 
     async def ws_receive(
-        self, callback: Callable[[list], None] | None = None, retry_interval: int = 5
+        self,
+        callback: Callable[[WebsocketMessage], None] | None = None,
+        retry_interval: int = 5,
     ):
         """Receive an event on the websocket."""
         if not self._ws_response or not self.ws_connected:
@@ -569,18 +760,25 @@ class FreeAtHomeApi(SSLContextMixin):
                 await asyncio.sleep(retry_interval)
                 return
 
+        if await self.ws_read(callback) == WSMsgType.ERROR:
+            await asyncio.sleep(retry_interval)
+
+    async def ws_read(
+        self, callback: Callable[[WebsocketMessage], None] | None = None
+    ) -> WSMsgType:
+        """Read a single frame from the connected websocket, returns its type."""
         data = await self._ws_response.receive()
         if data.type == WSMsgType.TEXT:
-            _ws_data = data.json().get(self._sysap_uuid)
+            _ws_data = data.json(loads=json_loads).get(self._sysap_uuid)
 
             _LOGGER.debug("Websocket Response: %s", _ws_data)
+            _ws_message = WebsocketMessage.from_data(_ws_data)
             if callback and inspect.iscoroutinefunction(callback):
-                await callback(_ws_data)
+                await callback(_ws_message)
             elif callback:
-                callback(_ws_data)
+                callback(_ws_message)
         elif data.type == WSMsgType.ERROR:
             _LOGGER.error("Websocket Response Error. Data: %s", data)
-            await asyncio.sleep(retry_interval)
         elif data.type in (
             WSMsgType.CLOSE,
             WSMsgType.CLOSED,
@@ -588,6 +786,8 @@ class FreeAtHomeApi(SSLContextMixin):
         ):
             _LOGGER.warning("Websocket Connection Closed.")
 
+        return data.type
+
     @staticmethod
     def _encode_basic_auth(login: str, password: str) -> str:
         """Encode basic authentication across supported aiohttp versions."""
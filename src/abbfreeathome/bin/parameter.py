@@ -6,6 +6,7 @@ Converted With: https://github.com/nitzano/enum-converter?tab=readme-ov-file
 """
 
 import enum  # pragma: no cover
+from typing import Any
 
 
 class Parameter(enum.Enum):  # pragma: no cover
@@ -305,3 +306,22 @@ class Parameter(enum.Enum):  # pragma: no cover
     PID_FORCE_MODE_AUTONOMOUS_SWITCH_OFF_TIME_DURATION = 392
     PID_LOW_ENERGY_DEVICE_CHANNEL_SELECTOR = 393
     PID_LOW_ENERGY_DEVICE_ADDRESS = 394
+
+
+def build_parameter_index(parameters: dict[str, Any]) -> dict[int, tuple[str, Any]]:
+    """
+    Build an index of parameters keyed by their integer parameter id.
+
+    The raw parameter ids (e.g. "par00f5") are parsed once, so lookups by
+    Parameter value don't need to parse or scan the parameters again.
+    """
+    _index = {}
+    for _parameter_id, _parameter_value in parameters.items():
+        try:
+            _parameter_id_int = int(_parameter_id.lstrip("par"), 16)
+        except ValueError:
+            continue
+
+        _index.setdefault(_parameter_id_int, (_parameter_id, _parameter_value))
+
+    return _index
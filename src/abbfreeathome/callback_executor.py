@@ -0,0 +1,147 @@
+"""ABB-Free@Home executor isolating channel callbacks from each other."""
+
+import asyncio
+from collections.abc import Callable
+import inspect
+import logging
+from typing import Any
+
+# Callback Executor Configuration
+DEFAULT_CALLBACK_MAX_CONCURRENCY = 10
+DEFAULT_CALLBACK_MAX_PENDING = 1000
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CallbackExecutorMetrics:
+    """Provides metrics of a callback executor."""
+
+    def __init__(self, tasks: set[asyncio.Task]) -> None:
+        """Initialize the CallbackExecutorMetrics class."""
+        self._tasks: set[asyncio.Task] = tasks
+        self._completed: int = 0
+        self._dropped: int = 0
+        self._failures: dict[Callable[..., Any], int] = {}
+
+    @property
+    def pending(self) -> int:
+        """Get the number of coroutine callbacks scheduled or running."""
+        return len(self._tasks)
+
+    @property
+    def completed(self) -> int:
+        """Get the number of callbacks which completed successfully."""
+        return self._completed
+
+    @property
+    def failed(self) -> int:
+        """Get the number of callbacks which raised an exception."""
+        return sum(self._failures.values())
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of coroutine callbacks dropped while too many pending."""
+        return self._dropped
+
+    @property
+    def failures(self) -> dict[Callable[..., Any], int]:
+        """Get the number of exceptions raised, by callback."""
+        return dict(self._failures)
+
+    def record_completed(self):
+        """Record a callback which completed successfully."""
+        self._completed += 1
+
+    def record_failed(self, callback: Callable[..., Any]):
+        """Record a callback which raised an exception."""
+        self._failures[callback] = self._failures.get(callback, 0) + 1
+
+    def record_dropped(self):
+        """Record a dropped coroutine callback."""
+        self._dropped += 1
+
+    def __repr__(self) -> str:
+        """Return a string representation of the metrics."""
+        return (
+            f"CallbackExecutorMetrics(pending={self.pending}, "
+            f"completed={self.completed}, failed={self.failed}, "
+            f"dropped={self.dropped})"
+        )
+
+
+class CallbackExecutor:
+    """Runs channel callbacks, so a failing or slow callback can't affect others."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_CALLBACK_MAX_CONCURRENCY,
+        max_pending: int = DEFAULT_CALLBACK_MAX_PENDING,
+    ) -> None:
+        """
+        Initialize the CallbackExecutor class.
+
+        Args:
+            max_concurrency: The maximum number of coroutine callbacks running
+                at the same time.
+            max_pending: The maximum number of coroutine callbacks scheduled or
+                running, further callbacks are dropped.
+
+        """
+        self._max_pending: int = max_pending
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        self._tasks: set[asyncio.Task] = set()
+        self._metrics: CallbackExecutorMetrics = CallbackExecutorMetrics(self._tasks)
+
+    @property
+    def metrics(self) -> CallbackExecutorMetrics:
+        """Get the metrics of the executor."""
+        return self._metrics
+
+    def submit(self, callback: Callable[..., Any], *args: Any):
+        """
+        Run a callback with the arguments.
+
+        Coroutine functions are scheduled as a task, other callbacks are called
+        right away. Exceptions are logged and counted per callback.
+        """
+        if not inspect.iscoroutinefunction(callback):
+            try:
+                callback(*args)
+            except Exception:  # noqa: BLE001
+                self._metrics.record_failed(callback)
+                _LOGGER.exception("Callback %s failed", callback)
+            else:
+                self._metrics.record_completed()
+            return
+
+        if len(self._tasks) >= self._max_pending:
+            self._metrics.record_dropped()
+            _LOGGER.warning("Too many pending callbacks, dropped: %s", callback)
+            return
+
+        _task = asyncio.create_task(self._run(callback, *args))
+        self._tasks.add(_task)
+        _task.add_done_callback(self._tasks.discard)
+
+    async def drain(self):
+        """Wait until all scheduled coroutine callbacks completed."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def close(self):
+        """Cancel all scheduled coroutine callbacks."""
+        for _task in self._tasks:
+            _task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(self, callback: Callable[..., Any], *args: Any):
+        """Await a coroutine callback within the concurrency limit."""
+        async with self._semaphore:
+            try:
+                await callback(*args)
+            except Exception:  # noqa: BLE001
+                self._metrics.record_failed(callback)
+                _LOGGER.exception("Callback %s failed", callback)
+            else:
+                self._metrics.record_completed()
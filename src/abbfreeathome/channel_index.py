@@ -0,0 +1,95 @@
+"""ABB-Free@Home secondary indexes of the loaded channels."""
+
+from typing import TYPE_CHECKING
+
+from .bin.interface import Interface
+from .channels.base import Base
+
+if TYPE_CHECKING:
+    from .device import Device
+
+
+class ChannelIndex:
+    """
+    Indexes channel serials by device, class and interface.
+
+    The channels are indexed by the class they are loaded as, so channels not
+    created yet, e.g. lazy channels, are indexed without creating them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the ChannelIndex class."""
+        self._by_device: dict[str, dict[str, type[Base]]] = {}
+        self._by_class: dict[type[Base], dict[str, type[Base]]] = {}
+        self._by_interface: dict[Interface, dict[str, type[Base]]] = {}
+        self._channels: dict[str, tuple[str, type[Base], Interface]] = {}
+
+    def add(self, channel_serial: str, device: "Device", channel_class: type[Base]):
+        """Add a channel of a device to the indexes."""
+        self.remove(channel_serial)
+
+        self._channels[channel_serial] = (
+            device.device_serial,
+            channel_class,
+            device.interface,
+        )
+        self._by_device.setdefault(device.device_serial, {})[channel_serial] = (
+            channel_class
+        )
+        self._by_class.setdefault(channel_class, {})[channel_serial] = channel_class
+        self._by_interface.setdefault(device.interface, {})[channel_serial] = (
+            channel_class
+        )
+
+    def remove(self, channel_serial: str):
+        """Remove a channel from the indexes."""
+        _entry = self._channels.pop(channel_serial, None)
+        if _entry is None:
+            return
+
+        _device_serial, _channel_class, _interface = _entry
+        self._discard(self._by_device, _device_serial, channel_serial)
+        self._discard(self._by_class, _channel_class, channel_serial)
+        self._discard(self._by_interface, _interface, channel_serial)
+
+    def clear(self):
+        """Clear all indexes."""
+        self._by_device.clear()
+        self._by_class.clear()
+        self._by_interface.clear()
+        self._channels.clear()
+
+    def get_by_device(self, device_serial: str) -> list[str]:
+        """Get the serials of the channels of a device."""
+        return list(self._by_device.get(device_serial, {}))
+
+    def get_by_class(
+        self, channel_class: type[Base], include_subclasses: bool = False
+    ) -> list[str]:
+        """Get the serials of the channels of a class, optionally its subclasses."""
+        if not include_subclasses:
+            return list(self._by_class.get(channel_class, {}))
+
+        return [
+            _channel_serial
+            for _class, _channels in self._by_class.items()
+            if issubclass(_class, channel_class)
+            for _channel_serial in _channels
+        ]
+
+    def get_by_interface(self, interface: Interface) -> list[str]:
+        """Get the serials of the channels of devices with an interface."""
+        return list(self._by_interface.get(interface, {}))
+
+    @staticmethod
+    def _discard(
+        index: dict[object, dict[str, type[Base]]], key: object, channel_serial: str
+    ):
+        """Remove a channel from a single index, dropping empty entries."""
+        _channels = index.get(key)
+        if _channels is None:
+            return
+
+        _channels.pop(channel_serial, None)
+        if not _channels:
+            del index[key]
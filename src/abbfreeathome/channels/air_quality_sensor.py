@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -12,21 +12,6 @@ if TYPE_CHECKING:
 class AirQualitySensor(Base):
     """Free@Home AirQualitySensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_INFO_CO_2,
-        Pairing.AL_CO2_ALERT,
-        Pairing.AL_INFO_VOC_INDEX,
-        Pairing.AL_VOC_ALERT,
-        Pairing.AL_HUMIDITY,
-    ]
-    _callback_attributes: list[str] = [
-        "co2",
-        "co2_alert",
-        "voc_index",
-        "voc_alert",
-        "humidity",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -81,28 +66,27 @@ class AirQualitySensor(Base):
         """Get the humidity percentage."""
         return self._humidity
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        pairing_id = datapoint.get("pairingID")
-        value = datapoint.get("value")
-
-        if pairing_id == Pairing.AL_INFO_CO_2.value:
-            self._co2 = float(value)
-            return "co2"
-        if pairing_id == Pairing.AL_CO2_ALERT.value:
-            self._co2_alert = value == "1"
-            return "co2_alert"
-        if pairing_id == Pairing.AL_INFO_VOC_INDEX.value:
-            self._voc_index = int(value)
-            return "voc_index"
-        if pairing_id == Pairing.AL_VOC_ALERT.value:
-            self._voc_alert = value == "1"
-            return "voc_alert"
-        if pairing_id == Pairing.AL_HUMIDITY.value:
-            self._humidity = int(value)
-            return "humidity"
-        return None
+    @datapoint_handler(Pairing.AL_INFO_CO_2, "co2")
+    def _refresh_co2(self, value: str):
+        """Refresh the CO2 concentration from a datapoint value."""
+        self._co2 = float(value)
+
+    @datapoint_handler(Pairing.AL_CO2_ALERT, "co2_alert")
+    def _refresh_co2_alert(self, value: str):
+        """Refresh the CO2 alert status from a datapoint value."""
+        self._co2_alert = value == "1"
+
+    @datapoint_handler(Pairing.AL_INFO_VOC_INDEX, "voc_index")
+    def _refresh_voc_index(self, value: str):
+        """Refresh the VOC index from a datapoint value."""
+        self._voc_index = int(value)
+
+    @datapoint_handler(Pairing.AL_VOC_ALERT, "voc_alert")
+    def _refresh_voc_alert(self, value: str):
+        """Refresh the VOC alert status from a datapoint value."""
+        self._voc_alert = value == "1"
+
+    @datapoint_handler(Pairing.AL_HUMIDITY, "humidity")
+    def _refresh_humidity(self, value: str):
+        """Refresh the humidity percentage from a datapoint value."""
+        self._humidity = int(value)
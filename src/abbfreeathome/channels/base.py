@@ -1,11 +1,13 @@
 """Free@Home Base Class."""
 
 from collections.abc import Callable
+from functools import partial
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from ..bin.pairing import Pairing
-from ..bin.parameter import Parameter
+from ..bin.parameter import Parameter, build_parameter_index
+from ..debounce import CallbackDebouncer
 from ..exceptions import (
     InvalidDeviceChannelPairing,
     InvalidDeviceChannelParameter,
@@ -13,17 +15,90 @@ from ..exceptions import (
 )
 
 if TYPE_CHECKING:
+    from ..callback_executor import CallbackExecutor
     from ..device import Device
 
 _LOGGER = logging.getLogger(__name__)
 
+_DATAPOINT_HANDLER_ATTRIBUTE = "_datapoint_handler"
+
+
+def datapoint_handler(
+    pairing: Pairing,
+    callback_attribute: str,
+    refresh_from: Literal["outputs", "inputs"] | None = "outputs",
+) -> Callable[[Callable], Callable]:
+    """
+    Declare a channel method as the handler for a pairing id.
+
+    The handler is called with the datapoint value and may return False when
+    the datapoint did not change the channel state, which skips the callbacks.
+
+    Args:
+        pairing: The pairing handled by the method.
+        callback_attribute: The attribute callbacks are triggered for.
+        refresh_from: Whether refresh_state fetches the pairing from the
+            channel outputs, the inputs, or not at all (None).
+
+    """
+
+    def decorator(func: Callable) -> Callable:
+        setattr(
+            func,
+            _DATAPOINT_HANDLER_ATTRIBUTE,
+            (pairing, callback_attribute, refresh_from),
+        )
+        return func
+
+    return decorator
+
 
 class Base:
     """Free@Home Base Class."""
 
+    # Derived from the datapoint handlers of each channel class
+    _pairing_handlers: dict[int, tuple[str, Callable[["Base", Any], bool | None]]] = {}
     _state_refresh_pairings: list[Pairing] = []
+    _input_state_refresh_pairings: list[Pairing] = []
     _callback_attributes: list[str] = []
 
+    _update_from_inputs: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Resolve the datapoint handlers of the channel class into a table."""
+        super().__init_subclass__(**kwargs)
+
+        # Walk the classes subclass first, so the handlers of a subclass come first
+        # and take precedence over handlers of a parent for the same pairing id
+        _handlers = {}
+        for _class in cls.__mro__:
+            for _name, _attribute in vars(_class).items():
+                _spec = getattr(_attribute, _DATAPOINT_HANDLER_ATTRIBUTE, None)
+
+                # Skip non-handlers and handlers overridden by a subclass
+                if _spec is None or getattr(cls, _name) is not _attribute:
+                    continue
+
+                _handlers.setdefault(_spec[0].value, (_spec, _attribute))
+
+        cls._pairing_handlers = {
+            _pairing_id: (_spec[1], _handler)
+            for _pairing_id, (_spec, _handler) in _handlers.items()
+        }
+
+        # A class may declare the order its pairings are refreshed in explicitly
+        if "_state_refresh_pairings" not in vars(cls):
+            cls._state_refresh_pairings = [
+                _spec[0] for _spec, _ in _handlers.values() if _spec[2] == "outputs"
+            ]
+        if "_input_state_refresh_pairings" not in vars(cls):
+            cls._input_state_refresh_pairings = [
+                _spec[0] for _spec, _ in _handlers.values() if _spec[2] == "inputs"
+            ]
+        cls._callback_attributes = list(
+            dict.fromkeys(_spec[1] for _spec, _ in _handlers.values())
+        )
+
     def __init__(
         self,
         device: "Device",
@@ -45,10 +120,45 @@ class Base:
         self._floor_name = floor_name
         self._room_name = room_name
         self._callbacks = {}
+        self._callback_debouncers: dict[str, CallbackDebouncer] = {}
+        self._callback_executor: CallbackExecutor | None = None
+        self._event_listener: Callable[[Base, str], None] | None = None
+
+        # Index the inputs and outputs by pairing id. The index holds references to
+        # the datapoint dicts, so values updated in place are always current.
+        self._input_pairings = self._build_pairing_index(inputs)
+        self._output_pairings = self._build_pairing_index(outputs)
+        self._parameter_index = build_parameter_index(parameters)
 
         # Set the initial state of the channel
         self._refresh_state_from_datapoints()
 
+    @property
+    def callback_attributes(self) -> list[str]:
+        """Get the attributes callbacks can be registered for."""
+        return self._callback_attributes
+
+    @classmethod
+    def get_callback_attributes(cls) -> list[str]:
+        """Get the attributes callbacks can be registered for, by channel class."""
+        return cls._callback_attributes
+
+    @classmethod
+    def get_update_datapoints_from_data(
+        cls, channel_data: dict[str, Any]
+    ) -> dict[str, dict[str, Any]]:
+        """Get the datapoints of channel data, by io id, updated from the websocket."""
+        if cls._update_from_inputs:
+            return {**channel_data.get("outputs", {}), **channel_data.get("inputs", {})}
+        return channel_data.get("outputs", {})
+
+    @property
+    def refresh_request_count(self) -> int:
+        """Get the number of api requests sent by refresh_state."""
+        return len(self._state_refresh_pairings) + len(
+            self._input_state_refresh_pairings
+        )
+
     @property
     def device_serial(self) -> str:
         """Get the device serial."""
@@ -96,70 +206,202 @@ class Base:
 
     def get_input_by_pairing(self, pairing: Pairing) -> tuple[str, Any]:
         """Get the channel input by pairing id."""
-        for _input_id, _input in self._inputs.items():
-            if _input.get("pairingID") == pairing.value:
-                return _input_id, _input.get("value")
+        try:
+            _input_id, _input = self._input_pairings[pairing.value]
+        except KeyError:
+            raise InvalidDeviceChannelPairing(
+                self.device_serial, self.channel_id, pairing.value
+            ) from None
 
-        raise InvalidDeviceChannelPairing(
-            self.device_serial, self.channel_id, pairing.value
-        )
+        return _input_id, _input.get("value")
 
     def get_output_by_pairing(self, pairing: Pairing) -> tuple[str, Any]:
         """Get the channel output by pairing id."""
-        for _output_id, _output in self._outputs.items():
-            if _output.get("pairingID") == pairing.value:
-                return _output_id, _output.get("value")
+        try:
+            _output_id, _output = self._output_pairings[pairing.value]
+        except KeyError:
+            raise InvalidDeviceChannelPairing(
+                self.device_serial, self.channel_id, pairing.value
+            ) from None
 
-        raise InvalidDeviceChannelPairing(
-            self.device_serial, self.channel_id, pairing.value
-        )
+        return _output_id, _output.get("value")
 
     def get_channel_parameter(self, parameter: Parameter) -> tuple[str, Any]:
         """Get the channel parameter value by its name."""
-        for _parameter_id, _parameter_value in self._parameters.items():
-            _parameter_id_int = int(_parameter_id.lstrip("par"), 16)
-            if _parameter_id_int == parameter.value:
-                return _parameter_id, _parameter_value
-
-        raise InvalidDeviceChannelParameter(
-            self.device_serial, self.channel_id, parameter.name
-        )
+        try:
+            return self._parameter_index[parameter.value]
+        except KeyError:
+            raise InvalidDeviceChannelParameter(
+                self.device_serial, self.channel_id, parameter.name
+            ) from None
+
+    def get_update_datapoints(self) -> dict[str, dict[str, Any]]:
+        """Get the datapoints, by io id, which are updated from the websocket."""
+        if self._update_from_inputs:
+            return {**self._outputs, **self._inputs}
+        return self._outputs
 
     def update_channel(self, datapoint_key: str, datapoint_value: str):
         """Update the channel state."""
+        _io_key = datapoint_key.rsplit("/", maxsplit=1)[-1]
+        _datapoint = self._outputs.get(_io_key)
+
+        if _datapoint is None and self._update_from_inputs:
+            _datapoint = self._inputs.get(_io_key)
+
+        if _datapoint is None:
+            return
+
+        self.update_datapoint(datapoint_key, _datapoint, datapoint_value)
+
+    def update_datapoint(
+        self, datapoint_key: str, datapoint: dict[str, Any], datapoint_value: str
+    ):
+        """Update the channel state from an already resolved datapoint."""
         _LOGGER.info(
             "%s received updated data: %s: %s",
             self.channel_name,
             datapoint_key,
             datapoint_value,
         )
-        _callback_attribute = None
-        _io_key = datapoint_key.rsplit("/", maxsplit=1)[-1]
-
-        if _io_key in self._outputs:
-            self._outputs[_io_key]["value"] = datapoint_value
-            _callback_attribute = self._refresh_state_from_datapoint(
-                datapoint=self._outputs[_io_key]
+        datapoint["value"] = datapoint_value
+        _callback_attribute = self._refresh_state_from_datapoint(datapoint=datapoint)
+
+        if _callback_attribute:
+            self.run_callbacks(_callback_attribute)
+
+    def refresh_state_from_data(self, channel_data: dict[str, Any]):
+        """
+        Refresh the state of the channel from channel data of the api.
+
+        The channel data is a channel entry of a configuration or device response.
+        Changed datapoint values are applied through the regular update path.
+        """
+        _datapoints = {
+            **channel_data.get("inputs", {}),
+            **channel_data.get("outputs", {}),
+        }
+
+        for _io_id, _datapoint in self.get_update_datapoints().items():
+            _value = _datapoints.get(_io_id, {}).get("value")
+            if _value is None or _value == _datapoint.get("value"):
+                continue
+
+            self.update_datapoint(
+                f"{self.device_serial}/{self.channel_id}/{_io_id}", _datapoint, _value
             )
 
-        if _callback_attribute and self._callbacks[_callback_attribute]:
-            for callback in self._callbacks[_callback_attribute]:
-                callback()
+    def update_configuration(
+        self,
+        channel_name: str,
+        inputs: dict[str, dict[str, Any]],
+        outputs: dict[str, dict[str, Any]],
+        parameters: dict[str, dict[str, Any]],
+        floor_name: str | None = None,
+        room_name: str | None = None,
+    ):
+        """
+        Update the channel in place from changed configuration data.
+
+        Registered callbacks are kept and called for the datapoints, which are
+        updated from the websocket, whose value changed.
+        """
+        _old_values = {
+            _io_id: _datapoint.get("value")
+            for _io_id, _datapoint in self.get_update_datapoints().items()
+        }
+
+        self._channel_name = channel_name
+        self._inputs = inputs
+        self._outputs = outputs
+        self._parameters = parameters
+        self._floor_name = floor_name
+        self._room_name = room_name
+        self._input_pairings = self._build_pairing_index(inputs)
+        self._output_pairings = self._build_pairing_index(outputs)
+        self._parameter_index = build_parameter_index(parameters)
+        self._refresh_state_from_datapoints()
+
+        _callback_attributes = set()
+        for _io_id, _datapoint in self.get_update_datapoints().items():
+            if _datapoint.get("value") == _old_values.get(_io_id):
+                continue
+
+            _callback_attribute = self._refresh_state_from_datapoint(_datapoint)
+            if _callback_attribute:
+                _callback_attributes.add(_callback_attribute)
+
+        for _callback_attribute in _callback_attributes:
+            self.run_callbacks(_callback_attribute)
+
+    def get_callback_attribute_values(self) -> dict[str, Any]:
+        """Get the current value of every attribute callbacks can be registered for."""
+        return {
+            _callback_attribute: getattr(self, _callback_attribute, None)
+            for _callback_attribute in self._callback_attributes
+        }
+
+    def run_callbacks(self, callback_attribute: str):
+        """Call the callbacks registered for an attribute, unless debounced."""
+        _debouncer = self._callback_debouncers.get(callback_attribute)
+        if _debouncer is not None:
+            _debouncer.trigger()
+        else:
+            self._call_callbacks(callback_attribute)
 
     def register_callback(
         self, callback_attribute: str, callback: Callable[[], None]
     ) -> None:
         """Register callback, called when channel changes state."""
-        if callback_attribute in self._callback_attributes:
-            if callback_attribute not in self._callbacks:
-                self._callbacks[callback_attribute] = set()
-
-            self._callbacks[callback_attribute].add(callback)
+        self._validate_callback_attribute(callback_attribute)
+
+        if callback_attribute not in self._callbacks:
+            self._callbacks[callback_attribute] = set()
+
+        self._callbacks[callback_attribute].add(callback)
+
+    def set_callback_executor(self, executor: "CallbackExecutor | None"):
+        """
+        Set the executor running the callbacks of the channel.
+
+        With an executor coroutine functions can be registered as callbacks, and an
+        exception raised by one callback does not stop the others. Without one the
+        callbacks are called directly.
+        """
+        self._callback_executor = executor
+
+    def set_event_listener(self, listener: "Callable[[Base, str], None] | None"):
+        """Set the listener called with the channel and attribute of every change."""
+        self._event_listener = listener
+
+    def set_callback_debounce(
+        self, interval: float | None, callback_attribute: str | None = None
+    ):
+        """
+        Limit the rate the callbacks of an attribute are called at.
+
+        The callbacks are called at most once per interval in seconds, updates within
+        the interval are collapsed into a single call at its end, which sees the
+        latest state. Without a callback attribute the interval applies to every
+        attribute of the channel, an interval of None removes the limit.
+        """
+        if callback_attribute is None:
+            _callback_attributes = self._callback_attributes
         else:
-            raise UnknownCallbackAttributeException(
-                unknown_attribute=callback_attribute,
-                known_attributes=",".join(self._callback_attributes),
-            )
+            self._validate_callback_attribute(callback_attribute)
+            _callback_attributes = [callback_attribute]
+
+        for _callback_attribute in _callback_attributes:
+            _debouncer = self._callback_debouncers.pop(_callback_attribute, None)
+            if _debouncer is not None:
+                # Deliver the latest state of a collapsed burst
+                _debouncer.flush()
+
+            if interval:
+                self._callback_debouncers[_callback_attribute] = CallbackDebouncer(
+                    callback=partial(self._call_callbacks, _callback_attribute),
+                    interval=interval,
+                )
 
     def remove_callback(
         self, callback_attribute: str, callback: Callable[[], None]
@@ -174,29 +416,84 @@ class Base:
             _datapoint_id, _datapoint_value = self.get_output_by_pairing(
                 pairing=_pairing
             )
+            await self._refresh_state_from_api(_pairing, _datapoint_id)
 
-            _datapoint = (
-                await self.device.api.get_datapoint(
-                    device_serial=self.device_serial,
-                    channel_id=self.channel_id,
-                    datapoint=_datapoint_id,
-                )
-            )[0]
+        for _pairing in self._input_state_refresh_pairings:
+            _datapoint_id, _datapoint_value = self.get_input_by_pairing(
+                pairing=_pairing
+            )
+            await self._refresh_state_from_api(_pairing, _datapoint_id)
+
+    async def _refresh_state_from_api(self, pairing: Pairing, datapoint_id: str):
+        """Refresh the state of the channel from a single datapoint in the api."""
+        _datapoint = (
+            await self.device.api.get_datapoint(
+                device_serial=self.device_serial,
+                channel_id=self.channel_id,
+                datapoint=datapoint_id,
+            )
+        )[0]
+
+        self._refresh_state_from_datapoint(
+            datapoint={
+                "pairingID": pairing.value,
+                "value": _datapoint,
+            }
+        )
+
+    def _call_callbacks(self, callback_attribute: str):
+        """Call the callbacks registered for an attribute right away."""
+        _executor = self._callback_executor
+        for callback in list(self._callbacks.get(callback_attribute, ())):
+            if _executor is not None:
+                _executor.submit(callback)
+            else:
+                callback()
+
+        if self._event_listener is not None:
+            self._event_listener(self, callback_attribute)
 
-            self._refresh_state_from_datapoint(
-                datapoint={
-                    "pairingID": _pairing.value,
-                    "value": _datapoint,
-                }
+    def _validate_callback_attribute(self, callback_attribute: str):
+        """Raise an exception if callbacks can't be registered for the attribute."""
+        if callback_attribute not in self._callback_attributes:
+            raise UnknownCallbackAttributeException(
+                unknown_attribute=callback_attribute,
+                known_attributes=",".join(self._callback_attributes),
             )
 
+    @staticmethod
+    def _build_pairing_index(
+        datapoints: dict[str, dict[str, Any]],
+    ) -> dict[int, tuple[str, dict[str, Any]]]:
+        """Build a pairing id index, keeping the first datapoint per pairing id."""
+        _index = {}
+        for _datapoint_id, _datapoint in datapoints.items():
+            _index.setdefault(_datapoint.get("pairingID"), (_datapoint_id, _datapoint))
+
+        return _index
+
     def _refresh_state_from_datapoints(self):
         """Refresh the state of the channel from the datapoints."""
         for _datapoint in self._outputs.values():
             self._refresh_state_from_datapoint(_datapoint)
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """Refresh the state of the channel from a single datapoint."""
+    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str | None:
+        """
+        Refresh the state of the channel from a single datapoint.
+
+        This will return the name of the attribute, which was refreshed or None.
+        """
+        try:
+            _callback_attribute, _handler = self._pairing_handlers[
+                datapoint.get("pairingID")
+            ]
+        except KeyError:
+            return None
+
+        if _handler(self, datapoint.get("value")) is False:
+            return None
+
+        return _callback_attribute
 
     def __repr__(self) -> str:
         """Return a string representation of the channel."""
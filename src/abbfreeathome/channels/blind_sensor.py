@@ -4,7 +4,7 @@ import enum
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -23,14 +23,6 @@ class BlindSensorState(enum.Enum):
 class BlindSensor(Base):
     """Free@Home BlindSensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_MOVE_UP_DOWN,
-        Pairing.AL_STOP_STEP_UP_DOWN,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -73,43 +65,40 @@ class BlindSensor(Base):
         """Get the move state property."""
         return self._move_state.name
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    @datapoint_handler(Pairing.AL_MOVE_UP_DOWN, "state")
+    def _refresh_move_state(self, value: str):
+        """
+        Refresh the move state from a datapoint value.
+
+        Moves sunblind up (0) and down (1)
+
+        0 means up was pressed
+        1 means down was pressed
         """
-        Refresh the state of the channel from a given output.
+        if value == "0":
+            self._move_state = BlindSensorState.move_up
+        elif value == "1":
+            self._move_state = BlindSensorState.move_down
+        else:
+            self._move_state = BlindSensorState.unknown
+
+        self._state = self._move_state
+
+    @datapoint_handler(Pairing.AL_STOP_STEP_UP_DOWN, "state")
+    def _refresh_step_state(self, value: str):
+        """
+        Refresh the step state from a datapoint value.
+
+        Stops the sunblind and to step it up/down
 
-        This will return the name of the attribute, which was refreshed or None.
+        0 means up was pressed
+        1 means down was pressed
         """
-        if datapoint.get("pairingID") == Pairing.AL_STOP_STEP_UP_DOWN.value:
-            """
-            Stops the sunblind and to step it up/down
-
-            0 means up was pressed
-            1 means down was pressed
-            """
-            if datapoint.get("value") == "0":
-                self._step_state = BlindSensorState.step_up
-            elif datapoint.get("value") == "1":
-                self._step_state = BlindSensorState.step_down
-            else:
-                self._step_state = BlindSensorState.unknown
-
-            self._state = self._step_state
-            return "state"
-
-        if datapoint.get("pairingID") == Pairing.AL_MOVE_UP_DOWN.value:
-            """
-            Moves sunblind up (0) and down (1)
-
-            0 means up was pressed
-            1 means down was pressed
-            """
-            if datapoint.get("value") == "0":
-                self._move_state = BlindSensorState.move_up
-            elif datapoint.get("value") == "1":
-                self._move_state = BlindSensorState.move_down
-            else:
-                self._move_state = BlindSensorState.unknown
-
-            self._state = self._move_state
-            return "state"
-        return None
+        if value == "0":
+            self._step_state = BlindSensorState.step_up
+        elif value == "1":
+            self._step_state = BlindSensorState.step_down
+        else:
+            self._step_state = BlindSensorState.unknown
+
+        self._state = self._step_state
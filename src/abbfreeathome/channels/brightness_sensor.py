@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -12,15 +12,6 @@ if TYPE_CHECKING:
 class BrightnessSensor(Base):
     """Free@Home BrightnessSensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_BRIGHTNESS_LEVEL,
-        Pairing.AL_BRIGHTNESS_ALARM,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-        "alarm",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -57,16 +48,12 @@ class BrightnessSensor(Base):
         """Get the alarm state of the sensor."""
         return self._alarm
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
+    @datapoint_handler(Pairing.AL_BRIGHTNESS_LEVEL, "state")
+    def _refresh_brightness_level(self, value: str):
+        """Refresh the brightness level from a datapoint value."""
+        self._state = float(value)
 
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_BRIGHTNESS_LEVEL.value:
-            self._state = float(datapoint.get("value"))
-            return "state"
-        if datapoint.get("pairingID") == Pairing.AL_BRIGHTNESS_ALARM.value:
-            self._alarm = datapoint.get("value") == "1"
-            return "alarm"
-        return None
+    @datapoint_handler(Pairing.AL_BRIGHTNESS_ALARM, "alarm")
+    def _refresh_alarm(self, value: str):
+        """Refresh the brightness alarm from a datapoint value."""
+        self._alarm = value == "1"
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -12,13 +12,6 @@ if TYPE_CHECKING:
 class CarbonMonoxideSensor(Base):
     """Free@Home CarbonMonoxideSensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_CO_ALARM_ACTIVE,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -49,13 +42,7 @@ class CarbonMonoxideSensor(Base):
         """Get the state of the sensor."""
         return self._state
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_CO_ALARM_ACTIVE.value:
-            self._state = datapoint.get("value") == "1"
-            return "state"
-        return None
+    @datapoint_handler(Pairing.AL_CO_ALARM_ACTIVE, "state")
+    def _refresh_alarm(self, value: str):
+        """Refresh the carbon monoxide alarm from a datapoint value."""
+        self._state = value == "1"
@@ -4,7 +4,7 @@ import enum
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -32,17 +32,6 @@ class CoverActuatorState(enum.Enum):
 class CoverActuator(Base):
     """Free@Home CoverActuator Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_INFO_MOVE_UP_DOWN,
-        Pairing.AL_CURRENT_ABSOLUTE_POSITION_BLINDS_PERCENTAGE,
-        Pairing.AL_INFO_FORCE,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-        "forced_position",
-        "position",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -131,33 +120,28 @@ class CoverActuator(Base):
         await self._set_position_datapoint(str(value))
         self._position = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return whether the state was refreshed as a boolean value.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_INFO_MOVE_UP_DOWN.value:
-            try:
-                self._state = CoverActuatorState(datapoint.get("value"))
-            except ValueError:
-                self._state = CoverActuatorState.unknown
-            return "state"
-        if datapoint.get("pairingID") == Pairing.AL_INFO_FORCE.value:
-            try:
-                self._forced_position = CoverActuatorForcedPosition(
-                    datapoint.get("value")
-                )
-            except ValueError:
-                self._forced_position = CoverActuatorForcedPosition.unknown
-            return "forced_position"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_CURRENT_ABSOLUTE_POSITION_BLINDS_PERCENTAGE.value
-        ):
-            self._position = int(float(datapoint.get("value")))
-            return "position"
-        return None
+    @datapoint_handler(Pairing.AL_INFO_MOVE_UP_DOWN, "state")
+    def _refresh_move_up_down(self, value: str):
+        """Refresh the moving state from a datapoint value."""
+        try:
+            self._state = CoverActuatorState(value)
+        except ValueError:
+            self._state = CoverActuatorState.unknown
+
+    @datapoint_handler(
+        Pairing.AL_CURRENT_ABSOLUTE_POSITION_BLINDS_PERCENTAGE, "position"
+    )
+    def _refresh_position(self, value: str):
+        """Refresh the position from a datapoint value."""
+        self._position = int(float(value))
+
+    @datapoint_handler(Pairing.AL_INFO_FORCE, "forced_position")
+    def _refresh_forced_position(self, value: str):
+        """Refresh the forced position from a datapoint value."""
+        try:
+            self._forced_position = CoverActuatorForcedPosition(value)
+        except ValueError:
+            self._forced_position = CoverActuatorForcedPosition.unknown
 
     async def _set_moving_datapoint(self, value: str):
         """Set the move_up_down datapoint on the api."""
@@ -223,19 +207,6 @@ class BlindActuator(CoverActuator):
 class ShutterActuator(CoverActuator):
     """Free@Home ShutterActuator Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_INFO_MOVE_UP_DOWN,
-        Pairing.AL_CURRENT_ABSOLUTE_POSITION_BLINDS_PERCENTAGE,
-        Pairing.AL_INFO_FORCE,
-        Pairing.AL_CURRENT_ABSOLUTE_POSITION_SLATS_PERCENTAGE,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-        "forced_position",
-        "position",
-        "tilt_position",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -284,19 +255,12 @@ class ShutterActuator(CoverActuator):
         await self._set_tilt_datapoint(str(value))
         self._tilt_position = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_CURRENT_ABSOLUTE_POSITION_SLATS_PERCENTAGE.value
-        ):
-            self._tilt_position = int(float(datapoint.get("value")))
-            return "tilt_position"
-        return super()._refresh_state_from_datapoint(datapoint)
+    @datapoint_handler(
+        Pairing.AL_CURRENT_ABSOLUTE_POSITION_SLATS_PERCENTAGE, "tilt_position"
+    )
+    def _refresh_tilt_position(self, value: str):
+        """Refresh the tilt position from a datapoint value."""
+        self._tilt_position = int(float(value))
 
     async def _set_tilt_datapoint(self, value: str):
         """Set the tilt position datapoint on the api."""
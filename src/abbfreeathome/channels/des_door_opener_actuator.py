@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -12,13 +12,6 @@ if TYPE_CHECKING:
 class DesDoorOpenerActuator(Base):
     """Free@Home DesDoorOpenerActuator Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_INFO_ON_OFF,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -59,16 +52,10 @@ class DesDoorOpenerActuator(Base):
         await self._set_switching_datapoint("1")
         self._state = True
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_INFO_ON_OFF.value:
-            self._state = datapoint.get("value") == "1"
-            return "state"
-        return None
+    @datapoint_handler(Pairing.AL_INFO_ON_OFF, "state")
+    def _refresh_on_off(self, value: str):
+        """Refresh the on/off state from a datapoint value."""
+        self._state = value == "1"
 
     async def _set_switching_datapoint(self, value: str):
         """Set the switching datapoint on the api."""
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -12,13 +12,6 @@ if TYPE_CHECKING:
 class DesDoorRingingSensor(Base):
     """Free@Home DesDoorRingingSensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_TIMED_START_STOP,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -42,12 +35,6 @@ class DesDoorRingingSensor(Base):
             room_name,
         )
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_TIMED_START_STOP.value:
-            return "state"
-        return None
+    @datapoint_handler(Pairing.AL_TIMED_START_STOP, "state")
+    def _refresh_ringing(self, value: str):
+        """Trigger the state callbacks, the ringing sensor holds no state."""
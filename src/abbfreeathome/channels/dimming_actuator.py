@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
 from ..bin.parameter import Parameter
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -23,17 +23,6 @@ class DimmingActuatorForcedPosition(enum.Enum):
 class DimmingActuator(Base):
     """Free@Home DimmingActuator Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_INFO_FORCE,
-        Pairing.AL_INFO_ON_OFF,
-        Pairing.AL_INFO_ACTUAL_DIMMING_VALUE,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-        "brightness",
-        "forced_position",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -119,27 +108,23 @@ class DimmingActuator(Base):
 
         self._forced_position = _position
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
+    @datapoint_handler(Pairing.AL_INFO_FORCE, "forced_position")
+    def _refresh_forced_position(self, value: str):
+        """Refresh the forced position from a datapoint value."""
+        try:
+            self._forced_position = DimmingActuatorForcedPosition(value)
+        except ValueError:
+            self._forced_position = DimmingActuatorForcedPosition.unknown
 
-        This will return whether the state was refreshed as a boolean value.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_INFO_ON_OFF.value:
-            self._state = datapoint.get("value") == "1"
-            return "state"
-        if datapoint.get("pairingID") == Pairing.AL_INFO_ACTUAL_DIMMING_VALUE.value:
-            self._brightness = int(float(datapoint.get("value")))
-            return "brightness"
-        if datapoint.get("pairingID") == Pairing.AL_INFO_FORCE.value:
-            try:
-                self._forced_position = DimmingActuatorForcedPosition(
-                    datapoint.get("value")
-                )
-            except ValueError:
-                self._forced_position = DimmingActuatorForcedPosition.unknown
-            return "forced_position"
-        return None
+    @datapoint_handler(Pairing.AL_INFO_ON_OFF, "state")
+    def _refresh_on_off(self, value: str):
+        """Refresh the on/off state from a datapoint value."""
+        self._state = value == "1"
+
+    @datapoint_handler(Pairing.AL_INFO_ACTUAL_DIMMING_VALUE, "brightness")
+    def _refresh_brightness(self, value: str):
+        """Refresh the brightness from a datapoint value."""
+        self._brightness = int(float(value))
 
     async def _set_switching_datapoint(self, value: str):
         """Set the switching datapoint on the api."""
@@ -181,19 +166,6 @@ class DimmingActuator(Base):
 class ColorTemperatureActuator(DimmingActuator):
     """Free@Home ColorTemperatureActuator Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_INFO_FORCE,
-        Pairing.AL_INFO_ON_OFF,
-        Pairing.AL_INFO_ACTUAL_DIMMING_VALUE,
-        Pairing.AL_INFO_COLOR_TEMPERATURE,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-        "brightness",
-        "forced_position",
-        "color_temperature",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -259,16 +231,10 @@ class ColorTemperatureActuator(DimmingActuator):
         await self._set_color_temperature_datapoint(str(value))
         self._color_temperature = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_INFO_COLOR_TEMPERATURE.value:
-            self._color_temperature = int(float(datapoint.get("value")))
-            return "color_temperature"
-        return super()._refresh_state_from_datapoint(datapoint)
+    @datapoint_handler(Pairing.AL_INFO_COLOR_TEMPERATURE, "color_temperature")
+    def _refresh_color_temperature(self, value: str):
+        """Refresh the color temperature from a datapoint value."""
+        self._color_temperature = int(float(value))
 
     async def _set_color_temperature_datapoint(self, value: str):
         """Set the color temperature on the api."""
@@ -4,7 +4,7 @@ import enum
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -21,13 +21,6 @@ class ForceOnOffSensorState(enum.Enum):
 class ForceOnOffSensor(Base):
     """Free@Home ForceOnOffSensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_FORCED,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -58,28 +51,23 @@ class ForceOnOffSensor(Base):
         """Get the forceOnOff state."""
         return self._state.name
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
+    @datapoint_handler(Pairing.AL_FORCED, "state")
+    def _refresh_forced(self, value: str):
         """
-        Refresh the state of the channel from a given output.
+        Refresh the forced state from a datapoint value.
 
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_FORCED.value:
-            """
-            Forces value dependent high priority on or off state
+        Forces value dependent high priority on or off state
 
-            If the rocker is configured as 'force on':
-            3 means on
-            1 means off
-            If the rocker is configured as 'force off':
-            2 means on
-            0 means off
-            """
-            if datapoint.get("value") in ("2", "3"):
-                self._state = ForceOnOffSensorState.on
-            elif datapoint.get("value") in ("0", "1"):
-                self._state = ForceOnOffSensorState.off
-            else:
-                self._state = ForceOnOffSensorState.unknown
-            return "state"
-        return None
+        If the rocker is configured as 'force on':
+        3 means on
+        1 means off
+        If the rocker is configured as 'force off':
+        2 means on
+        0 means off
+        """
+        if value in ("2", "3"):
+            self._state = ForceOnOffSensorState.on
+        elif value in ("0", "1"):
+            self._state = ForceOnOffSensorState.off
+        else:
+            self._state = ForceOnOffSensorState.unknown
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -12,15 +12,6 @@ if TYPE_CHECKING:
 class MovementDetector(Base):
     """Free@Home MovementDetector Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_TIMED_MOVEMENT,
-        Pairing.AL_BRIGHTNESS_LEVEL,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-        "brightness",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -57,36 +48,26 @@ class MovementDetector(Base):
         """Get the brightness level of the sensor."""
         return self._brightness
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
+    @datapoint_handler(Pairing.AL_TIMED_MOVEMENT, "state")
+    def _refresh_movement(self, value: str):
+        """Refresh the movement state from a datapoint value."""
+        self._state = value == "1"
 
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        match datapoint.get("pairingID"):
-            case Pairing.AL_TIMED_MOVEMENT.value:
-                self._state = datapoint.get("value") == "1"
-                return "state"
-            case Pairing.AL_BRIGHTNESS_LEVEL.value:
-                self._brightness = float(datapoint.get("value"))
-                return "brightness"
-            case _:
-                return None
+    @datapoint_handler(Pairing.AL_BRIGHTNESS_LEVEL, "brightness")
+    def _refresh_brightness(self, value: str):
+        """Refresh the brightness level from a datapoint value."""
+        self._brightness = float(value)
 
 
 class BlockableMovementDetector(MovementDetector):
     """Free@Home BlockableMovementDetector Class."""
 
+    # Refresh the movement state before the blocked state of the sensor
     _state_refresh_pairings: list[Pairing] = [
         Pairing.AL_TIMED_MOVEMENT,
         Pairing.AL_BRIGHTNESS_LEVEL,
         Pairing.AL_INFO_LOCKED_SENSOR,
     ]
-    _callback_attributes: list[str] = [
-        "state",
-        "brightness",
-        "blocked",
-    ]
 
     def __init__(
         self,
@@ -128,11 +109,10 @@ class BlockableMovementDetector(MovementDetector):
         await self._set_blocking_datapoint("0")
         self._blocked = False
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        if datapoint.get("pairingID") == Pairing.AL_INFO_LOCKED_SENSOR.value:
-            self._blocked = datapoint.get("value") == "1"
-            return "blocked"
-        return super()._refresh_state_from_datapoint(datapoint)
+    @datapoint_handler(Pairing.AL_INFO_LOCKED_SENSOR, "blocked")
+    def _refresh_blocked(self, value: str):
+        """Refresh the blocked state from a datapoint value."""
+        self._blocked = value == "1"
 
     async def _set_blocking_datapoint(self, value: str):
         """Set the blocking datapoint on the api."""
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -12,23 +12,6 @@ if TYPE_CHECKING:
 class RoomTemperatureController(Base):
     """Free@Home RoomTemperatureController Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_SET_POINT_TEMPERATURE,
-        Pairing.AL_STATE_INDICATION,
-        Pairing.AL_MEASURED_TEMPERATURE,
-        Pairing.AL_ACTUATING_VALUE_HEATING,
-        Pairing.AL_ACTUATING_VALUE_COOLING,
-        Pairing.AL_CONTROLLER_ON_OFF,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-        "current_temperature",
-        "heating",
-        "cooling",
-        "target_temperature",
-        "eco_mode",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -128,51 +111,56 @@ class RoomTemperatureController(Base):
         await self._set_temperature_datapoint(str(value))
         self._target_temperature = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:  # noqa: PLR0911
-        """
-        Refresh the state of the channel from a given output.
+    @datapoint_handler(Pairing.AL_SET_POINT_TEMPERATURE, "target_temperature")
+    def _refresh_target_temperature(self, value: str):
+        """Refresh the target temperature from a datapoint value."""
+        self._target_temperature = float(value)
 
-        This will return the name of the attribute, which was refreshed or None.
+    @datapoint_handler(Pairing.AL_STATE_INDICATION, "eco_mode")
+    def _refresh_state_indication(self, value: str):
+        """
+        Refresh the state indication from a datapoint value.
+
+        This returns a integer bitwise-ORed with the following masks:
+        0x01 - comfort mode                 (65)
+        0x02 - standby
+        0x04 - eco mode                     (68)
+        0x08 - building protect
+        0x10 - dew alarm
+        0x20 - heat (set) / cool (unset)    (33)
+        0x40 - no heating/cooling (set)
+        0x80 - frost alarm
+
+        At the moment only 0x04 (eco mode) is needed
         """
-        if datapoint.get("pairingID") == Pairing.AL_SET_POINT_TEMPERATURE.value:
-            self._target_temperature = float(datapoint.get("value"))
-            return "target_temperature"
-        if datapoint.get("pairingID") == Pairing.AL_CONTROLLER_ON_OFF.value:
-            self._state = datapoint.get("value") == "1"
-            return "state"
-        if datapoint.get("pairingID") == Pairing.AL_STATE_INDICATION.value:
-            """
-            This returns a integer bitwise-ORed with the following masks:
-            0x01 - comfort mode                 (65)
-            0x02 - standby
-            0x04 - eco mode                     (68)
-            0x08 - building protect
-            0x10 - dew alarm
-            0x20 - heat (set) / cool (unset)    (33)
-            0x40 - no heating/cooling (set)
-            0x80 - frost alarm
-
-            At the moment only 0x04 (eco mode) is needed
-            """
-            self._state_indication = int(datapoint.get("value"))
-            self._eco_mode = int(datapoint.get("value")) & 0x04 == 0x04
-            return "eco_mode"
-        if datapoint.get("pairingID") == Pairing.AL_MEASURED_TEMPERATURE.value:
-            self._current_temperature = float(datapoint.get("value"))
-            return "current_temperature"
-        if datapoint.get("pairingID") == Pairing.AL_ACTUATING_VALUE_HEATING.value:
-            try:
-                self._heating = int(float(datapoint.get("value")))
-            except ValueError:
-                self._heating = 0
-            return "heating"
-        if datapoint.get("pairingID") == Pairing.AL_ACTUATING_VALUE_COOLING.value:
-            try:
-                self._cooling = int(float(datapoint.get("value")))
-            except ValueError:
-                self._cooling = 0
-            return "cooling"
-        return None
+        self._state_indication = int(value)
+        self._eco_mode = int(value) & 0x04 == 0x04
+
+    @datapoint_handler(Pairing.AL_MEASURED_TEMPERATURE, "current_temperature")
+    def _refresh_current_temperature(self, value: str):
+        """Refresh the current temperature from a datapoint value."""
+        self._current_temperature = float(value)
+
+    @datapoint_handler(Pairing.AL_ACTUATING_VALUE_HEATING, "heating")
+    def _refresh_heating(self, value: str):
+        """Refresh the heating actuating value from a datapoint value."""
+        try:
+            self._heating = int(float(value))
+        except ValueError:
+            self._heating = 0
+
+    @datapoint_handler(Pairing.AL_ACTUATING_VALUE_COOLING, "cooling")
+    def _refresh_cooling(self, value: str):
+        """Refresh the cooling actuating value from a datapoint value."""
+        try:
+            self._cooling = int(float(value))
+        except ValueError:
+            self._cooling = 0
+
+    @datapoint_handler(Pairing.AL_CONTROLLER_ON_OFF, "state")
+    def _refresh_on_off(self, value: str):
+        """Refresh the on/off state from a datapoint value."""
+        self._state = value == "1"
 
     async def _set_switching_datapoint(self, value: str):
         """Set the switching datapoint on the api."""
@@ -4,7 +4,7 @@ import enum
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -22,13 +22,6 @@ class SwitchActuatorForcedPosition(enum.Enum):
 class SimpleSwitchActuator(Base):
     """Free@Home SimpleSwitchActuator Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_INFO_ON_OFF,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -69,16 +62,10 @@ class SimpleSwitchActuator(Base):
         await self._set_switching_datapoint("0")
         self._state = False
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_INFO_ON_OFF.value:
-            self._state = datapoint.get("value") == "1"
-            return "state"
-        return None
+    @datapoint_handler(Pairing.AL_INFO_ON_OFF, "state")
+    def _refresh_on_off(self, value: str):
+        """Refresh the on/off state from a datapoint value."""
+        self._state = value == "1"
 
     async def _set_switching_datapoint(self, value: str):
         """Set the switching datapoint on the api."""
@@ -100,20 +87,10 @@ class WelcomeIPMuteActuator(SimpleSwitchActuator):
 class MWireSwitchActuator(SimpleSwitchActuator):
     """Free@Home MWireSwitchActuator Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_MWIRE_SWITCH_ON_OFF,
-    ]
-
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_MWIRE_SWITCH_ON_OFF.value:
-            self._state = datapoint.get("value") == "1"
-            return "state"
-        return None
+    @datapoint_handler(Pairing.AL_MWIRE_SWITCH_ON_OFF, "state")
+    def _refresh_on_off(self, value: str):
+        """Refresh the on/off state from a datapoint value."""
+        self._state = value == "1"
 
     async def _set_switching_datapoint(self, value: str):
         """Set the switching datapoint on the api."""
@@ -131,15 +108,6 @@ class MWireSwitchActuator(SimpleSwitchActuator):
 class SwitchActuator(SimpleSwitchActuator):
     """Free@Home SwitchActuator Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_INFO_FORCE,
-        Pairing.AL_INFO_ON_OFF,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-        "forced_position",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -188,25 +156,13 @@ class SwitchActuator(SimpleSwitchActuator):
 
         self._forced_position = _position
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        _return_value = super()._refresh_state_from_datapoint(datapoint)
-        if _return_value is not None:
-            return _return_value
-
-        if datapoint.get("pairingID") == Pairing.AL_INFO_FORCE.value:
-            try:
-                self._forced_position = SwitchActuatorForcedPosition(
-                    datapoint.get("value")
-                )
-            except ValueError:
-                self._forced_position = SwitchActuatorForcedPosition.unknown
-            return "forced_position"
-        return None
+    @datapoint_handler(Pairing.AL_INFO_FORCE, "forced_position")
+    def _refresh_forced_position(self, value: str):
+        """Refresh the forced position from a datapoint value."""
+        try:
+            self._forced_position = SwitchActuatorForcedPosition(value)
+        except ValueError:
+            self._forced_position = SwitchActuatorForcedPosition.unknown
 
     async def _set_force_datapoint(self, value: str):
         """Set the force datapoint on the api."""
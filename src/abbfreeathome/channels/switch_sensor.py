@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any
 from ..bin.pairing import Pairing
 from ..bin.parameter import Parameter
 from ..exceptions import InvalidDeviceChannelParameter
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -33,16 +33,7 @@ class DimmingSensorState(enum.Enum):
 class SwitchSensor(Base):
     """Free@Home SwitchSensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_SWITCH_ON_OFF,
-    ]
-    _input_state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_INFO_ON_OFF,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-        "led",
-    ]
+    _update_from_inputs: bool = True
 
     def __init__(
         self,
@@ -96,31 +87,31 @@ class SwitchSensor(Base):
         await self._set_led_datapoint("0")
         self._led = False
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return whether the state was refreshed as a boolean value.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_SWITCH_ON_OFF.value:
-            try:
-                self._switch_sensor_state = SwitchSensorState(datapoint.get("value"))
-            except ValueError:
-                self._switch_sensor_state = SwitchSensorState.unknown
-
-            self._state = self._switch_sensor_state
-            return "state"
-        if datapoint.get("pairingID") == Pairing.AL_INFO_ON_OFF.value:
-            try:
-                _, _parameter_value = self.get_channel_parameter(
-                    parameter=Parameter.PID_LED_OPERATION_MODE
-                )
-                if _parameter_value == "2":
-                    self._led = datapoint.get("value") == "1"
-                    return "led"
-            except InvalidDeviceChannelParameter:
-                return None
-        return None
+    @datapoint_handler(Pairing.AL_SWITCH_ON_OFF, "state")
+    def _refresh_switching_state(self, value: str):
+        """Refresh the switching state from a datapoint value."""
+        try:
+            self._switch_sensor_state = SwitchSensorState(value)
+        except ValueError:
+            self._switch_sensor_state = SwitchSensorState.unknown
+
+        self._state = self._switch_sensor_state
+
+    @datapoint_handler(Pairing.AL_INFO_ON_OFF, "led", refresh_from="inputs")
+    def _refresh_led(self, value: str) -> bool:
+        """Refresh the led state, if the led is controlled by the datapoint."""
+        try:
+            _, _parameter_value = self.get_channel_parameter(
+                parameter=Parameter.PID_LED_OPERATION_MODE
+            )
+        except InvalidDeviceChannelParameter:
+            return False
+
+        if _parameter_value != "2":
+            return False
+
+        self._led = value == "1"
+        return True
 
     async def _set_led_datapoint(self, value: str):
         """Set the led datapoint on the api."""
@@ -134,46 +125,6 @@ class SwitchSensor(Base):
             value=value,
         )
 
-    def update_channel(self, datapoint_key, datapoint_value):
-        """Update the channel state."""
-        super().update_channel(datapoint_key, datapoint_value)
-        _callback_attribute = None
-        _io_key = datapoint_key.split("/")[-1]
-
-        if _io_key in self._inputs:
-            self._inputs[_io_key]["value"] = datapoint_value
-            _callback_attribute = self._refresh_state_from_datapoint(
-                datapoint=self._inputs[_io_key]
-            )
-
-        if _callback_attribute and self._callbacks[_callback_attribute]:
-            for callback in self._callbacks[_callback_attribute]:
-                callback()
-
-    async def refresh_state(self):
-        """Refresh the state of the channel from the api."""
-        await super().refresh_state()
-
-        for _pairing in self._input_state_refresh_pairings:
-            _datapoint_id, _datapoint_value = self.get_input_by_pairing(
-                pairing=_pairing
-            )
-
-            _datapoint = (
-                await self.device.api.get_datapoint(
-                    device_serial=self.device_serial,
-                    channel_id=self.channel_id,
-                    datapoint=_datapoint_id,
-                )
-            )[0]
-
-            self._refresh_state_from_datapoint(
-                datapoint={
-                    "pairingID": _pairing.value,
-                    "value": _datapoint,
-                }
-            )
-
     def _refresh_state_from_datapoints(self):
         """Refresh the state of the channel from the datapoints."""
         super()._refresh_state_from_datapoints()
@@ -185,11 +136,6 @@ class SwitchSensor(Base):
 class DimmingSensor(SwitchSensor):
     """Free@Home DimmingSensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_RELATIVE_SET_VALUE_CONTROL,
-        Pairing.AL_SWITCH_ON_OFF,
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -221,22 +167,12 @@ class DimmingSensor(SwitchSensor):
         """Get the dimming state."""
         return self._dimming_sensor_state.name
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        _return_value = super()._refresh_state_from_datapoint(datapoint)
-        if _return_value is not None:
-            return _return_value
-
-        if datapoint.get("pairingID") == Pairing.AL_RELATIVE_SET_VALUE_CONTROL.value:
-            try:
-                self._dimming_sensor_state = DimmingSensorState(datapoint.get("value"))
-            except ValueError:
-                self._dimming_sensor_state = DimmingSensorState.unknown
-
-            self._state = self._dimming_sensor_state
-            return "state"
-        return None
+    @datapoint_handler(Pairing.AL_RELATIVE_SET_VALUE_CONTROL, "state")
+    def _refresh_dimming_state(self, value: str):
+        """Refresh the dimming state from a datapoint value."""
+        try:
+            self._dimming_sensor_state = DimmingSensorState(value)
+        except ValueError:
+            self._dimming_sensor_state = DimmingSensorState.unknown
+
+        self._state = self._dimming_sensor_state
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -12,15 +12,6 @@ if TYPE_CHECKING:
 class TemperatureSensor(Base):
     """Free@Home TemperatureSensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_OUTDOOR_TEMPERATURE,
-        Pairing.AL_FROST_ALARM,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-        "alarm",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -57,19 +48,15 @@ class TemperatureSensor(Base):
         """Get the alarm state of the sensor."""
         return self._alarm
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> bool:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_OUTDOOR_TEMPERATURE.value:
-            try:
-                self._state = float(datapoint.get("value"))
-            except (ValueError, TypeError):
-                self._state = None
-            return "state"
-        if datapoint.get("pairingID") == Pairing.AL_FROST_ALARM.value:
-            self._alarm = datapoint.get("value") == "1"
-            return "alarm"
-        return None
+    @datapoint_handler(Pairing.AL_OUTDOOR_TEMPERATURE, "state")
+    def _refresh_temperature(self, value: str):
+        """Refresh the temperature from a datapoint value."""
+        try:
+            self._state = float(value)
+        except (ValueError, TypeError):
+            self._state = None
+
+    @datapoint_handler(Pairing.AL_FROST_ALARM, "alarm")
+    def _refresh_alarm(self, value: str):
+        """Refresh the frost alarm from a datapoint value."""
+        self._alarm = value == "1"
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -30,26 +30,22 @@ class ValveActuatorMixin:
         await self._set_valve_datapoint(input_pairing, str(value))
         setattr(self, attr_name, value)
 
-    def _refresh_valve_position_from_datapoint(
-        self, datapoint: dict[str, Any], attr_name: str
-    ) -> str:
+    @staticmethod
+    def _parse_valve_position(value: str | None) -> int | None:
         """
-        Refresh valve position from a datapoint.
+        Parse a valve position from a datapoint value.
 
         Args:
-            datapoint: The datapoint dictionary
-            attr_name: The internal attribute name
+            value: The datapoint value
 
         Returns:
-            The attribute name that was refreshed
+            The valve position or None, if the value is not a number
 
         """
-        value = datapoint.get("value")
         try:
-            setattr(self, attr_name, int(float(value)))
+            return int(float(value))
         except (ValueError, TypeError):
-            setattr(self, attr_name, None)
-        return attr_name.lstrip("_")
+            return None
 
     async def _set_valve_datapoint(self, input_pairing: Pairing, value: str):
         """Set a valve position datapoint on the API."""
@@ -65,13 +61,6 @@ class ValveActuatorMixin:
 class HeatingActuator(ValveActuatorMixin, Base):
     """Free@Home HeatingActuator Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_INFO_VALUE_HEATING,
-    ]
-    _callback_attributes: list[str] = [
-        "position",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -116,32 +105,15 @@ class HeatingActuator(ValveActuatorMixin, Base):
             input_pairing=Pairing.AL_ACTUATING_VALUE_HEATING,
         )
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        pairing_id = datapoint.get("pairingID")
-
-        if pairing_id == Pairing.AL_INFO_VALUE_HEATING.value:
-            return self._refresh_valve_position_from_datapoint(
-                datapoint=datapoint,
-                attr_name="_position",
-            )
-        return None
+    @datapoint_handler(Pairing.AL_INFO_VALUE_HEATING, "position")
+    def _refresh_position(self, value: str):
+        """Refresh the valve position from a datapoint value."""
+        self._position = self._parse_valve_position(value)
 
 
 class CoolingActuator(ValveActuatorMixin, Base):
     """Free@Home CoolingActuator Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_INFO_VALUE_COOLING,
-    ]
-    _callback_attributes: list[str] = [
-        "position",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -186,34 +158,15 @@ class CoolingActuator(ValveActuatorMixin, Base):
             input_pairing=Pairing.AL_ACTUATING_VALUE_COOLING,
         )
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        pairing_id = datapoint.get("pairingID")
-
-        if pairing_id == Pairing.AL_INFO_VALUE_COOLING.value:
-            return self._refresh_valve_position_from_datapoint(
-                datapoint=datapoint,
-                attr_name="_position",
-            )
-        return None
+    @datapoint_handler(Pairing.AL_INFO_VALUE_COOLING, "position")
+    def _refresh_position(self, value: str):
+        """Refresh the valve position from a datapoint value."""
+        self._position = self._parse_valve_position(value)
 
 
 class HeatingCoolingActuator(ValveActuatorMixin, Base):
     """Free@Home HeatingCoolingActuator Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_INFO_VALUE_HEATING,
-        Pairing.AL_INFO_VALUE_COOLING,
-    ]
-    _callback_attributes: list[str] = [
-        "heating_position",
-        "cooling_position",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -278,24 +231,12 @@ class HeatingCoolingActuator(ValveActuatorMixin, Base):
             input_pairing=Pairing.AL_ACTUATING_VALUE_COOLING,
         )
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        pairing_id = datapoint.get("pairingID")
-
-        if pairing_id == Pairing.AL_INFO_VALUE_HEATING.value:
-            return self._refresh_valve_position_from_datapoint(
-                datapoint=datapoint,
-                attr_name="_heating_position",
-            )
-
-        if pairing_id == Pairing.AL_INFO_VALUE_COOLING.value:
-            return self._refresh_valve_position_from_datapoint(
-                datapoint=datapoint,
-                attr_name="_cooling_position",
-            )
+    @datapoint_handler(Pairing.AL_INFO_VALUE_HEATING, "heating_position")
+    def _refresh_heating_position(self, value: str):
+        """Refresh the heating valve position from a datapoint value."""
+        self._heating_position = self._parse_valve_position(value)
 
-        return None
+    @datapoint_handler(Pairing.AL_INFO_VALUE_COOLING, "cooling_position")
+    def _refresh_cooling_position(self, value: str):
+        """Refresh the cooling valve position from a datapoint value."""
+        self._cooling_position = self._parse_valve_position(value)
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ...bin.pairing import Pairing
-from ..base import Base
+from ..base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ...device import Device
@@ -12,15 +12,6 @@ if TYPE_CHECKING:
 class VirtualBrightnessSensor(Base):
     """Free@Home Virtual BrightnessSensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_BRIGHTNESS_LEVEL,
-        Pairing.AL_BRIGHTNESS_ALARM,
-    ]
-    _callback_attributes: list[str] = [
-        "brightness",
-        "alarm",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -78,23 +69,18 @@ class VirtualBrightnessSensor(Base):
         await self._set_alarm_datapoint("0")
         self._alarm = False
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_BRIGHTNESS_LEVEL.value:
-            try:
-                self._brightness = int(float(datapoint.get("value")))
-            except ValueError:
-                self._brightness = 0
-            return "brightness"
-        if datapoint.get("pairingID") == Pairing.AL_BRIGHTNESS_ALARM.value:
-            self._alarm = datapoint.get("value") == "1"
-            return "alarm"
-
-        return None
+    @datapoint_handler(Pairing.AL_BRIGHTNESS_LEVEL, "brightness")
+    def _refresh_brightness(self, value: str):
+        """Refresh the brightness level from a datapoint value."""
+        try:
+            self._brightness = int(float(value))
+        except ValueError:
+            self._brightness = 0
+
+    @datapoint_handler(Pairing.AL_BRIGHTNESS_ALARM, "alarm")
+    def _refresh_alarm(self, value: str):
+        """Refresh the brightness alarm from a datapoint value."""
+        self._alarm = value == "1"
 
     async def _set_brightness_datapoint(self, value: str):
         """Set the sensor datapoint on the api."""
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ...bin.pairing import Pairing
-from ..base import Base
+from ..base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ...device import Device
@@ -12,23 +12,6 @@ if TYPE_CHECKING:
 class VirtualEnergyBattery(Base):
     """Free@Home Virtual EnergyBattery Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_BATTERY_POWER,
-        Pairing.AL_SOC,
-        Pairing.AL_MEASURED_IMPORTED_ENERGY_TODAY,
-        Pairing.AL_MEASURED_EXPORTED_ENERGY_TODAY,
-        Pairing.AL_MEASURED_TOTAL_ENERGY_IMPORTED,
-        Pairing.AL_MEASURED_TOTAL_ENERGY_EXPORTED,
-    ]
-    _callback_attributes: list[str] = [
-        "battery_power",
-        "soc",
-        "imported_today",
-        "exported_today",
-        "imported_total",
-        "exported_total",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -146,62 +129,53 @@ class VirtualEnergyBattery(Base):
         await self._set_exported_total_datapoint(str(value))
         self._exported_total = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:  # noqa: PLR0911
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_BATTERY_POWER.value:
-            try:
-                self._battery_power = float(datapoint.get("value"))
-            except ValueError:
-                self._battery_power = 0.0
-            return "battery_power"
-        if datapoint.get("pairingID") == Pairing.AL_SOC.value:
-            try:
-                self._soc = int(datapoint.get("value"))
-            except ValueError:
-                self._soc = 0
-            return "soc"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_IMPORTED_ENERGY_TODAY.value
-        ):
-            try:
-                self._imported_today = int(datapoint.get("value"))
-            except ValueError:
-                self._imported_today = 0
-            return "imported_today"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_EXPORTED_ENERGY_TODAY.value
-        ):
-            try:
-                self._exported_today = int(datapoint.get("value"))
-            except ValueError:
-                self._exported_today = 0
-            return "exported_today"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_TOTAL_ENERGY_IMPORTED.value
-        ):
-            try:
-                self._imported_total = int(datapoint.get("value"))
-            except ValueError:
-                self._imported_total = 0
-            return "imported_total"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_TOTAL_ENERGY_EXPORTED.value
-        ):
-            try:
-                self._exported_total = int(datapoint.get("value"))
-            except ValueError:
-                self._exported_total = 0
-            return "exported_total"
-
-        return None
+    @datapoint_handler(Pairing.AL_BATTERY_POWER, "battery_power")
+    def _refresh_battery_power(self, value: str):
+        """Refresh the battery power from a datapoint value."""
+        try:
+            self._battery_power = float(value)
+        except ValueError:
+            self._battery_power = 0.0
+
+    @datapoint_handler(Pairing.AL_SOC, "soc")
+    def _refresh_soc(self, value: str):
+        """Refresh the state of charge from a datapoint value."""
+        try:
+            self._soc = int(value)
+        except ValueError:
+            self._soc = 0
+
+    @datapoint_handler(Pairing.AL_MEASURED_IMPORTED_ENERGY_TODAY, "imported_today")
+    def _refresh_imported_today(self, value: str):
+        """Refresh the energy imported today from a datapoint value."""
+        try:
+            self._imported_today = int(value)
+        except ValueError:
+            self._imported_today = 0
+
+    @datapoint_handler(Pairing.AL_MEASURED_EXPORTED_ENERGY_TODAY, "exported_today")
+    def _refresh_exported_today(self, value: str):
+        """Refresh the energy exported today from a datapoint value."""
+        try:
+            self._exported_today = int(value)
+        except ValueError:
+            self._exported_today = 0
+
+    @datapoint_handler(Pairing.AL_MEASURED_TOTAL_ENERGY_IMPORTED, "imported_total")
+    def _refresh_imported_total(self, value: str):
+        """Refresh the total energy imported from a datapoint value."""
+        try:
+            self._imported_total = int(value)
+        except ValueError:
+            self._imported_total = 0
+
+    @datapoint_handler(Pairing.AL_MEASURED_TOTAL_ENERGY_EXPORTED, "exported_total")
+    def _refresh_exported_total(self, value: str):
+        """Refresh the total energy exported from a datapoint value."""
+        try:
+            self._exported_total = int(value)
+        except ValueError:
+            self._exported_total = 0
 
     async def _set_battery_power_datapoint(self, value: str):
         """Set the sensor datapoint on the api."""
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ...bin.pairing import Pairing
-from ..base import Base
+from ..base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ...device import Device
@@ -12,21 +12,6 @@ if TYPE_CHECKING:
 class VirtualEnergyTwoWayMeter(Base):
     """Free@Home Virtual EnergyTwoWayMeter Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_MEASURED_CURRENT_POWER_CONSUMED,
-        Pairing.AL_MEASURED_IMPORTED_ENERGY_TODAY,
-        Pairing.AL_MEASURED_EXPORTED_ENERGY_TODAY,
-        Pairing.AL_MEASURED_TOTAL_ENERGY_IMPORTED,
-        Pairing.AL_MEASURED_TOTAL_ENERGY_EXPORTED,
-    ]
-    _callback_attributes: list[str] = [
-        "current_power",
-        "imported_today",
-        "exported_today",
-        "imported_total",
-        "exported_total",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -126,59 +111,45 @@ class VirtualEnergyTwoWayMeter(Base):
         await self._set_exported_total_datapoint(str(value))
         self._exported_total = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_CURRENT_POWER_CONSUMED.value
-        ):
-            try:
-                self._current_power = float(datapoint.get("value"))
-            except ValueError:
-                self._current_power = 0.0
-            return "current_power"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_IMPORTED_ENERGY_TODAY.value
-        ):
-            try:
-                self._imported_today = int(datapoint.get("value"))
-            except ValueError:
-                self._imported_today = 0
-            return "imported_today"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_EXPORTED_ENERGY_TODAY.value
-        ):
-            try:
-                self._exported_today = int(datapoint.get("value"))
-            except ValueError:
-                self._exported_today = 0
-            return "exported_today"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_TOTAL_ENERGY_IMPORTED.value
-        ):
-            try:
-                self._imported_total = int(datapoint.get("value"))
-            except ValueError:
-                self._imported_total = 0
-            return "imported_total"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_MEASURED_TOTAL_ENERGY_EXPORTED.value
-        ):
-            try:
-                self._exported_total = int(datapoint.get("value"))
-            except ValueError:
-                self._exported_total = 0
-            return "exported_total"
-
-        return None
+    @datapoint_handler(Pairing.AL_MEASURED_CURRENT_POWER_CONSUMED, "current_power")
+    def _refresh_current_power(self, value: str):
+        """Refresh the current power from a datapoint value."""
+        try:
+            self._current_power = float(value)
+        except ValueError:
+            self._current_power = 0.0
+
+    @datapoint_handler(Pairing.AL_MEASURED_IMPORTED_ENERGY_TODAY, "imported_today")
+    def _refresh_imported_today(self, value: str):
+        """Refresh the energy imported today from a datapoint value."""
+        try:
+            self._imported_today = int(value)
+        except ValueError:
+            self._imported_today = 0
+
+    @datapoint_handler(Pairing.AL_MEASURED_EXPORTED_ENERGY_TODAY, "exported_today")
+    def _refresh_exported_today(self, value: str):
+        """Refresh the energy exported today from a datapoint value."""
+        try:
+            self._exported_today = int(value)
+        except ValueError:
+            self._exported_today = 0
+
+    @datapoint_handler(Pairing.AL_MEASURED_TOTAL_ENERGY_IMPORTED, "imported_total")
+    def _refresh_imported_total(self, value: str):
+        """Refresh the total energy imported from a datapoint value."""
+        try:
+            self._imported_total = int(value)
+        except ValueError:
+            self._imported_total = 0
+
+    @datapoint_handler(Pairing.AL_MEASURED_TOTAL_ENERGY_EXPORTED, "exported_total")
+    def _refresh_exported_total(self, value: str):
+        """Refresh the total energy exported from a datapoint value."""
+        try:
+            self._exported_total = int(value)
+        except ValueError:
+            self._exported_total = 0
 
     async def _set_current_power_datapoint(self, value: str):
         """Set the sensor datapoint on the api."""
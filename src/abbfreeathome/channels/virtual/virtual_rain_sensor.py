@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ...bin.pairing import Pairing
-from ..base import Base
+from ..base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ...device import Device
@@ -12,13 +12,6 @@ if TYPE_CHECKING:
 class VirtualRainSensor(Base):
     """Free@Home Virtual RainSensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_RAIN_ALARM,
-    ]
-    _callback_attributes: list[str] = [
-        "alarm",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -59,17 +52,10 @@ class VirtualRainSensor(Base):
         await self._set_alarm_datapoint("0")
         self._alarm = False
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_RAIN_ALARM.value:
-            self._alarm = datapoint.get("value") == "1"
-            return "alarm"
-
-        return None
+    @datapoint_handler(Pairing.AL_RAIN_ALARM, "alarm")
+    def _refresh_alarm(self, value: str):
+        """Refresh the rain alarm from a datapoint value."""
+        self._alarm = value == "1"
 
     async def _set_alarm_datapoint(self, value: str):
         """Set the sensor datapoint on the api."""
@@ -1,42 +1,18 @@
 """Free@Home Virtual RoomTemperatureController."""
 
-import logging
 from typing import TYPE_CHECKING, Any
 
 from ...bin.pairing import Pairing
-from ..base import Base
+from ..base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ...device import Device
 
-_LOGGER = logging.getLogger(__name__)
-
 
 class VirtualRoomTemperatureController(Base):
     """Free@Home Virtual RoomTemperatureController Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_SET_POINT_TEMPERATURE,
-        Pairing.AL_CONTROLLER_ON_OFF,
-        Pairing.AL_STATE_INDICATION,
-        Pairing.AL_MEASURED_TEMPERATURE,
-    ]
-
-    _input_refresh_pairings: list[Pairing] = [
-        Pairing.AL_ECO_ON_OFF,
-        Pairing.AL_CONTROLLER_ON_OFF_REQUEST,
-        Pairing.AL_INFO_ABSOLUTE_SET_POINT_REQUEST,
-    ]
-
-    _callback_attributes: list[str] = [
-        "state",
-        "requested_state",
-        "current_temperature",
-        "target_temperature",
-        "requested_target_temperature",
-        "eco_mode",
-        "requested_eco_mode",
-    ]
+    _update_from_inputs: bool = True
 
     def __init__(
         self,
@@ -142,37 +118,46 @@ class VirtualRoomTemperatureController(Base):
         await self._set_current_temperature_datapoint(str(value))
         self._current_temperature = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:  # noqa: PLR0911
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_ECO_ON_OFF.value:
-            self._requested_eco_mode = datapoint.get("value") == "1"
-            return "requested_eco_mode"
-        if datapoint.get("pairingID") == Pairing.AL_STATE_INDICATION.value:
-            self._eco_mode = int(datapoint.get("value")) & 0x04 == 0x04
-            return "eco_mode"
-        if datapoint.get("pairingID") == Pairing.AL_CONTROLLER_ON_OFF_REQUEST.value:
-            self._requested_state = datapoint.get("value") == "1"
-            return "requested_state"
-        if datapoint.get("pairingID") == Pairing.AL_CONTROLLER_ON_OFF.value:
-            self._state = datapoint.get("value") == "1"
-            return "state"
-        if (
-            datapoint.get("pairingID")
-            == Pairing.AL_INFO_ABSOLUTE_SET_POINT_REQUEST.value
-        ):
-            self._requested_target_temperature = float(datapoint.get("value"))
-            return "requested_target_temperature"
-        if datapoint.get("pairingID") == Pairing.AL_SET_POINT_TEMPERATURE.value:
-            self._target_temperature = float(datapoint.get("value"))
-            return "target_temperature"
-        if datapoint.get("pairingID") == Pairing.AL_MEASURED_TEMPERATURE.value:
-            self._current_temperature = float(datapoint.get("value"))
-            return "current_temperature"
-        return None
+    @datapoint_handler(Pairing.AL_SET_POINT_TEMPERATURE, "target_temperature")
+    def _refresh_target_temperature(self, value: str):
+        """Refresh the target temperature from a datapoint value."""
+        self._target_temperature = float(value)
+
+    @datapoint_handler(Pairing.AL_CONTROLLER_ON_OFF, "state")
+    def _refresh_on_off(self, value: str):
+        """Refresh the on/off state from a datapoint value."""
+        self._state = value == "1"
+
+    @datapoint_handler(Pairing.AL_STATE_INDICATION, "eco_mode")
+    def _refresh_eco_mode(self, value: str):
+        """Refresh the eco mode from the state indication datapoint value."""
+        self._eco_mode = int(value) & 0x04 == 0x04
+
+    @datapoint_handler(Pairing.AL_MEASURED_TEMPERATURE, "current_temperature")
+    def _refresh_current_temperature(self, value: str):
+        """Refresh the current temperature from a datapoint value."""
+        self._current_temperature = float(value)
+
+    @datapoint_handler(Pairing.AL_ECO_ON_OFF, "requested_eco_mode", refresh_from=None)
+    def _refresh_requested_eco_mode(self, value: str):
+        """Refresh the requested eco mode from a datapoint value."""
+        self._requested_eco_mode = value == "1"
+
+    @datapoint_handler(
+        Pairing.AL_CONTROLLER_ON_OFF_REQUEST, "requested_state", refresh_from=None
+    )
+    def _refresh_requested_state(self, value: str):
+        """Refresh the requested on/off state from a datapoint value."""
+        self._requested_state = value == "1"
+
+    @datapoint_handler(
+        Pairing.AL_INFO_ABSOLUTE_SET_POINT_REQUEST,
+        "requested_target_temperature",
+        refresh_from=None,
+    )
+    def _refresh_requested_target_temperature(self, value: str):
+        """Refresh the requested target temperature from a datapoint value."""
+        self._requested_target_temperature = float(value)
 
     async def _set_switching_datapoint(self, value: str):
         """Set the switching datapoint on the api."""
@@ -221,31 +206,3 @@ class VirtualRoomTemperatureController(Base):
             datapoint=_temp_output_id,
             value=value,
         )
-
-    def update_channel(self, datapoint_key: str, datapoint_value: str):
-        """Update the channel state."""
-        _LOGGER.info(
-            "%s received updated data: %s: %s",
-            self.channel_name,
-            datapoint_key,
-            datapoint_value,
-        )
-
-        _callback_attribute = None
-        _io_key = datapoint_key.rsplit("/", maxsplit=1)[-1]
-
-        if _io_key in self._outputs:
-            self._outputs[_io_key]["value"] = datapoint_value
-            _callback_attribute = self._refresh_state_from_datapoint(
-                datapoint=self._outputs[_io_key]
-            )
-
-        if _io_key in self._inputs:
-            self._inputs[_io_key]["value"] = datapoint_value
-            _callback_attribute = self._refresh_state_from_datapoint(
-                datapoint=self._inputs[_io_key]
-            )
-
-        if _callback_attribute and self._callbacks[_callback_attribute]:
-            for callback in self._callbacks[_callback_attribute]:
-                callback()
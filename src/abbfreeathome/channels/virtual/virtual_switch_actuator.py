@@ -1,32 +1,19 @@
 """Free@Home Virtual SwitchActuator class."""
 
 # import enum
-import logging
 from typing import TYPE_CHECKING, Any
 
 from ...bin.pairing import Pairing
-from ..base import Base
+from ..base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ...device import Device
 
-_LOGGER = logging.getLogger(__name__)
-
 
 class VirtualSwitchActuator(Base):
     """Free@Home Virtual SwitchActuator Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_INFO_ON_OFF,
-    ]
-
-    _input_refresh_pairings: list[Pairing] = [
-        Pairing.AL_SWITCH_ON_OFF,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-        "requested_state",
-    ]
+    _update_from_inputs: bool = True
 
     def __init__(
         self,
@@ -74,19 +61,15 @@ class VirtualSwitchActuator(Base):
         await self._set_switching_datapoint("0")
         self._state = False
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
+    @datapoint_handler(Pairing.AL_INFO_ON_OFF, "state")
+    def _refresh_on_off(self, value: str):
+        """Refresh the on/off state from a datapoint value."""
+        self._state = value == "1"
 
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_SWITCH_ON_OFF.value:
-            self._requested_state = datapoint.get("value") == "1"
-            return "requested_state"
-        if datapoint.get("pairingID") == Pairing.AL_INFO_ON_OFF.value:
-            self._state = datapoint.get("value") == "1"
-            return "state"
-        return None
+    @datapoint_handler(Pairing.AL_SWITCH_ON_OFF, "requested_state", refresh_from=None)
+    def _refresh_requested_state(self, value: str):
+        """Refresh the requested on/off state from a datapoint value."""
+        self._requested_state = value == "1"
 
     async def _set_switching_datapoint(self, value: str):
         """Set the switching datapoint on the api."""
@@ -99,30 +82,3 @@ class VirtualSwitchActuator(Base):
             datapoint=_switch_output_id,
             value=value,
         )
-
-    def update_channel(self, datapoint_key: str, datapoint_value: str):
-        """Update the device state."""
-        _LOGGER.info(
-            "%s received updated data: %s: %s",
-            self.channel_name,
-            datapoint_key,
-            datapoint_value,
-        )
-        _callback_attribute = None
-        _io_key = datapoint_key.rsplit("/", maxsplit=1)[-1]
-
-        if _io_key in self._outputs:
-            self._outputs[_io_key]["value"] = datapoint_value
-            _callback_attribute = self._refresh_state_from_datapoint(
-                datapoint=self._outputs[_io_key]
-            )
-
-        if _io_key in self._inputs:
-            self._inputs[_io_key]["value"] = datapoint_value
-            _callback_attribute = self._refresh_state_from_datapoint(
-                datapoint=self._inputs[_io_key]
-            )
-
-        if _callback_attribute and self._callbacks[_callback_attribute]:
-            for callback in self._callbacks[_callback_attribute]:
-                callback()
@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ...bin.pairing import Pairing
-from ..base import Base
+from ..base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ...device import Device
@@ -12,17 +12,6 @@ if TYPE_CHECKING:
 class VirtualWindSensor(Base):
     """Free@Home Virtual WindSensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_WIND_SPEED,
-        Pairing.AL_WIND_ALARM,
-        Pairing.AL_WIND_FORCE,
-    ]
-    _callback_attributes: list[str] = [
-        "speed",
-        "alarm",
-        "force",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -99,29 +88,26 @@ class VirtualWindSensor(Base):
         await self._set_force_datapoint(str(value))
         self._force = value
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_WIND_SPEED.value:
-            try:
-                self._speed = float(datapoint.get("value"))
-            except ValueError:
-                self._speed = 0.0
-            return "speed"
-        if datapoint.get("pairingID") == Pairing.AL_WIND_ALARM.value:
-            self._alarm = datapoint.get("value") == "1"
-            return "alarm"
-        if datapoint.get("pairingID") == Pairing.AL_WIND_FORCE.value:
-            try:
-                self._force = int(datapoint.get("value"))
-            except ValueError:
-                self._force = 0
-            return "force"
-
-        return None
+    @datapoint_handler(Pairing.AL_WIND_SPEED, "speed")
+    def _refresh_speed(self, value: str):
+        """Refresh the wind speed from a datapoint value."""
+        try:
+            self._speed = float(value)
+        except ValueError:
+            self._speed = 0.0
+
+    @datapoint_handler(Pairing.AL_WIND_ALARM, "alarm")
+    def _refresh_alarm(self, value: str):
+        """Refresh the wind alarm from a datapoint value."""
+        self._alarm = value == "1"
+
+    @datapoint_handler(Pairing.AL_WIND_FORCE, "force")
+    def _refresh_force(self, value: str):
+        """Refresh the wind force from a datapoint value."""
+        try:
+            self._force = int(value)
+        except ValueError:
+            self._force = 0
 
     async def _set_speed_datapoint(self, value: str):
         """Set the sensor datapoint on the api."""
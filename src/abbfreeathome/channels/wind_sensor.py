@@ -3,7 +3,7 @@
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -12,17 +12,6 @@ if TYPE_CHECKING:
 class WindSensor(Base):
     """Free@Home WindSensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_WIND_SPEED,
-        Pairing.AL_WIND_ALARM,
-        Pairing.AL_WIND_FORCE,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-        "alarm",
-        "force",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -65,19 +54,17 @@ class WindSensor(Base):
         """Get the force state of the sensor."""
         return self._force
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
+    @datapoint_handler(Pairing.AL_WIND_SPEED, "state")
+    def _refresh_speed(self, value: str):
+        """Refresh the wind speed from a datapoint value."""
+        self._state = float(value)
+
+    @datapoint_handler(Pairing.AL_WIND_ALARM, "alarm")
+    def _refresh_alarm(self, value: str):
+        """Refresh the wind alarm from a datapoint value."""
+        self._alarm = value == "1"
 
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_WIND_SPEED.value:
-            self._state = float(datapoint.get("value"))
-            return "state"
-        if datapoint.get("pairingID") == Pairing.AL_WIND_ALARM.value:
-            self._alarm = datapoint.get("value") == "1"
-            return "alarm"
-        if datapoint.get("pairingID") == Pairing.AL_WIND_FORCE.value:
-            self._force = int(datapoint.get("value"))
-            return "force"
-        return None
+    @datapoint_handler(Pairing.AL_WIND_FORCE, "force")
+    def _refresh_force(self, value: str):
+        """Refresh the wind force from a datapoint value."""
+        self._force = int(value)
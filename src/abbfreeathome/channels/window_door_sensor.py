@@ -4,7 +4,7 @@ import enum
 from typing import TYPE_CHECKING, Any
 
 from ..bin.pairing import Pairing
-from .base import Base
+from .base import Base, datapoint_handler
 
 if TYPE_CHECKING:
     from ..device import Device
@@ -26,14 +26,6 @@ class WindowDoorSensorPosition(enum.Enum):
 class WindowDoorSensor(Base):
     """Free@Home WindowDoorSensor Class."""
 
-    _state_refresh_pairings: list[Pairing] = [
-        Pairing.AL_WINDOW_DOOR,
-    ]
-    _callback_attributes: list[str] = [
-        "state",
-        "position",
-    ]
-
     def __init__(
         self,
         device: "Device",
@@ -70,19 +62,15 @@ class WindowDoorSensor(Base):
         """Get the sensor position."""
         return self._position.name
 
-    def _refresh_state_from_datapoint(self, datapoint: dict[str, Any]) -> str:
-        """
-        Refresh the state of the channel from a given output.
-
-        This will return the name of the attribute, which was refreshed or None.
-        """
-        if datapoint.get("pairingID") == Pairing.AL_WINDOW_DOOR.value:
-            self._state = datapoint.get("value") == "1"
-            return "state"
-        if datapoint.get("pairingID") == Pairing.AL_WINDOW_DOOR_POSITION.value:
-            try:
-                self._position = WindowDoorSensorPosition(datapoint.get("value"))
-            except ValueError:
-                self._position = WindowDoorSensorPosition.unknown
-            return "position"
-        return None
+    @datapoint_handler(Pairing.AL_WINDOW_DOOR, "state")
+    def _refresh_window_door(self, value: str):
+        """Refresh the open/closed state from a datapoint value."""
+        self._state = value == "1"
+
+    @datapoint_handler(Pairing.AL_WINDOW_DOOR_POSITION, "position", refresh_from=None)
+    def _refresh_position(self, value: str):
+        """Refresh the window/door position from a datapoint value."""
+        try:
+            self._position = WindowDoorSensorPosition(value)
+        except ValueError:
+            self._position = WindowDoorSensorPosition.unknown
@@ -0,0 +1,50 @@
+"""ABB-Free@Home JSON codec, using the fastest installed JSON library."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the installed packages
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the installed packages
+    msgspec = None
+
+if orjson is not None:
+    JSON_CODEC = "orjson"
+
+    def json_loads(data: str | bytes) -> Any:
+        """Decode a JSON document."""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        """Encode an object as JSON document."""
+        return orjson.dumps(obj).decode()
+
+elif msgspec is not None:  # pragma: no cover - depends on the installed packages
+    JSON_CODEC = "msgspec"
+
+    _msgspec_decoder = msgspec.json.Decoder()
+    _msgspec_encoder = msgspec.json.Encoder()
+
+    def json_loads(data: str | bytes) -> Any:
+        """Decode a JSON document."""
+        return _msgspec_decoder.decode(data)
+
+    def json_dumps(obj: Any) -> str:
+        """Encode an object as JSON document."""
+        return _msgspec_encoder.encode(obj).decode()
+
+else:  # pragma: no cover - depends on the installed packages
+    JSON_CODEC = "json"
+
+    def json_loads(data: str | bytes) -> Any:
+        """Decode a JSON document."""
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        """Encode an object as JSON document."""
+        return json.dumps(obj)
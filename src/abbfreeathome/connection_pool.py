@@ -0,0 +1,142 @@
+"""ABB-Free@Home HTTP connection pool shared by the api classes."""
+
+import asyncio
+import ssl
+
+from aiohttp import HttpVersion11, TCPConnector
+from aiohttp.client import ClientSession
+
+# Connection Pool Configuration
+DEFAULT_POOL_LIMIT = 10
+DEFAULT_POOL_LIMIT_PER_HOST = 5
+DEFAULT_POOL_KEEPALIVE_TIMEOUT = 15.0
+DEFAULT_POOL_TTL_DNS_CACHE = 300
+
+
+class ConnectionPool:
+    """Provides a client session and SSL contexts shared by the api classes."""
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_POOL_LIMIT,
+        limit_per_host: int = DEFAULT_POOL_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_POOL_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache: int | None = DEFAULT_POOL_TTL_DNS_CACHE,
+        keep_alive: bool = True,
+    ) -> None:
+        """
+        Initialize the ConnectionPool class.
+
+        Args:
+            limit: The maximum number of open connections.
+            limit_per_host: The maximum number of open connections to the SysAP.
+            keepalive_timeout: Seconds an idle connection is kept open for reuse.
+            ttl_dns_cache: Seconds a resolved host name is cached, None forever.
+            keep_alive: Whether connections are kept open between requests.
+                Requests are sent as HTTP/1.1, so a kept open connection
+                also reuses its TLS session.
+
+        """
+        self._limit: int = limit
+        self._limit_per_host: int = limit_per_host
+        self._keepalive_timeout: float = keepalive_timeout
+        self._ttl_dns_cache: int | None = ttl_dns_cache
+        self._keep_alive: bool = keep_alive
+        self._client_session: ClientSession | None = None
+        self._ssl_contexts: dict[tuple[bool, str | None], ssl.SSLContext | bool] = {}
+
+    async def __aenter__(self):
+        """Async enter and return self."""
+        return self
+
+    async def __aexit__(self, *_exc_info: object):
+        """Close the pooled connections."""
+        await self.close()
+
+    @property
+    def limit(self) -> int:
+        """Get the maximum number of open connections."""
+        return self._limit
+
+    @property
+    def limit_per_host(self) -> int:
+        """Get the maximum number of open connections to the SysAP."""
+        return self._limit_per_host
+
+    @property
+    def keepalive_timeout(self) -> float:
+        """Get the seconds an idle connection is kept open for reuse."""
+        return self._keepalive_timeout
+
+    @property
+    def ttl_dns_cache(self) -> int | None:
+        """Get the seconds a resolved host name is cached."""
+        return self._ttl_dns_cache
+
+    @property
+    def keep_alive(self) -> bool:
+        """Get whether connections are kept open between requests."""
+        return self._keep_alive
+
+    async def close(self):
+        """Close the client session of the pool."""
+        if self._client_session is not None:
+            await self._client_session.close()
+            self._client_session = None
+
+    def get_client_session(self) -> ClientSession:
+        """Get the aiohttp ClientSession object of the pool."""
+        if self._client_session is None or self._client_session.closed:
+            if self._keep_alive:
+                _tcp_connector = TCPConnector(
+                    limit=self._limit,
+                    limit_per_host=self._limit_per_host,
+                    ttl_dns_cache=self._ttl_dns_cache,
+                    keepalive_timeout=self._keepalive_timeout,
+                )
+            else:
+                _tcp_connector = TCPConnector(
+                    limit=self._limit,
+                    limit_per_host=self._limit_per_host,
+                    ttl_dns_cache=self._ttl_dns_cache,
+                    force_close=True,
+                )
+
+            self._client_session = ClientSession(
+                connector=_tcp_connector, version=HttpVersion11
+            )
+
+        return self._client_session
+
+    async def get_ssl_context(
+        self, verify_ssl: bool, ssl_cert_ca_file: str | None = None
+    ) -> ssl.SSLContext | bool:
+        """Get the SSL context for requests, shared by all users of the pool."""
+        _key = (verify_ssl, ssl_cert_ca_file)
+        if _key not in self._ssl_contexts:
+            self._ssl_contexts[_key] = await create_ssl_context(
+                verify_ssl, ssl_cert_ca_file
+            )
+
+        return self._ssl_contexts[_key]
+
+
+async def create_ssl_context(
+    verify_ssl: bool, ssl_cert_ca_file: str | None = None
+) -> ssl.SSLContext | bool:
+    """Create the SSL context for requests."""
+    if not verify_ssl:
+        return False
+
+    if ssl_cert_ca_file:
+        # Run SSL context creation in executor to avoid blocking the event loop
+        return await asyncio.get_running_loop().run_in_executor(
+            None, _create_ssl_context_sync, ssl_cert_ca_file
+        )
+
+    return True
+
+
+def _create_ssl_context_sync(cafile: str) -> ssl.SSLContext:
+    """Create SSL context synchronously (for use in executor)."""
+    return ssl.create_default_context(cafile=cafile)
@@ -0,0 +1,70 @@
+"""ABB-Free@Home rate limiting of channel callbacks."""
+
+import asyncio
+from collections.abc import Callable
+import math
+
+
+class CallbackDebouncer:
+    """Limits the rate of a callback, collapsing bursts of calls into one."""
+
+    def __init__(self, callback: Callable[[], None], interval: float) -> None:
+        """
+        Initialize the CallbackDebouncer class.
+
+        Args:
+            callback: The callback to limit the rate of.
+            interval: The minimum seconds between two calls of the callback.
+
+        """
+        self._callback: Callable[[], None] = callback
+        self._interval: float = interval
+        self._last_call: float = -math.inf
+        self._handle: asyncio.TimerHandle | None = None
+
+    @property
+    def interval(self) -> float:
+        """Get the minimum seconds between two calls of the callback."""
+        return self._interval
+
+    @property
+    def pending(self) -> bool:
+        """Get whether a call is scheduled at the end of the interval."""
+        return self._handle is not None
+
+    def trigger(self):
+        """Call the callback now, or at the end of the interval if called recently."""
+        try:
+            _loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Without an event loop nothing can be scheduled
+            self._callback()
+            return
+
+        # A call is already scheduled, which will see the latest state
+        if self._handle is not None:
+            return
+
+        _delay = self._last_call + self._interval - _loop.time()
+        if _delay <= 0:
+            self._call()
+        else:
+            self._handle = _loop.call_later(_delay, self._call)
+
+    def flush(self):
+        """Make a scheduled call right away."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._call()
+
+    def cancel(self):
+        """Cancel a scheduled call."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _call(self):
+        """Call the callback, recording the time of the call."""
+        self._handle = None
+        self._last_call = asyncio.get_running_loop().time()
+        self._callback()
@@ -1,12 +1,16 @@
 """ABB-Free@Home Device class."""
 
+from collections.abc import Callable
 from typing import Any
 
 from .api import FreeAtHomeApi
 from .bin.function import Function
 from .bin.interface import Interface
+from .bin.parameter import Parameter, build_parameter_index
+from .callback_executor import CallbackExecutor
 from .channels.base import Base
 from .const import FUNCTION_CHANNEL_MAPPING, FUNCTION_VIRTUAL_CHANNEL_MAPPING
+from .exceptions import InvalidDeviceParameter
 from .floorplan import Floorplan
 
 
@@ -31,8 +35,22 @@ class Device:
         native_id: str | None = None,
         parameters: dict[str, dict[str, Any]] | None = None,
         channels_data: dict[str, dict] | None = None,
+        lazy_channels: bool = False,
+        channel_classes: list[type[Base]] | None = None,
+        include_orphan_channels: bool = True,
+        callback_executor: CallbackExecutor | None = None,
+        event_listener: Callable[[Base, str], None] | None = None,
     ) -> None:
-        """Initialize the Device class."""
+        """
+        Initialize the Device class.
+
+        With lazy_channels the channel objects are only created on first access,
+        through the channels property or get_channel. Channels not of one of the
+        channel_classes, or without floor and room unless include_orphan_channels,
+        are skipped when loading channels. The callbacks of the channels are run by
+        the callback_executor, if given, and every change is passed to the
+        event_listener of the channels.
+        """
         self._device_serial = device_serial
         self._device_id = device_id
         self._display_name = display_name
@@ -47,8 +65,17 @@ class Device:
         self._device_reboots = device_reboots
         self._native_id = native_id
         self._parameters = parameters or {}
+        self._parameter_index = build_parameter_index(self._parameters)
         self._channels_data = channels_data or {}
         self._channels: dict[str, Base] = {}
+        self._lazy_channels: bool = lazy_channels
+        self._pending_channels: dict[str, type[Base]] = {}
+        self._mapped_channel_count: int = 0
+        self._channel_classes: list[type[Base]] | None = channel_classes
+        self._include_orphan_channels: bool = include_orphan_channels
+        self._floorplan: Floorplan | None = None
+        self._callback_executor: CallbackExecutor | None = callback_executor
+        self._event_listener: Callable[[Base, str], None] | None = event_listener
 
         # Expose api as public attribute
         self.api: FreeAtHomeApi = api
@@ -131,6 +158,8 @@ class Device:
     @property
     def channels(self) -> dict[str, Base]:
         """Return the device channels."""
+        if self._pending_channels:
+            self._create_pending_channels()
         return self._channels
 
     @property
@@ -141,18 +170,109 @@ class Device:
     @property
     def is_multi_device(self) -> bool:
         """Return True if this is a multi-device."""
+        # Counts all channels with a channel class, regardless of the filters
         return (
             self._floor is None
             and self._room is None
-            and len(self._channels.keys()) > 1
+            and self._mapped_channel_count > 1
         )
 
+    def get_device_parameter(self, parameter: Parameter) -> tuple[str, Any]:
+        """Get the device parameter value by its name."""
+        try:
+            return self._parameter_index[parameter.value]
+        except KeyError:
+            raise InvalidDeviceParameter(self.device_serial, parameter.name) from None
+
+    def get_channel(self, channel_id: str) -> Base | None:
+        """Get a channel by its id, creating it if not created yet."""
+        _channel = self._channels.get(channel_id)
+        if _channel is None and channel_id in self._pending_channels:
+            _channel = self._create_channel(
+                channel_id, self._pending_channels.pop(channel_id)
+            )
+            self._channels[channel_id] = _channel
+
+        return _channel
+
+    def get_channel_class(self, channel_id: str) -> type[Base] | None:
+        """Get the class of a channel by its id, without creating the channel."""
+        _channel = self._channels.get(channel_id)
+        if _channel is not None:
+            return type(_channel)
+        return self._pending_channels.get(channel_id)
+
+    def get_channel_classes(self) -> dict[str, type[Base]]:
+        """Get the class of every loaded channel by its id, without creating them."""
+        return {
+            channel_id: _channel_class
+            for channel_id in self._channels_data
+            if (_channel_class := self.get_channel_class(channel_id)) is not None
+        }
+
+    def remove_channel(self, channel_id: str) -> bool:
+        """Remove a channel by its id, without creating it if not created yet."""
+        _channel = self._channels.pop(channel_id, None)
+        if _channel is not None:
+            _channel.set_event_listener(None)
+        _channel_class = self._pending_channels.pop(channel_id, None)
+        return _channel is not None or _channel_class is not None
+
     def clear_channels(self):
         """Clear channels from the device."""
         self._channels.clear()
+        self._pending_channels.clear()
+
+    def update_configuration(
+        self,
+        device_id: str,
+        display_name: str,
+        floorplan: Floorplan,
+        unresponsive: bool = False,
+        unresponsive_counter: int = 0,
+        defect: bool = False,
+        floor: str | None = None,
+        room: str | None = None,
+        floor_name: str | None = None,
+        room_name: str | None = None,
+        device_reboots: str | None = None,
+        native_id: str | None = None,
+        parameters: dict[str, dict[str, Any]] | None = None,
+        channels_data: dict[str, dict] | None = None,
+    ):
+        """
+        Update the device in place from changed configuration data.
+
+        Channels keeping their channel class are updated in place, so their
+        registered callbacks are kept.
+        """
+        self._device_id = device_id
+        self._display_name = display_name
+        self._unresponsive = unresponsive
+        self._unresponsive_counter = unresponsive_counter
+        self._defect = defect
+        self._floor = floor
+        self._room = room
+        self._floor_name = floor_name
+        self._room_name = room_name
+        self._device_reboots = device_reboots
+        self._native_id = native_id
+        self._parameters = parameters or {}
+        self._parameter_index = build_parameter_index(self._parameters)
+        self._channels_data = channels_data or {}
+
+        self.load_channels(floorplan=floorplan)
 
     def load_channels(self, floorplan: Floorplan):
-        """Load the channels object."""
+        """
+        Load the channels object.
+
+        Already loaded channels with an unchanged channel class are updated in
+        place instead of being replaced. With lazy channels, any other channels
+        are only created on first access.
+        """
+        self._floorplan = floorplan
+
         # Select appropriate mapping based on virtual status
         _function_channel_mapping = (
             FUNCTION_VIRTUAL_CHANNEL_MAPPING
@@ -161,7 +281,9 @@ class Device:
         )
 
         # Create channels dictionary
-        self.clear_channels()
+        _channels = {}
+        _pending_channels = {}
+        self._mapped_channel_count = 0
         for channel_id, channel_data in self._channels_data.items():
             # Determine channel class based on function ID
             _function_id = channel_data.get("functionID")
@@ -177,36 +299,92 @@ class Device:
             if not _channel_class:
                 continue
 
-            # Create the Channel object
-            _channel_name = channel_data.get("displayName", f"Channel {channel_id}")
-            if _channel_name in ["Ⓐ", "ⓑ"] or _channel_name is None:
-                _channel_name = self.display_name
+            self._mapped_channel_count += 1
 
-            # Get floor and room names
-            _channel_floor_name = floorplan.get_floor_name(
-                floor_id=channel_data.get("floor")
-            )
-            _channel_room_name = floorplan.get_room_name(
-                floor_id=channel_data.get("floor"), room_id=channel_data.get("room")
-            )
+            # Skip any channels not on the Free@Home floorplan
+            if (
+                not self._include_orphan_channels
+                and not channel_data.get("floor")
+                and not channel_data.get("room")
+            ):
+                continue
 
-            _channel = _channel_class(
-                device=self,
-                channel_id=channel_id,
-                channel_name=_channel_name,
-                inputs=channel_data.get("inputs", {}),
-                outputs=channel_data.get("outputs", {}),
-                parameters=channel_data.get("parameters", {}),
-                floor_name=_channel_floor_name or self.floor_name,
-                room_name=_channel_room_name or self.room_name,
-            )
+            # Skip channels filtered by class before creating them
+            if self._channel_classes and _channel_class not in self._channel_classes:
+                continue
+
+            # Update an existing channel of the same class in place
+            _channel = self._channels.get(channel_id)
+            if type(_channel) is _channel_class:
+                _channel.update_configuration(**self._get_channel_config(channel_id))
+            elif self._lazy_channels:
+                _pending_channels[channel_id] = _channel_class
+                continue
+            else:
+                _channel = self._create_channel(channel_id, _channel_class)
 
             # Assign channel to channel cache
-            self._channels[channel_id] = _channel
+            _channels[channel_id] = _channel
+
+        # Replaced or removed channels no longer pass on their changes
+        for channel_id, _channel in self._channels.items():
+            if _channels.get(channel_id) is not _channel:
+                _channel.set_event_listener(None)
+
+        self._channels.clear()
+        self._channels.update(_channels)
+        self._pending_channels = _pending_channels
 
         # Return the channels dictionary
         return self._channels
 
+    def _create_channel(self, channel_id: str, channel_class: type[Base]) -> Base:
+        """Create the Channel object."""
+        _channel = channel_class(
+            device=self, channel_id=channel_id, **self._get_channel_config(channel_id)
+        )
+        _channel.set_callback_executor(self._callback_executor)
+        _channel.set_event_listener(self._event_listener)
+        return _channel
+
+    def _create_pending_channels(self):
+        """Create all channels not created yet, in the order of the channels data."""
+        for channel_id in list(self._pending_channels):
+            self.get_channel(channel_id)
+
+        _channels = {
+            channel_id: self._channels[channel_id]
+            for channel_id in self._channels_data
+            if channel_id in self._channels
+        }
+        self._channels.clear()
+        self._channels.update(_channels)
+
+    def _get_channel_config(self, channel_id: str) -> dict[str, Any]:
+        """Get the arguments of a channel class from the channel data."""
+        channel_data = self._channels_data[channel_id]
+
+        _channel_name = channel_data.get("displayName", f"Channel {channel_id}")
+        if _channel_name in ["Ⓐ", "ⓑ"] or _channel_name is None:
+            _channel_name = self.display_name
+
+        # Get floor and room names
+        _channel_floor_name = self._floorplan.get_floor_name(
+            floor_id=channel_data.get("floor")
+        )
+        _channel_room_name = self._floorplan.get_room_name(
+            floor_id=channel_data.get("floor"), room_id=channel_data.get("room")
+        )
+
+        return {
+            "channel_name": _channel_name,
+            "inputs": channel_data.get("inputs", {}),
+            "outputs": channel_data.get("outputs", {}),
+            "parameters": channel_data.get("parameters", {}),
+            "floor_name": _channel_floor_name or self.floor_name,
+            "room_name": _channel_room_name or self.room_name,
+        }
+
     def __repr__(self) -> str:
         """Return a string representation of the device."""
         return (
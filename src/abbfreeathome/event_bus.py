@@ -0,0 +1,183 @@
+"""ABB-Free@Home event bus for channel state changes."""
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .callback_executor import CallbackExecutor
+from .channels.base import Base
+
+if TYPE_CHECKING:
+    from .device import Device
+
+
+class ChannelEvent(NamedTuple):
+    """A change of a channel attribute."""
+
+    channel_serial: str
+    channel: Base
+    callback_attribute: str
+
+    @property
+    def value(self) -> Any:
+        """Get the current value of the changed attribute."""
+        return getattr(self.channel, self.callback_attribute, None)
+
+
+class EventSubscription:
+    """A subscription to the changes of the channels matching its filters."""
+
+    def __init__(
+        self,
+        callback: Callable[[ChannelEvent], Any],
+        channel_class: type[Base] | None = None,
+        callback_attribute: str | None = None,
+        floor_id: str | None = None,
+        room_id: str | None = None,
+        device_serial: str | None = None,
+    ) -> None:
+        """
+        Initialize the EventSubscription class.
+
+        Args:
+            callback: Called with a ChannelEvent for every matching change,
+                may be a coroutine function.
+            channel_class: Only channels of this class, or its subclasses.
+            callback_attribute: Only changes of this attribute.
+            floor_id: Only channels on this floor.
+            room_id: Only channels in this room.
+            device_serial: Only channels of this device.
+
+        """
+        self.callback: Callable[[ChannelEvent], Any] = callback
+        self.channel_class: type[Base] | None = channel_class
+        self.callback_attribute: str | None = callback_attribute
+        self.floor_id: str | None = floor_id
+        self.room_id: str | None = room_id
+        self.device_serial: str | None = device_serial
+
+    def matches(
+        self,
+        channel_class: type[Base],
+        device_serial: str,
+        floor_id: str | None,
+        room_id: str | None,
+    ) -> bool:
+        """Return whether the filters match a channel of a class and location."""
+        return (
+            (
+                self.channel_class is None
+                or issubclass(channel_class, self.channel_class)
+            )
+            and (
+                self.callback_attribute is None
+                or self.callback_attribute in channel_class.get_callback_attributes()
+            )
+            and (self.floor_id is None or self.floor_id == floor_id)
+            and (self.room_id is None or self.room_id == room_id)
+            and (self.device_serial is None or self.device_serial == device_serial)
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the subscription."""
+        return (
+            f"EventSubscription(channel_class={self.channel_class}, "
+            f"callback_attribute={self.callback_attribute}, "
+            f"floor_id={self.floor_id}, room_id={self.room_id}, "
+            f"device_serial={self.device_serial})"
+        )
+
+
+class EventBus:
+    """
+    Routes channel changes to the subscriptions matching the channel.
+
+    The channels are added by their class, so channels not created yet, e.g. lazy
+    channels, are routed without creating them.
+    """
+
+    def __init__(self, executor: CallbackExecutor) -> None:
+        """Initialize the EventBus class."""
+        self._executor: CallbackExecutor = executor
+        self._subscriptions: dict[EventSubscription, set[str]] = {}
+        self._channels: dict[
+            str, tuple[Device, type[Base], str | None, str | None]
+        ] = {}
+
+        # Subscriptions by channel serial and attribute, None for every attribute
+        self._routes: dict[str, dict[str | None, list[EventSubscription]]] = {}
+
+    def subscribe(self, subscription: EventSubscription):
+        """Add a subscription, routing the matching channels to it."""
+        self._subscriptions[subscription] = set()
+
+        for _channel_serial, _channel in self._channels.items():
+            _device, _channel_class, _floor_id, _room_id = _channel
+            if subscription.matches(
+                _channel_class, _device.device_serial, _floor_id, _room_id
+            ):
+                self._add_route(_channel_serial, subscription)
+
+    def unsubscribe(self, subscription: EventSubscription):
+        """Remove a subscription."""
+        for _channel_serial in self._subscriptions.pop(subscription, ()):
+            _routes = self._routes[_channel_serial]
+            _subscriptions = _routes[subscription.callback_attribute]
+            _subscriptions.remove(subscription)
+
+            if not _subscriptions:
+                del _routes[subscription.callback_attribute]
+            if not _routes:
+                del self._routes[_channel_serial]
+
+    def add_channel(
+        self,
+        channel_serial: str,
+        device: "Device",
+        channel_class: type[Base],
+        floor_id: str | None,
+        room_id: str | None,
+    ):
+        """Add a channel of a device, routing it to the matching subscriptions."""
+        self.remove_channel(channel_serial)
+        self._channels[channel_serial] = (device, channel_class, floor_id, room_id)
+
+        for _subscription in self._subscriptions:
+            if _subscription.matches(
+                channel_class, device.device_serial, floor_id, room_id
+            ):
+                self._add_route(channel_serial, _subscription)
+
+    def remove_channel(self, channel_serial: str):
+        """Remove a channel, the subscriptions are kept."""
+        if self._channels.pop(channel_serial, None) is None:
+            return
+
+        for _subscriptions in self._routes.pop(channel_serial, {}).values():
+            for _subscription in _subscriptions:
+                self._subscriptions[_subscription].discard(channel_serial)
+
+    def clear_channels(self):
+        """Remove all channels, the subscriptions are kept."""
+        for _channel_serial in list(self._channels):
+            self.remove_channel(_channel_serial)
+
+    def publish(self, channel: Base, callback_attribute: str):
+        """Pass the change of a channel attribute to the matching subscriptions."""
+        _channel_serial = f"{channel.device_serial}/{channel.channel_id}"
+        _routes = self._routes.get(_channel_serial)
+
+        # Ignore the channels of a device, which has been reloaded since
+        if not _routes or self._channels[_channel_serial][0] is not channel.device:
+            return
+
+        _event = ChannelEvent(_channel_serial, channel, callback_attribute)
+        for _subscriptions in (_routes.get(callback_attribute), _routes.get(None)):
+            for _subscription in _subscriptions or ():
+                self._executor.submit(_subscription.callback, _event)
+
+    def _add_route(self, channel_serial: str, subscription: EventSubscription):
+        """Route the changes of a channel to a subscription."""
+        self._routes.setdefault(channel_serial, {}).setdefault(
+            subscription.callback_attribute, []
+        ).append(subscription)
+        self._subscriptions[subscription].add(channel_serial)
@@ -103,6 +103,19 @@ class InvalidDeviceChannelParameter(FreeAtHomeException):
         super().__init__(self.message)
 
 
+class InvalidDeviceParameter(FreeAtHomeException):
+    """Raise an exception for an invalid device parameter id."""
+
+    def __init__(self, device_serial: str, parameter_value: int) -> None:
+        """Initialze the InvalidDeviceParameter class."""
+        self.message = (
+            f"Could not find parameter id for "
+            f"device: {device_serial}; "
+            f"parameter id: {parameter_value}"
+        )
+        super().__init__(self.message)
+
+
 class UserNotFoundException(FreeAtHomeException):
     """Raise an exception if a user is not found."""
 
@@ -149,3 +162,29 @@ class BadRequestException(FreeAtHomeException):
         """Initialze the BadRequestException class."""
         self.message = f"Bad Request with data: {data}"
         super().__init__(self.message)
+
+
+class QueueFullException(FreeAtHomeException):
+    """Raise an exception when a bounded background queue is full."""
+
+    def __init__(self, name: str, max_size: int) -> None:
+        """Initialize the QueueFullException class."""
+        self.message = f"{name.capitalize()} is full; max size: {max_size}"
+        super().__init__(self.message)
+
+
+class WriteQueueFullException(QueueFullException):
+    """Raise an exception when the background write queue is full."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the WriteQueueFullException class."""
+        super().__init__("background write queue", max_size)
+
+
+class InvalidChannelCommandException(FreeAtHomeException):
+    """Raise an exception when a channel does not support a group command."""
+
+    def __init__(self, channel_name: str, command: str) -> None:
+        """Initialize the InvalidChannelCommandException class."""
+        self.message = f"Channel {channel_name} does not support command: {command}"
+        super().__init__(self.message)
@@ -1,5 +1,10 @@
 """ABB-Free@Home FloorPlan class for managing floor and room data."""
 
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .device import Device
+
 
 class Floorplan:
     """Manages floor plan data for Free@Home devices and channels."""
@@ -63,3 +68,113 @@ class Floorplan:
                 _room_count += len(_rooms)
 
         return f"Floorplan(floors={_floor_count}, rooms={_room_count})"
+
+
+class FloorplanIndex:
+    """Maps the floors and rooms of the floor plan to devices and channel serials."""
+
+    def __init__(self) -> None:
+        """Initialize the FloorplanIndex class."""
+        self._devices: dict[str | None, dict[str | None, dict[str, Device]]] = {}
+        self._channels: dict[str | None, dict[str | None, dict[str, None]]] = {}
+        self._device_locations: dict[str, tuple[str | None, str | None]] = {}
+        self._channel_locations: dict[str, tuple[str | None, str | None]] = {}
+
+    def add_device(self, device: "Device"):
+        """Add a device by its floor and room."""
+        self.remove_device(device.device_serial)
+
+        _location = (device.floor, device.room)
+        self._device_locations[device.device_serial] = _location
+        self._add(self._devices, _location, device.device_serial, device)
+
+    def remove_device(self, device_serial: str):
+        """Remove a device."""
+        _location = self._device_locations.pop(device_serial, None)
+        if _location is not None:
+            self._remove(self._devices, _location, device_serial)
+
+    def add_channel(
+        self,
+        channel_serial: str,
+        floor_id: str | None = None,
+        room_id: str | None = None,
+    ):
+        """Add a channel serial by its floor and room."""
+        self.remove_channel(channel_serial)
+
+        _location = (floor_id, room_id)
+        self._channel_locations[channel_serial] = _location
+        self._add(self._channels, _location, channel_serial, None)
+
+    def remove_channel(self, channel_serial: str):
+        """Remove a channel."""
+        _location = self._channel_locations.pop(channel_serial, None)
+        if _location is not None:
+            self._remove(self._channels, _location, channel_serial)
+
+    def clear_devices(self):
+        """Clear all devices."""
+        self._devices.clear()
+        self._device_locations.clear()
+
+    def clear_channels(self):
+        """Clear all channels."""
+        self._channels.clear()
+        self._channel_locations.clear()
+
+    def get_devices_by_floor(self, floor_id: str | None) -> list["Device"]:
+        """Get the devices on a floor, in any room."""
+        return [
+            _device
+            for _devices in self._devices.get(floor_id, {}).values()
+            for _device in _devices.values()
+        ]
+
+    def get_devices_by_room(
+        self, floor_id: str | None, room_id: str | None
+    ) -> list["Device"]:
+        """Get the devices in a room."""
+        return list(self._devices.get(floor_id, {}).get(room_id, {}).values())
+
+    def get_channel_serials_by_floor(self, floor_id: str | None) -> list[str]:
+        """Get the serials of the channels on a floor, in any room."""
+        return [
+            _channel_serial
+            for _channels in self._channels.get(floor_id, {}).values()
+            for _channel_serial in _channels
+        ]
+
+    def get_channel_serials_by_room(
+        self, floor_id: str | None, room_id: str | None
+    ) -> list[str]:
+        """Get the serials of the channels in a room."""
+        return list(self._channels.get(floor_id, {}).get(room_id, {}))
+
+    @staticmethod
+    def _add(
+        index: dict[str | None, dict[str | None, dict[str, Any]]],
+        location: tuple[str | None, str | None],
+        key: str,
+        value: Any,
+    ):
+        """Add a value to a floor and room index."""
+        _floor_id, _room_id = location
+        index.setdefault(_floor_id, {}).setdefault(_room_id, {})[key] = value
+
+    @staticmethod
+    def _remove(
+        index: dict[str | None, dict[str | None, dict[str, Any]]],
+        location: tuple[str | None, str | None],
+        key: str,
+    ):
+        """Remove a value from a floor and room index, dropping empty entries."""
+        _floor_id, _room_id = location
+        _rooms = index[_floor_id]
+        _values = _rooms[_room_id]
+        del _values[key]
+
+        if not _values:
+            del _rooms[_room_id]
+        if not _rooms:
+            del index[_floor_id]
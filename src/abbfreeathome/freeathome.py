@@ -1,10 +1,45 @@
 """ABB-Free@Home wrapper for interacting with the ABB-free@home API."""
 
+import asyncio
+from collections.abc import Callable, Iterable
+import logging
+from typing import Any
+
 from .api import FreeAtHomeApi
 from .bin.interface import Interface
+from .callback_executor import (
+    DEFAULT_CALLBACK_MAX_CONCURRENCY,
+    DEFAULT_CALLBACK_MAX_PENDING,
+    CallbackExecutor,
+)
+from .channel_index import ChannelIndex
 from .channels.base import Base
 from .device import Device
-from .floorplan import Floorplan
+from .event_bus import ChannelEvent, EventBus, EventSubscription
+from .exceptions import FreeAtHomeException
+from .floorplan import Floorplan, FloorplanIndex
+from .message import WebsocketMessage
+from .receive_queue import (
+    DEFAULT_RECEIVE_QUEUE_DISPATCHERS,
+    DEFAULT_RECEIVE_QUEUE_MAX_SIZE,
+    ReceiveQueueOverflowPolicy,
+)
+from .scheduler import (
+    DEFAULT_COMMAND_MAX_CONCURRENCY,
+    DEFAULT_REFRESH_MAX_CONCURRENCY,
+    DEFAULT_REFRESH_REQUEST_RATE,
+    CommandScheduler,
+    RefreshScheduler,
+)
+from .snapshot import ConfigurationSnapshot
+from .ws_supervisor import (
+    DEFAULT_WS_RECONNECT_MAX_INTERVAL,
+    DEFAULT_WS_RECONNECT_MIN_INTERVAL,
+    DEFAULT_WS_STABLE_CONNECTION_INTERVAL,
+    WebsocketSupervisor,
+)
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class FreeAtHome:
@@ -16,17 +51,72 @@ class FreeAtHome:
         interfaces: list[Interface] | None = None,
         channel_classes: list[type[Base]] | None = None,
         include_orphan_channels: bool = False,
+        refresh_max_concurrency: int = DEFAULT_REFRESH_MAX_CONCURRENCY,
+        refresh_request_rate: float = DEFAULT_REFRESH_REQUEST_RATE,
+        snapshot: ConfigurationSnapshot | None = None,
+        lazy_channels: bool = False,
+        command_max_concurrency: int = DEFAULT_COMMAND_MAX_CONCURRENCY,
+        ws_reconnect_min_interval: float = DEFAULT_WS_RECONNECT_MIN_INTERVAL,
+        ws_reconnect_max_interval: float = DEFAULT_WS_RECONNECT_MAX_INTERVAL,
+        ws_stable_connection_interval: float = DEFAULT_WS_STABLE_CONNECTION_INTERVAL,
+        ws_receive_queue_max_size: int = DEFAULT_RECEIVE_QUEUE_MAX_SIZE,
+        ws_receive_queue_dispatchers: int = DEFAULT_RECEIVE_QUEUE_DISPATCHERS,
+        ws_receive_queue_overflow_policy: ReceiveQueueOverflowPolicy = (
+            ReceiveQueueOverflowPolicy.block
+        ),
+        callback_max_concurrency: int = DEFAULT_CALLBACK_MAX_CONCURRENCY,
+        callback_max_pending: int = DEFAULT_CALLBACK_MAX_PENDING,
     ) -> None:
         """Initialize the FreeAtHome class."""
         self._config: dict | None = None
         self._devices: dict[str, Device] = {}
         self._filtered_channels: dict[str, Base] | None = None
+        self._channel_entries: dict[str, tuple[Device, str, type[Base]]] = {}
+        self._floorplan: Floorplan = Floorplan()
+        self._datapoint_routes: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._channel_index: ChannelIndex = ChannelIndex()
+        self._floorplan_index: FloorplanIndex = FloorplanIndex()
 
         self.api: FreeAtHomeApi = api
 
         self._interfaces: list[Interface] | None = interfaces
         self._channel_classes: list[type[Base]] | None = channel_classes
         self._include_orphan_channels: bool = include_orphan_channels
+        self._lazy_channels: bool = lazy_channels
+        self._refresh_scheduler: RefreshScheduler = RefreshScheduler(
+            max_concurrency=refresh_max_concurrency,
+            request_rate=refresh_request_rate,
+        )
+        self._command_scheduler: CommandScheduler = CommandScheduler(
+            max_concurrency=command_max_concurrency
+        )
+        self._snapshot: ConfigurationSnapshot | None = snapshot
+        self._revalidate_task: asyncio.Task | None = None
+        self._callback_executor: CallbackExecutor = CallbackExecutor(
+            max_concurrency=callback_max_concurrency, max_pending=callback_max_pending
+        )
+        self._event_bus: EventBus = EventBus(executor=self._callback_executor)
+        self._ws_supervisor: WebsocketSupervisor = WebsocketSupervisor(
+            api=api,
+            callback=self.update,
+            on_reconnect=self._resync,
+            reconnect_min_interval=ws_reconnect_min_interval,
+            reconnect_max_interval=ws_reconnect_max_interval,
+            stable_connection_interval=ws_stable_connection_interval,
+            receive_queue_max_size=ws_receive_queue_max_size,
+            receive_queue_dispatchers=ws_receive_queue_dispatchers,
+            receive_queue_overflow_policy=ws_receive_queue_overflow_policy,
+        )
+
+    @property
+    def callback_executor(self) -> CallbackExecutor:
+        """Get the executor running the callbacks of the channels."""
+        return self._callback_executor
+
+    @property
+    def ws_supervisor(self) -> WebsocketSupervisor:
+        """Get the supervisor of the websocket connection."""
+        return self._ws_supervisor
 
     def clear_channels(self):
         """Clear all channels in the devices."""
@@ -37,31 +127,77 @@ class FreeAtHome:
     def clear_devices(self):
         """Clear all devices in the devices list."""
         self._devices.clear()
+        self._floorplan_index.clear_devices()
         self._filtered_channels = None
 
+    async def execute(
+        self,
+        channels: list[Base],
+        command: str,
+        *args: Any,
+        notify_callbacks: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, FreeAtHomeException | None]:
+        """
+        Run a command on many channels concurrently, e.g. "turn_off".
+
+        The command is a coroutine method of the channels, called with the given
+        arguments. At most command_max_concurrency commands run at once, across
+        all calls. With notify_callbacks the callbacks of the attributes changed
+        by the command are called. Returns the result per channel, which is None
+        on success or the exception raised.
+        """
+        return await self._command_scheduler.execute(
+            channels, command, *args, notify_callbacks=notify_callbacks, **kwargs
+        )
+
     def get_channels(self) -> dict[str, Base]:
-        """Get channels from all devices based on class filters."""
-        if self._filtered_channels is None:
-            self._filtered_channels = self._build_filtered_channels()
+        """
+        Get channels from all devices based on class filters.
+
+        With lazy channels this creates all channels, the get_channels_by_*
+        methods only create the channels they return.
+        """
+        self._index_channels()
+        if len(self._filtered_channels) < len(self._channel_entries):
+            self._get_channels(self._channel_entries)
+
         return self._filtered_channels
 
     def get_channels_by_device(self, device_serial: str) -> list[Base]:
         """Get the list of channels by device."""
-        _channels = self.get_channels()
-        return [
-            _channel
-            for key, _channel in _channels.items()
-            if key.startswith(f"{device_serial}/")
-        ]
-
-    def get_channels_by_class(self, channel_class: Base) -> list[Base]:
-        """Get the list of channels by class."""
-        _channels = self.get_channels()
-        return [
-            _channel
-            for _channel in _channels.values()
-            if type(_channel) is channel_class
-        ]
+        self._index_channels()
+        return self._get_channels(self._channel_index.get_by_device(device_serial))
+
+    def get_channels_by_class(
+        self, channel_class: type[Base], include_subclasses: bool = False
+    ) -> list[Base]:
+        """Get the list of channels by class, optionally including subclasses."""
+        self._index_channels()
+        return self._get_channels(
+            self._channel_index.get_by_class(channel_class, include_subclasses)
+        )
+
+    def get_channels_by_interface(self, interface: Interface) -> list[Base]:
+        """Get the list of channels by the interface of their device."""
+        self._index_channels()
+        return self._get_channels(self._channel_index.get_by_interface(interface))
+
+    def get_channels_by_floor(self, floor_id: str | None) -> list[Base]:
+        """Get the list of channels on a floor, in any room."""
+        self._index_channels()
+        return self._get_channels(
+            self._floorplan_index.get_channel_serials_by_floor(floor_id)
+        )
+
+    def get_channels_by_room(
+        self, floor_id: str | None, room_id: str | None
+    ) -> list[Base]:
+        """Get the list of channels in a room."""
+        self._index_channels()
+        return self._get_channels(
+            self._floorplan_index.get_channel_serials_by_room(floor_id, room_id)
+        )
 
     async def get_config(self, refresh: bool = False) -> dict:
         """Get the Free@Home Configuration."""
@@ -78,135 +214,468 @@ class FreeAtHome:
         """Get the list of devices."""
         return self._devices
 
-    async def load(self):
-        """Load from the Free@Home api into the FreeAtHome class."""
-        await self._load_devices()
+    def get_devices_by_floor(self, floor_id: str | None) -> list[Device]:
+        """Get the list of devices on a floor, in any room."""
+        return self._floorplan_index.get_devices_by_floor(floor_id)
+
+    def get_devices_by_room(
+        self, floor_id: str | None, room_id: str | None
+    ) -> list[Device]:
+        """Get the list of devices in a room."""
+        return self._floorplan_index.get_devices_by_room(floor_id, room_id)
+
+    async def load(self, refresh: bool = False):
+        """
+        Load from the Free@Home api into the FreeAtHome class.
+
+        With refresh the configuration is fetched again. When devices are already
+        loaded only the differences to the previous configuration are applied, the
+        unchanged devices and channels, and their callbacks, are kept.
+
+        With a snapshot the devices are loaded from the snapshot when available,
+        the configuration is then revalidated against the api in the background.
+        """
+        # Wait for the revalidation, so two reloads never apply to the same objects
+        if self._revalidate_task is not None:
+            await self._revalidate_task
+
+        if refresh and self._devices:
+            await self._reload_devices()
+            return
+
+        if not refresh and self._config is None and self._snapshot is not None:
+            self._config = await self._snapshot.load()
+            if self._config is not None:
+                await self._load_devices()
+                self._revalidate_task = asyncio.create_task(
+                    self._revalidate(), name="freeathome_revalidate_snapshot"
+                )
+                return
+
+        await self._load_devices(refresh=refresh)
+
+    def load_device(self, device_serial: str, device_data: dict) -> Device | None:
+        """
+        Load or reload a single device from its configuration data.
+
+        Any device already loaded with the same serial is replaced. Returns None
+        when the device is excluded by the interface filter.
+        """
+        self.unload_device(device_serial)
+
+        _device = self._create_device(device_serial, device_data)
+        if _device is None:
+            return None
+
+        self._devices[device_serial] = _device
+        self._floorplan_index.add_device(_device)
+        self._add_filtered_channels(_device)
+        return _device
+
+    async def refresh_states(self, channels: list[Base] | None = None):
+        """
+        Refresh the state of multiple channels with as few requests as possible.
+
+        Without channels all loaded channels are refreshed from a single
+        configuration request, otherwise the channels are refreshed with one device
+        request per device, sent concurrently within the refresh limits.
+        """
+        if channels is None:
+            # Keep the loaded configuration, so a later reload still sees the changes
+            _config = await self.api.get_configuration()
+            _devices_data = _config.get("devices", {})
+            channels = list(self.get_channels().values())
+        else:
+            _devices_data = await self._refresh_scheduler.get_devices(
+                self.api, [_channel.device_serial for _channel in channels]
+            )
+
+        for _channel in channels:
+            _channel_data = (
+                (_devices_data.get(_channel.device_serial) or {})
+                .get("channels", {})
+                .get(_channel.channel_id)
+            )
+            if _channel_data is None:
+                continue
+
+            _channel.refresh_state_from_data(_channel_data)
+
+    async def refresh_channel_states(
+        self, channels: list[Base] | None = None
+    ) -> dict[str, FreeAtHomeException | None]:
+        """
+        Refresh the state of channels concurrently within the request limits.
+
+        Each channel is refreshed using its own refresh_state. Returns the result
+        per channel, which is None on success or the exception raised.
+        """
+        if channels is None:
+            channels = list(self.get_channels().values())
+
+        return await self._refresh_scheduler.refresh(channels)
+
+    def subscribe(
+        self,
+        callback: Callable[[ChannelEvent], Any],
+        channel_class: type[Base] | None = None,
+        callback_attribute: str | None = None,
+        floor_id: str | None = None,
+        room_id: str | None = None,
+        device_serial: str | None = None,
+    ) -> EventSubscription:
+        """
+        Subscribe to the changes of all channels matching the filters.
+
+        The callback is called with a ChannelEvent for every change of a matching
+        channel, and may be a coroutine function. The subscription is kept when
+        channels are reloaded, until passed to unsubscribe.
+        """
+        # Make sure the loaded channels are known to the event bus
+        self._index_channels()
+
+        _subscription = EventSubscription(
+            callback=callback,
+            channel_class=channel_class,
+            callback_attribute=callback_attribute,
+            floor_id=floor_id,
+            room_id=room_id,
+            device_serial=device_serial,
+        )
+        self._event_bus.subscribe(_subscription)
+        return _subscription
 
     def unload_channel(self, device_serial: str, channel_id: str):
         """Unload a specific channel by device serial and channel id."""
-        try:
-            _device = self._devices[device_serial]
-            _device.channels.pop(channel_id)
+        _device = self._devices.get(device_serial)
+        if _device is None or not _device.remove_channel(channel_id):
+            return
 
-            # Invalidate the filtered channels cache
-            self._filtered_channels = None
-        except KeyError:
-            pass
+        self._remove_filtered_channels(device_serial, [channel_id])
 
     def unload_device(self, device_serial: str):
         """Unload a device by its serial ID."""
-        try:
-            self._devices.pop(device_serial)
+        _device = self._devices.pop(device_serial, None)
+        if _device is None:
+            return
 
-            # Invalidate the filtered channels cache
-            self._filtered_channels = None
-        except KeyError:
-            pass
+        self._floorplan_index.remove_device(device_serial)
+        self._remove_filtered_channels(device_serial, _device.channels_data)
 
-    async def update(self, data: dict):
+    def unsubscribe(self, subscription: EventSubscription):
+        """Remove a subscription made with subscribe."""
+        self._event_bus.unsubscribe(subscription)
+
+    async def update(self, data: WebsocketMessage | dict):
         """Update channel based on websocket data."""
-        _channels = self.get_channels()
+        if not isinstance(data, WebsocketMessage):
+            data = WebsocketMessage.from_data(data)
 
-        for _datapoint_key, _datapoint_value in data.get("datapoints").items():
-            _unique_id = "/".join(_datapoint_key.split("/")[:-1])
+        if data.devices or data.devices_added or data.devices_removed:
+            await self._update_devices(data)
 
-            try:
-                _channel = _channels[_unique_id]
-                _channel.update_channel(_datapoint_key, _datapoint_value)
-            except KeyError:
+        # Make sure the routing table reflects the currently loaded channels
+        self._index_channels()
+        _routes = self._datapoint_routes
+
+        for _datapoint_key, _datapoint_value in data.datapoints:
+            _route = _routes.get(_datapoint_key)
+            if _route is None:
                 continue
 
+            # Only the channel targeted is created, when lazy and not created yet
+            _channel_serial, _datapoint = _route
+            _channel = self._get_channel(_channel_serial)
+            _channel.update_datapoint(_datapoint_key, _datapoint, _datapoint_value)
+
     async def ws_close(self):
-        """Close the websocket connection."""
+        """Close the websocket connection and stop revalidating the snapshot."""
+        if self._revalidate_task is not None:
+            self._revalidate_task.cancel()
+            await asyncio.gather(self._revalidate_task, return_exceptions=True)
+            self._revalidate_task = None
+
         await self.api.ws_close()
 
     async def ws_listen(self):
         """Listen on the websocket for updates to Free@Home objects."""
-        await self.api.ws_listen(callback=self.update)
+        await self._ws_supervisor.run()
 
-    def _build_filtered_channels(self) -> dict[str, Base]:
-        """Build a filtered dictionary of channels based on current filters."""
-        _all_channels = {}
+    def _add_filtered_channels(self, device: Device):
+        """Add the channels of a loaded device to the indexes and routes."""
+        if self._filtered_channels is None:
+            return
+
+        # The channels are indexed by their class, lazy channels aren't created
+        for channel_id, channel_class in device.get_channel_classes().items():
+            _channel_serial = f"{device.device_serial}/{channel_id}"
+            _channel_data = device.channels_data.get(channel_id, {})
+            _floor_id = _channel_data.get("floor") or device.floor
+            _room_id = _channel_data.get("room") or device.room
+
+            self._channel_entries[_channel_serial] = (device, channel_id, channel_class)
+            self._datapoint_routes.update(
+                self._build_datapoint_routes(
+                    _channel_serial, channel_class, _channel_data
+                )
+            )
+            self._channel_index.add(_channel_serial, device, channel_class)
+            self._floorplan_index.add_channel(
+                _channel_serial, floor_id=_floor_id, room_id=_room_id
+            )
+            self._event_bus.add_channel(
+                _channel_serial, device, channel_class, _floor_id, _room_id
+            )
 
-        for device_serial, device in self._devices.items():
-            for channel_id, channel_data in device.channels_data.items():
-                # Filter out any channels not on the Free@Home floorplan
-                if (
-                    not self._include_orphan_channels
-                    and not channel_data.get("floor")
-                    and not channel_data.get("room")
-                ):
-                    continue
+            if not self._lazy_channels:
+                self._get_channel(_channel_serial)
 
-                # Get the actual Channel object from device.channels
-                device_channels = device.channels
-                if channel_id not in device_channels:
-                    continue
+    def _remove_filtered_channels(
+        self,
+        device_serial: str,
+        channel_ids: Iterable[str],
+        keep_event_routes: bool = False,
+    ):
+        """Remove the channels of a device from the indexes and routes."""
+        if self._filtered_channels is None:
+            return
 
-                channel = device_channels[channel_id]
+        for channel_id in channel_ids:
+            _channel_serial = f"{device_serial}/{channel_id}"
+            _entry = self._channel_entries.pop(_channel_serial, None)
+            if _entry is None:
+                continue
 
-                # Filter by channel class if provided
-                if self._channel_classes and type(channel) not in self._channel_classes:
-                    continue
+            _device, _, _channel_class = _entry
+            self._filtered_channels.pop(_channel_serial, None)
+            self._channel_index.remove(_channel_serial)
+            self._floorplan_index.remove_channel(_channel_serial)
+            if not keep_event_routes:
+                self._event_bus.remove_channel(_channel_serial)
+            for _datapoint_key in self._build_datapoint_routes(
+                _channel_serial,
+                _channel_class,
+                _device.channels_data.get(channel_id, {}),
+            ):
+                self._datapoint_routes.pop(_datapoint_key, None)
+
+    def _build_datapoint_routes(
+        self, channel_serial: str, channel_class: type[Base], channel_data: dict
+    ) -> dict[str, tuple[str, dict[str, Any]]]:
+        """Build a routing table from full datapoint key to channel and datapoint."""
+        # The channels share the datapoint dicts of the channel data
+        return {
+            f"{channel_serial}/{io_id}": (channel_serial, datapoint)
+            for io_id, datapoint in channel_class.get_update_datapoints_from_data(
+                channel_data
+            ).items()
+        }
+
+    def _get_channel(self, channel_serial: str) -> Base:
+        """Get an indexed channel by its serial, creating it if not created yet."""
+        _channel = self._filtered_channels.get(channel_serial)
+        if _channel is None:
+            _device, _channel_id, _ = self._channel_entries[channel_serial]
+            _channel = self._filtered_channels[channel_serial] = _device.get_channel(
+                _channel_id
+            )
 
-                # Use the same key format as before: "device_serial/channel_id"
-                channel_serial = f"{device_serial}/{channel_id}"
-                _all_channels[channel_serial] = channel
+        return _channel
 
-        return _all_channels
+    def _get_channels(self, channel_serials: Iterable[str]) -> list[Base]:
+        """Get indexed channels by their serials, creating only these channels."""
+        return [
+            self._get_channel(_channel_serial) for _channel_serial in channel_serials
+        ]
 
-    async def _load_devices(self):
+    def _index_channels(self):
+        """Index the channels of all loaded devices, if not indexed yet."""
+        if self._filtered_channels is not None:
+            return
+
+        self._filtered_channels = {}
+        self._channel_entries = {}
+        self._datapoint_routes = {}
+        self._channel_index.clear()
+        self._floorplan_index.clear_channels()
+        self._event_bus.clear_channels()
+        for _device in self._devices.values():
+            self._add_filtered_channels(_device)
+
+    def _create_device(self, device_serial: str, device_data: dict) -> Device | None:
+        """Create a device and its channels, None if excluded by the filters."""
+        # Convert interface string to Interface enum
+        _interface_value = device_data.get("interface")
+
+        # Any devices that start with "6000" should be considered virtual
+        if device_serial.startswith("6000"):
+            _interface_value = "VD"
+
+        _interface = Interface.from_string(_interface_value)
+
+        # Filter by interface if provided - skip devices not in the interface filter
+        if self._interfaces and _interface not in self._interfaces:
+            return None
+
+        _device = Device(
+            device_serial=device_serial,
+            interface=_interface,
+            api=self.api,
+            lazy_channels=self._lazy_channels,
+            channel_classes=self._channel_classes,
+            include_orphan_channels=self._include_orphan_channels,
+            callback_executor=self._callback_executor,
+            event_listener=self._event_bus.publish,
+            **self._device_attributes(device_data),
+        )
+        _device.load_channels(floorplan=self._floorplan)
+
+        return _device
+
+    def _device_attributes(self, device_data: dict) -> dict[str, Any]:
+        """Get the device attributes from the device configuration data."""
+        # Get floor and room names using floor plan
+        _floor_id = device_data.get("floor")
+        _room_id = device_data.get("room")
+
+        return {
+            "device_id": device_data.get("deviceId", ""),
+            "display_name": device_data.get("displayName", ""),
+            "unresponsive": device_data.get("unresponsive", False),
+            "unresponsive_counter": device_data.get("unresponsiveCounter", 0),
+            "defect": device_data.get("defect", False),
+            "floor": _floor_id,
+            "room": _room_id,
+            "floor_name": self._floorplan.get_floor_name(_floor_id),
+            "room_name": self._floorplan.get_room_name(_floor_id, _room_id),
+            "device_reboots": device_data.get("deviceReboots"),
+            "native_id": device_data.get("nativeId"),
+            "parameters": device_data.get("parameters", {}),
+            "channels_data": device_data.get("channels", {}),
+        }
+
+    async def _load_devices(self, refresh: bool = False):
         """Load all devices into the devices object."""
         self.clear_devices()
 
-        _config = await self.get_config()
+        _fetch = refresh or self._config is None
+        _config = await self.get_config(refresh=refresh)
+        if _fetch:
+            await self._save_snapshot()
 
         # Create floor plan from configuration
-        _floorplan = Floorplan.from_config(_config)
+        self._floorplan = Floorplan.from_config(_config)
 
         for _serial, _data in _config.get("devices", {}).items():
-            # Convert interface string to Interface enum
-            _interface_value = _data.get("interface")
+            _device = self._create_device(_serial, _data)
+            if _device is not None:
+                self._devices[_serial] = _device
+                self._floorplan_index.add_device(_device)
+
+        # Invalidate the filtered channels cache after loading devices
+        self._filtered_channels = None
 
-            # Any devices that start with "6000" should be considered virtual
-            if _serial.startswith("6000"):
-                _interface_value = "VD"
+    async def _resync(self, downtime: float):
+        """Apply the changes missed while the websocket was disconnected."""
+        if not self._devices:
+            return
 
-            _interface = Interface.from_string(_interface_value)
+        # A single configuration request, only the changed devices are updated
+        _LOGGER.info("Resynchronizing after %.1f seconds without websocket.", downtime)
+        await self.load(refresh=True)
 
-            # Filter by interface if provided - skip devices not in the interface filter
-            if self._interfaces and _interface not in self._interfaces:
+    async def _revalidate(self):
+        """Apply the differences of the live configuration to the snapshot."""
+        try:
+            await self._reload_devices()
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Failed to revalidate the configuration snapshot.")
+
+    async def _save_snapshot(self):
+        """Save the configuration to the snapshot, if any."""
+        if self._snapshot is None or self._config is None:
+            return
+
+        try:
+            await self._snapshot.save(self._config)
+        except OSError:
+            _LOGGER.exception("Failed to save the configuration snapshot.")
+
+    async def _reload_devices(self):
+        """Apply the differences of a refreshed configuration to loaded devices."""
+        _previous_devices = (self._config or {}).get("devices", {})
+
+        _config = await self.get_config(refresh=True)
+        _devices_data = _config.get("devices", {})
+        await self._save_snapshot()
+
+        # Floor or room renames require updating the names of all devices
+        _floorplan = Floorplan.from_config(_config)
+        _floorplan_changed = _floorplan.get_floors() != self._floorplan.get_floors()
+        self._floorplan = _floorplan
+
+        for _serial in [
+            _serial for _serial in self._devices if _serial not in _devices_data
+        ]:
+            self.unload_device(_serial)
+
+        for _serial, _data in _devices_data.items():
+            _device = self._devices.get(_serial)
+            if _device is None:
+                self.load_device(_serial, _data)
+            elif _floorplan_changed or _data != _previous_devices.get(_serial):
+                self._update_device(_device, _data)
+
+    def _update_device(self, device: Device, device_data: dict):
+        """Update a loaded device in place from its configuration data."""
+        _channel_ids = list(device.channels_data)
+
+        # Keep the event routes, so subscriptions see the changes of the update
+        self._remove_filtered_channels(
+            device.device_serial, _channel_ids, keep_event_routes=True
+        )
+        device.update_configuration(
+            floorplan=self._floorplan, **self._device_attributes(device_data)
+        )
+        self._floorplan_index.add_device(device)
+        self._add_filtered_channels(device)
+
+        _channel_classes = device.get_channel_classes()
+        for _channel_id in _channel_ids:
+            if _channel_id not in _channel_classes:
+                self._event_bus.remove_channel(f"{device.device_serial}/{_channel_id}")
+
+    async def _update_devices(self, message: WebsocketMessage):
+        """Load and unload only the devices added, updated or removed."""
+        _config_devices = (self._config or {}).get("devices")
+
+        for _serial in message.devices_removed:
+            self.unload_device(_serial)
+            if _config_devices is not None:
+                _config_devices.pop(_serial, None)
+
+        _devices_data = dict(message.devices)
+        for _serial in message.devices_added:
+            if _serial in _devices_data:
                 continue
 
-            # Get floor and room names using floor plan
-            _floor_id = _data.get("floor")
-            _room_id = _data.get("room")
-
-            _floor_name = _floorplan.get_floor_name(_floor_id)
-            _room_name = _floorplan.get_room_name(_floor_id, _room_id)
-
-            # Extract device attributes from the configuration
-            _device = Device(
-                device_serial=_serial,
-                device_id=_data.get("deviceId", ""),
-                display_name=_data.get("displayName", ""),
-                interface=_interface,
-                unresponsive=_data.get("unresponsive", False),
-                unresponsive_counter=_data.get("unresponsiveCounter", 0),
-                defect=_data.get("defect", False),
-                floor=_floor_id,
-                room=_room_id,
-                floor_name=_floor_name,
-                room_name=_room_name,
-                device_reboots=_data.get("deviceReboots"),
-                native_id=_data.get("nativeId"),
-                parameters=_data.get("parameters", {}),
-                channels_data=_data.get("channels", {}),
-                api=self.api,
-            )
-            _device.load_channels(floorplan=_floorplan)
+            # A device failing to load must not hold back the other changes
+            try:
+                _devices_data[_serial] = await self.api.get_device(
+                    device_serial=_serial
+                )
+            except FreeAtHomeException:
+                _LOGGER.exception("Failed to load the added device %s.", _serial)
+
+        for _serial, _data in _devices_data.items():
+            if not _data:
+                continue
 
-            self._devices[_serial] = _device
+            _device = self._devices.get(_serial)
+            if _device is None:
+                self.load_device(_serial, _data)
+            else:
+                self._update_device(_device, _data)
 
-        # Invalidate the filtered channels cache after loading devices
-        self._filtered_channels = None
+            if _config_devices is not None:
+                _config_devices[_serial] = _data
@@ -0,0 +1,88 @@
+"""ABB-Free@Home decoded websocket message."""
+
+from typing import Any, NamedTuple
+
+
+class DatapointUpdate(NamedTuple):
+    """A datapoint value received on the websocket."""
+
+    key: str
+    value: str
+
+    @property
+    def device_serial(self) -> str:
+        """Get the device serial of the datapoint."""
+        return self.key.split("/", 1)[0]
+
+    @property
+    def channel_id(self) -> str:
+        """Get the channel id of the datapoint."""
+        return self.key.split("/", 2)[1]
+
+    @property
+    def datapoint_id(self) -> str:
+        """Get the input or output id of the datapoint."""
+        return self.key.rsplit("/", 1)[1]
+
+
+class WebsocketMessage:
+    """Provides a decoded websocket message of the SysAP."""
+
+    __slots__ = (
+        "datapoints",
+        "devices",
+        "devices_added",
+        "devices_removed",
+        "scenes_triggered",
+    )
+
+    def __init__(
+        self,
+        datapoints: tuple[DatapointUpdate, ...] = (),
+        devices: dict[str, dict] | None = None,
+        devices_added: tuple[str, ...] = (),
+        devices_removed: tuple[str, ...] = (),
+        scenes_triggered: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Initialize the WebsocketMessage class.
+
+        Args:
+            datapoints: The datapoint values which changed.
+            devices: The configuration of devices which changed, by device serial.
+            devices_added: The serials of the devices added to the SysAP.
+            devices_removed: The serials of the devices removed from the SysAP.
+            scenes_triggered: The scenes which were triggered, by scene id.
+
+        """
+        self.datapoints: tuple[DatapointUpdate, ...] = datapoints
+        self.devices: dict[str, dict] = devices or {}
+        self.devices_added: tuple[str, ...] = devices_added
+        self.devices_removed: tuple[str, ...] = devices_removed
+        self.scenes_triggered: dict[str, Any] = scenes_triggered or {}
+
+    @classmethod
+    def from_data(cls, data: dict | None) -> "WebsocketMessage":
+        """Return WebsocketMessage class from the decoded websocket data."""
+        if not data:
+            return cls()
+
+        return cls(
+            datapoints=tuple(
+                map(DatapointUpdate._make, (data.get("datapoints") or {}).items())
+            ),
+            devices=data.get("devices"),
+            devices_added=tuple(data.get("devicesAdded") or ()),
+            devices_removed=tuple(data.get("devicesRemoved") or ()),
+            scenes_triggered=data.get("scenesTriggered"),
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the message."""
+        return (
+            f"WebsocketMessage(datapoints={len(self.datapoints)}, "
+            f"devices={len(self.devices)}, "
+            f"devices_added={len(self.devices_added)}, "
+            f"devices_removed={len(self.devices_removed)}, "
+            f"scenes_triggered={len(self.scenes_triggered)})"
+        )
@@ -0,0 +1,139 @@
+"""ABB-Free@Home bounded queue between the websocket reader and its callback."""
+
+from collections.abc import Callable
+import enum
+from typing import Any
+
+from .message import WebsocketMessage
+from .worker_queue import WorkerQueue, WorkerQueueMetrics
+
+# Receive Queue Configuration
+DEFAULT_RECEIVE_QUEUE_MAX_SIZE = 100
+DEFAULT_RECEIVE_QUEUE_DISPATCHERS = 1
+
+
+class ReceiveQueueOverflowPolicy(enum.Enum):
+    """An Enum class for the behavior of a full receive queue."""
+
+    block = "block"
+    drop_oldest = "drop_oldest"
+    drop_newest = "drop_newest"
+
+
+class ReceiveQueueMetrics(WorkerQueueMetrics):
+    """Provides metrics of a receive queue."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the ReceiveQueueMetrics class."""
+        super().__init__(*args, **kwargs)
+        self._total_queue_latency: float = 0.0
+        self._max_queue_latency: float = 0.0
+        self._total_dispatch_latency: float = 0.0
+        self._max_dispatch_latency: float = 0.0
+
+    @property
+    def received(self) -> int:
+        """Get the number of messages put on the queue."""
+        return self.queued
+
+    @property
+    def dispatched(self) -> int:
+        """Get the number of messages passed to the callback successfully."""
+        return self.completed
+
+    @property
+    def average_queue_latency(self) -> float | None:
+        """Get the average seconds a message waited in the queue."""
+        _completed = self.completed + self.failed
+        if _completed == 0:
+            return None
+        return self._total_queue_latency / _completed
+
+    @property
+    def max_queue_latency(self) -> float:
+        """Get the maximum seconds a message waited in the queue."""
+        return self._max_queue_latency
+
+    @property
+    def average_dispatch_latency(self) -> float | None:
+        """Get the average seconds the callback took for a message."""
+        _completed = self.completed + self.failed
+        if _completed == 0:
+            return None
+        return self._total_dispatch_latency / _completed
+
+    @property
+    def max_dispatch_latency(self) -> float:
+        """Get the maximum seconds the callback took for a message."""
+        return self._max_dispatch_latency
+
+    def record_completed(self, queue_latency: float, handler_latency: float):
+        """Record a message passed to the callback successfully."""
+        super().record_completed(queue_latency, handler_latency)
+        self._record_latency(queue_latency, handler_latency)
+
+    def record_failed(self, queue_latency: float, handler_latency: float):
+        """Record a message the callback raised an exception for."""
+        super().record_failed(queue_latency, handler_latency)
+        self._record_latency(queue_latency, handler_latency)
+
+    def _record_latency(self, queue_latency: float, dispatch_latency: float):
+        """Record the latency of each stage of a completed message."""
+        self._total_queue_latency += queue_latency
+        self._max_queue_latency = max(self._max_queue_latency, queue_latency)
+        self._total_dispatch_latency += dispatch_latency
+        self._max_dispatch_latency = max(self._max_dispatch_latency, dispatch_latency)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the metrics."""
+        return (
+            f"ReceiveQueueMetrics(depth={self.depth}, received={self.received}, "
+            f"dispatched={self.dispatched}, failed={self.failed}, "
+            f"dropped={self.dropped})"
+        )
+
+
+class ReceiveQueue(WorkerQueue):
+    """Passes received messages to a callback using a bounded queue."""
+
+    def __init__(
+        self,
+        callback: Callable[[WebsocketMessage], None],
+        max_size: int = DEFAULT_RECEIVE_QUEUE_MAX_SIZE,
+        dispatchers: int = DEFAULT_RECEIVE_QUEUE_DISPATCHERS,
+        overflow_policy: ReceiveQueueOverflowPolicy = ReceiveQueueOverflowPolicy.block,
+    ) -> None:
+        """
+        Initialize the ReceiveQueue class.
+
+        Args:
+            callback: Called with every message, may be a coroutine function.
+            max_size: The maximum number of messages waiting in the queue.
+            dispatchers: The number of messages passed to the callback
+                concurrently. With more than one, messages are no longer
+                guaranteed to be handled in the order they were received.
+            overflow_policy: What to do when a message is put on a full queue,
+                wait for a free slot (block), drop the oldest message
+                (drop_oldest) or drop the new message (drop_newest). Dropped
+                messages are lost until the state is refreshed.
+
+        """
+        super().__init__(
+            handler=callback,
+            max_size=max_size,
+            workers=dispatchers,
+            overflow_policy=overflow_policy,
+            metrics_class=ReceiveQueueMetrics,
+            name="receive queue",
+            item_name="message",
+            handle_verb="dispatch",
+        )
+
+    @property
+    def metrics(self) -> ReceiveQueueMetrics:
+        """Get the metrics of the queue."""
+        return self._metrics
+
+    async def put(self, message: WebsocketMessage):
+        """Put a message on the queue."""
+        await super().put(message)
@@ -0,0 +1,263 @@
+"""ABB-Free@Home schedulers for concurrent channel refreshes and commands."""
+
+import asyncio
+from collections.abc import Iterable
+import inspect
+import logging
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import FreeAtHomeException, InvalidChannelCommandException
+
+if TYPE_CHECKING:
+    from .api import FreeAtHomeApi
+    from .channels.base import Base
+
+# Refresh Scheduler Configuration
+DEFAULT_REFRESH_MAX_CONCURRENCY = 4
+DEFAULT_REFRESH_REQUEST_RATE = 10.0
+
+# Command Scheduler Configuration
+DEFAULT_COMMAND_MAX_CONCURRENCY = 8
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Limit the rate of api requests using a token bucket."""
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """
+        Initialize the TokenBucket class.
+
+        Args:
+            rate: The number of tokens added to the bucket per second.
+            capacity: The maximum number of tokens in the bucket, which is the
+                largest burst of requests allowed. Defaults to the rate.
+
+        """
+        self._rate: float = rate
+        self._capacity: float = capacity if capacity is not None else rate
+        self._tokens: float = self._capacity
+        self._updated: float | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Get the number of tokens added per second."""
+        return self._rate
+
+    @property
+    def capacity(self) -> float:
+        """Get the maximum number of tokens in the bucket."""
+        return self._capacity
+
+    async def acquire(self, tokens: float = 1):
+        """
+        Wait until the tokens are available and take them from the bucket.
+
+        Requests for more tokens than the capacity wait for a full bucket and leave
+        the bucket in debt, so the average rate is kept.
+        """
+        async with self._lock:
+            _required = min(tokens, self._capacity)
+
+            self._refill()
+            while self._tokens < _required:
+                await asyncio.sleep((_required - self._tokens) / self._rate)
+                self._refill()
+
+            self._tokens -= tokens
+
+    def _refill(self):
+        """Add the tokens accumulated since the last refill."""
+        _now = asyncio.get_running_loop().time()
+
+        if self._updated is not None:
+            self._tokens = min(
+                self._capacity, self._tokens + (_now - self._updated) * self._rate
+            )
+
+        self._updated = _now
+
+
+class RefreshScheduler:
+    """Refresh the state of channels concurrently within request limits."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_REFRESH_MAX_CONCURRENCY,
+        request_rate: float = DEFAULT_REFRESH_REQUEST_RATE,
+        request_burst: float | None = None,
+    ) -> None:
+        """
+        Initialize the RefreshScheduler class.
+
+        Args:
+            max_concurrency: The maximum number of channels refreshed at once.
+            request_rate: The average number of api requests per second.
+            request_burst: The maximum number of api requests sent at once,
+                defaults to the request rate.
+
+        """
+        self._max_concurrency: int = max_concurrency
+        self._bucket: TokenBucket = TokenBucket(
+            rate=request_rate, capacity=request_burst
+        )
+
+    @property
+    def max_concurrency(self) -> int:
+        """Get the maximum number of channels refreshed at once."""
+        return self._max_concurrency
+
+    @property
+    def request_rate(self) -> float:
+        """Get the average number of api requests per second."""
+        return self._bucket.rate
+
+    async def refresh(
+        self, channels: Iterable["Base"]
+    ) -> dict[str, FreeAtHomeException | None]:
+        """
+        Refresh the state of the channels from the api.
+
+        Returns the result per channel, keyed by "device_serial/channel_id". The
+        result is None if the channel was refreshed, otherwise it's the exception
+        raised while refreshing the channel.
+        """
+        _semaphore = asyncio.Semaphore(self._max_concurrency)
+        _channels = {
+            f"{_channel.device_serial}/{_channel.channel_id}": _channel
+            for _channel in channels
+        }
+
+        async def _refresh_channel(
+            channel: "Base",
+        ) -> FreeAtHomeException | None:
+            async with _semaphore:
+                await self._bucket.acquire(channel.refresh_request_count)
+
+                try:
+                    await channel.refresh_state()
+                except FreeAtHomeException as e:
+                    _LOGGER.warning(
+                        "Failed to refresh state of channel %s: %s",
+                        channel.channel_name,
+                        e,
+                    )
+                    return e
+
+                return None
+
+        _results = await asyncio.gather(
+            *[_refresh_channel(_channel) for _channel in _channels.values()]
+        )
+
+        return dict(zip(_channels.keys(), _results, strict=True))
+
+    async def get_devices(
+        self, api: "FreeAtHomeApi", device_serials: Iterable[str]
+    ) -> dict[str, dict]:
+        """
+        Get the data of devices from the api concurrently within the limits.
+
+        Returns the data per device serial, the first exception raised is passed on.
+        """
+        _semaphore = asyncio.Semaphore(self._max_concurrency)
+        _device_serials = list(dict.fromkeys(device_serials))
+
+        async def _get_device(device_serial: str) -> dict:
+            async with _semaphore:
+                await self._bucket.acquire()
+                return await api.get_device(device_serial=device_serial)
+
+        _results = await asyncio.gather(
+            *[_get_device(_device_serial) for _device_serial in _device_serials]
+        )
+
+        return dict(zip(_device_serials, _results, strict=True))
+
+
+class CommandScheduler:
+    """Run a command on many channels concurrently within a shared limit."""
+
+    def __init__(self, max_concurrency: int = DEFAULT_COMMAND_MAX_CONCURRENCY) -> None:
+        """
+        Initialize the CommandScheduler class.
+
+        Args:
+            max_concurrency: The maximum number of commands running at once,
+                shared by all concurrent executions.
+
+        """
+        self._max_concurrency: int = max_concurrency
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+
+    @property
+    def max_concurrency(self) -> int:
+        """Get the maximum number of commands running at once."""
+        return self._max_concurrency
+
+    async def execute(
+        self,
+        channels: Iterable["Base"],
+        command: str,
+        *args: Any,
+        notify_callbacks: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, FreeAtHomeException | None]:
+        """
+        Run a command, a coroutine method of the channels, on every channel.
+
+        The command is resolved on all channels before any command is sent, an
+        InvalidChannelCommandException is raised if a channel does not support it.
+        With notify_callbacks the callbacks of the attributes changed by the
+        command are called. Returns the result per channel, keyed by
+        "device_serial/channel_id", which is None on success or the exception.
+        """
+        _commands = {}
+        for _channel in channels:
+            _method = getattr(_channel, command, None)
+            # Only coroutine methods are commands, e.g. not register_callback
+            if command.startswith("_") or not inspect.iscoroutinefunction(_method):
+                raise InvalidChannelCommandException(_channel.channel_name, command)
+
+            _commands[f"{_channel.device_serial}/{_channel.channel_id}"] = (
+                _channel,
+                _method,
+            )
+
+        async def _execute_command(
+            channel: "Base", method: Any
+        ) -> FreeAtHomeException | None:
+            async with self._semaphore:
+                _values = channel.get_callback_attribute_values()
+
+                try:
+                    await method(*args, **kwargs)
+                except FreeAtHomeException as e:
+                    _LOGGER.warning(
+                        "Failed to run %s on channel %s: %s",
+                        command,
+                        channel.channel_name,
+                        e,
+                    )
+                    return e
+
+            if notify_callbacks:
+                for (
+                    _attribute,
+                    _value,
+                ) in channel.get_callback_attribute_values().items():
+                    if _value != _values.get(_attribute):
+                        channel.run_callbacks(_attribute)
+
+            return None
+
+        _results = await asyncio.gather(
+            *[
+                _execute_command(_channel, _method)
+                for _channel, _method in _commands.values()
+            ]
+        )
+
+        return dict(zip(_commands.keys(), _results, strict=True))
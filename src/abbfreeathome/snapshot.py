@@ -0,0 +1,111 @@
+"""ABB-Free@Home on-disk snapshot of the SysAP configuration."""
+
+import asyncio
+import copy
+import logging
+import os
+import tempfile
+import zlib
+
+from .codec import json_dumps, json_loads
+
+# Snapshot Configuration
+SNAPSHOT_FORMAT = b"FAHSNAP1"
+DEFAULT_SNAPSHOT_COMPRESSION_LEVEL = 6
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConfigurationSnapshot:
+    """Stores the SysAP configuration on disk for a fast start."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        sysap_serial: str,
+        sysap_version: str,
+        compression_level: int = DEFAULT_SNAPSHOT_COMPRESSION_LEVEL,
+    ) -> None:
+        """
+        Initialize the ConfigurationSnapshot class.
+
+        Args:
+            path: The file the snapshot is stored in.
+            sysap_serial: The serial number of the SysAP.
+            sysap_version: The firmware version of the SysAP, a snapshot of
+                another serial number or version is never loaded.
+            compression_level: The zlib compression level of the snapshot.
+
+        """
+        self._path: str | os.PathLike = path
+        self._sysap_serial: str = sysap_serial
+        self._sysap_version: str = sysap_version
+        self._compression_level: int = compression_level
+
+    @property
+    def path(self) -> str | os.PathLike:
+        """Get the file the snapshot is stored in."""
+        return self._path
+
+    @property
+    def key(self) -> str:
+        """Get the key identifying the SysAP of the snapshot."""
+        return f"{self._sysap_serial}/{self._sysap_version}"
+
+    async def load(self) -> dict | None:
+        """Load the configuration, None if there is no matching snapshot."""
+        return await asyncio.get_running_loop().run_in_executor(None, self._load_sync)
+
+    async def save(self, config: dict):
+        """Save the configuration, encoding and writing it in the executor."""
+        # The configuration is updated in place by the event loop while saving
+        _config = copy.deepcopy(config)
+        await asyncio.get_running_loop().run_in_executor(None, self._save_sync, _config)
+
+    def _encode(self, config: dict) -> bytes:
+        """Encode the configuration into the snapshot format."""
+        _document = json_dumps({"key": self.key, "configuration": config})
+        return SNAPSHOT_FORMAT + zlib.compress(
+            _document.encode(), self._compression_level
+        )
+
+    def _load_sync(self) -> dict | None:
+        """Load the configuration from disk."""
+        try:
+            with open(self._path, "rb") as _file:
+                _data = _file.read()
+        except FileNotFoundError:
+            return None
+
+        if not _data.startswith(SNAPSHOT_FORMAT):
+            _LOGGER.warning("Ignoring snapshot in unknown format: %s", self._path)
+            return None
+
+        try:
+            _document = json_loads(zlib.decompress(_data[len(SNAPSHOT_FORMAT) :]))
+        except (zlib.error, ValueError):
+            _LOGGER.warning("Ignoring corrupt snapshot: %s", self._path)
+            return None
+
+        if _document.get("key") != self.key:
+            _LOGGER.debug("Ignoring snapshot of %s", _document.get("key"))
+            return None
+
+        return _document.get("configuration")
+
+    def _save_sync(self, config: dict):
+        """Save the configuration to disk, replacing it atomically."""
+        _data = self._encode(config)
+
+        # A unique temporary file, so concurrent saves can't interleave
+        _directory, _name = os.path.split(os.fspath(self._path))
+        _fd, _temporary_path = tempfile.mkstemp(
+            prefix=f"{_name}.", suffix=".tmp", dir=_directory or None
+        )
+        try:
+            with os.fdopen(_fd, "wb") as _file:
+                _file.write(_data)
+            os.replace(_temporary_path, self._path)
+        except BaseException:
+            os.unlink(_temporary_path)
+            raise
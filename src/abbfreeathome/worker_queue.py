@@ -0,0 +1,238 @@
+"""ABB-Free@Home bounded queue handled by a pool of background workers."""
+
+import asyncio
+from collections.abc import Callable
+import enum
+import inspect
+import logging
+from typing import Any
+
+from .exceptions import QueueFullException
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WorkerQueueOverflowPolicy(enum.Enum):
+    """An Enum class for the behavior of a full worker queue."""
+
+    block = "block"
+    drop_oldest = "drop_oldest"
+    drop_newest = "drop_newest"
+    raise_error = "raise"
+
+
+class WorkerQueueMetrics:
+    """
+    Provides metrics of a worker queue.
+
+    Subclasses name the counters after the items of their queue and extend the
+    record methods with the latencies they need.
+    """
+
+    def __init__(self, queue: asyncio.Queue) -> None:
+        """Initialize the WorkerQueueMetrics class."""
+        self._queue: asyncio.Queue = queue
+        self._queued: int = 0
+        self._completed: int = 0
+        self._failed: int = 0
+        self._dropped: int = 0
+
+    @property
+    def depth(self) -> int:
+        """Get the number of items waiting in the queue."""
+        return self._queue.qsize()
+
+    @property
+    def queued(self) -> int:
+        """Get the number of items put on the queue."""
+        return self._queued
+
+    @property
+    def completed(self) -> int:
+        """Get the number of items handled successfully."""
+        return self._completed
+
+    @property
+    def failed(self) -> int:
+        """Get the number of items the handler raised an exception for."""
+        return self._failed
+
+    @property
+    def dropped(self) -> int:
+        """Get the number of items dropped from a full queue."""
+        return self._dropped
+
+    def record_queued(self):
+        """Record an item put on the queue."""
+        self._queued += 1
+
+    def record_completed(self, queue_latency: float, handler_latency: float):
+        """Record an item handled successfully."""
+        self._completed += 1
+
+    def record_failed(self, queue_latency: float, handler_latency: float):
+        """Record an item the handler raised an exception for."""
+        self._failed += 1
+
+    def record_dropped(self):
+        """Record an item dropped from a full queue."""
+        self._dropped += 1
+
+    def __repr__(self) -> str:
+        """Return a string representation of the metrics."""
+        return (
+            f"{type(self).__name__}(depth={self.depth}, queued={self.queued}, "
+            f"completed={self.completed}, failed={self.failed}, "
+            f"dropped={self.dropped})"
+        )
+
+
+class WorkerQueue:
+    """Passes items to a handler in the background using a bounded queue."""
+
+    def __init__(
+        self,
+        handler: Callable[..., Any],
+        max_size: int,
+        workers: int,
+        overflow_policy: enum.Enum = WorkerQueueOverflowPolicy.block,
+        metrics_class: type[WorkerQueueMetrics] = WorkerQueueMetrics,
+        on_drop: Callable[..., None] | None = None,
+        name: str = "worker queue",
+        item_name: str = "item",
+        handle_verb: str = "handle",
+    ) -> None:
+        """
+        Initialize the WorkerQueue class.
+
+        Args:
+            handler: Called with the arguments of every item, may be a coroutine
+                function.
+            max_size: The maximum number of items waiting in the queue.
+            workers: The number of items handled concurrently.
+            overflow_policy: What to do when an item is put on a full queue,
+                wait for a free slot (block), drop the oldest item (drop_oldest),
+                drop the new item (drop_newest) or raise a QueueFullException
+                (raise). Any Enum with one of these values is accepted.
+            metrics_class: The class of the metrics of the queue.
+            on_drop: Called with the arguments of an item dropped from a full
+                queue.
+            name: The name of the queue, used for logging and the worker tasks.
+            item_name: The name of an item, used for logging.
+            handle_verb: What the handler does with an item, used for logging.
+
+        """
+        self._handler: Callable[..., Any] = handler
+        self._max_size: int = max_size
+        self._workers: int = workers
+        self._overflow_policy: WorkerQueueOverflowPolicy = WorkerQueueOverflowPolicy(
+            overflow_policy.value
+        )
+        self._on_drop: Callable[..., None] | None = on_drop
+        self._name: str = name
+        self._item_name: str = item_name
+        self._handle_verb: str = handle_verb
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        self._worker_tasks: set[asyncio.Task] = set()
+        self._metrics: WorkerQueueMetrics = metrics_class(self._queue)
+
+    @property
+    def max_size(self) -> int:
+        """Get the maximum number of items waiting in the queue."""
+        return self._max_size
+
+    @property
+    def metrics(self) -> WorkerQueueMetrics:
+        """Get the metrics of the queue."""
+        return self._metrics
+
+    async def put(self, *args: Any):
+        """Put an item on the queue, the arguments are passed to the handler."""
+        self._start_workers()
+        self._metrics.record_queued()
+        _item = (asyncio.get_running_loop().time(), args)
+
+        if self._overflow_policy == WorkerQueueOverflowPolicy.block:
+            await self._queue.put(_item)
+            return
+
+        if self._queue.full():
+            if self._overflow_policy == WorkerQueueOverflowPolicy.raise_error:
+                raise self._full_exception()
+
+            if self._overflow_policy == WorkerQueueOverflowPolicy.drop_newest:
+                self._dropped(args)
+                return
+
+            _, _dropped_args = self._queue.get_nowait()
+            self._queue.task_done()
+            self._dropped(_dropped_args)
+
+        self._queue.put_nowait(_item)
+
+    async def drain(self):
+        """Wait until all items on the queue are handled."""
+        if self._worker_tasks:
+            await self._queue.join()
+
+    async def close(self):
+        """Stop the workers, items still on the queue are discarded."""
+        for _task in self._worker_tasks:
+            _task.cancel()
+
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks.clear()
+
+    def _full_exception(self) -> Exception:
+        """Get the exception raised for an item put on a full queue."""
+        return QueueFullException(self._name, self._max_size)
+
+    def _dropped(self, args: tuple[Any, ...]):
+        """Record and report an item dropped from a full queue."""
+        self._metrics.record_dropped()
+        _LOGGER.warning(
+            "%s is full, dropped %s: %s",
+            self._name.capitalize(),
+            self._item_name,
+            args[0] if len(args) == 1 else args,
+        )
+        if self._on_drop is not None:
+            self._on_drop(*args)
+
+    def _start_workers(self):
+        """Start the workers, if not running yet."""
+        while len(self._worker_tasks) < self._workers:
+            _task = asyncio.create_task(
+                self._worker(),
+                name=(
+                    f"{self._name.replace(' ', '_')}_worker_{len(self._worker_tasks)}"
+                ),
+            )
+            self._worker_tasks.add(_task)
+
+    async def _worker(self):
+        """Pass the items from the queue to the handler."""
+        _loop = asyncio.get_running_loop()
+
+        while True:
+            _queued, _args = await self._queue.get()
+            _started = _loop.time()
+            try:
+                if inspect.iscoroutinefunction(self._handler):
+                    await self._handler(*_args)
+                else:
+                    self._handler(*_args)
+            except Exception:  # noqa: BLE001
+                self._metrics.record_failed(_started - _queued, _loop.time() - _started)
+                _LOGGER.exception(
+                    "Failed to %s %s: %s",
+                    self._handle_verb,
+                    self._item_name,
+                    _args[0] if len(_args) == 1 else _args,
+                )
+            else:
+                self._metrics.record_completed(
+                    _started - _queued, _loop.time() - _started
+                )
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,117 @@
+"""ABB-Free@Home bounded queue for background api writes."""
+
+from collections.abc import Awaitable, Callable
+import enum
+from typing import Any
+
+from .exceptions import WriteQueueFullException
+from .worker_queue import WorkerQueue, WorkerQueueMetrics
+
+# Write Queue Configuration
+DEFAULT_WRITE_QUEUE_MAX_SIZE = 100
+DEFAULT_WRITE_QUEUE_WORKERS = 5
+
+
+class WriteQueueOverflowPolicy(enum.Enum):
+    """An Enum class for the behavior of a full write queue."""
+
+    block = "block"
+    drop_oldest = "drop_oldest"
+    raise_error = "raise"
+
+
+class WriteQueueMetrics(WorkerQueueMetrics):
+    """Provides metrics of a write queue."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the WriteQueueMetrics class."""
+        super().__init__(*args, **kwargs)
+        self._total_latency: float = 0.0
+        self._max_latency: float = 0.0
+
+    @property
+    def sent(self) -> int:
+        """Get the number of writes sent successfully."""
+        return self.completed
+
+    @property
+    def average_latency(self) -> float | None:
+        """Get the average seconds from queueing a write until it completed."""
+        _completed = self.completed + self.failed
+        if _completed == 0:
+            return None
+        return self._total_latency / _completed
+
+    @property
+    def max_latency(self) -> float:
+        """Get the maximum seconds from queueing a write until it completed."""
+        return self._max_latency
+
+    def record_completed(self, queue_latency: float, handler_latency: float):
+        """Record a write sent successfully."""
+        super().record_completed(queue_latency, handler_latency)
+        self._record_latency(queue_latency + handler_latency)
+
+    def record_failed(self, queue_latency: float, handler_latency: float):
+        """Record a failed write."""
+        super().record_failed(queue_latency, handler_latency)
+        self._record_latency(queue_latency + handler_latency)
+
+    def _record_latency(self, latency: float):
+        """Record the latency of a completed write."""
+        self._total_latency += latency
+        self._max_latency = max(self._max_latency, latency)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the metrics."""
+        return (
+            f"WriteQueueMetrics(depth={self.depth}, sent={self.sent}, "
+            f"failed={self.failed}, dropped={self.dropped})"
+        )
+
+
+class WriteQueue(WorkerQueue):
+    """Sends writes in the background using a bounded queue and worker pool."""
+
+    def __init__(
+        self,
+        handler: Callable[..., Awaitable[Any]],
+        max_size: int = DEFAULT_WRITE_QUEUE_MAX_SIZE,
+        workers: int = DEFAULT_WRITE_QUEUE_WORKERS,
+        overflow_policy: WriteQueueOverflowPolicy = WriteQueueOverflowPolicy.block,
+        on_drop: Callable[..., None] | None = None,
+    ) -> None:
+        """
+        Initialize the WriteQueue class.
+
+        Args:
+            handler: The coroutine function sending a single write.
+            max_size: The maximum number of writes waiting in the queue.
+            workers: The number of writes sent concurrently.
+            overflow_policy: What to do when a write is put on a full queue,
+                wait for a free slot (block), drop the oldest write
+                (drop_oldest) or raise a WriteQueueFullException (raise).
+            on_drop: Called with the arguments of a write dropped from a full
+                queue.
+
+        """
+        super().__init__(
+            handler=handler,
+            max_size=max_size,
+            workers=workers,
+            overflow_policy=overflow_policy,
+            metrics_class=WriteQueueMetrics,
+            on_drop=on_drop,
+            name="write queue",
+            item_name="write",
+            handle_verb="send",
+        )
+
+    @property
+    def metrics(self) -> WriteQueueMetrics:
+        """Get the metrics of the queue."""
+        return self._metrics
+
+    def _full_exception(self) -> Exception:
+        """Get the exception raised for a write put on a full queue."""
+        return WriteQueueFullException(self._max_size)
@@ -0,0 +1,323 @@
+"""ABB-Free@Home supervisor keeping the websocket connected."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import enum
+import logging
+
+from aiohttp.client_exceptions import (
+    ClientConnectionError as AioHttpClientConnectionError,
+    ClientSSLError as AioClientSSLError,
+    WSServerHandshakeError as AioHttpWSServerHandshakeError,
+)
+import backoff
+
+from .api import FreeAtHomeApi
+from .exceptions import SslErrorException
+from .message import WebsocketMessage
+from .receive_queue import (
+    DEFAULT_RECEIVE_QUEUE_DISPATCHERS,
+    DEFAULT_RECEIVE_QUEUE_MAX_SIZE,
+    ReceiveQueue,
+    ReceiveQueueMetrics,
+    ReceiveQueueOverflowPolicy,
+)
+
+# Websocket Supervisor Configuration
+DEFAULT_WS_RECONNECT_MIN_INTERVAL = 1.0
+DEFAULT_WS_RECONNECT_MAX_INTERVAL = 60.0
+DEFAULT_WS_STABLE_CONNECTION_INTERVAL = 30.0
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WebsocketState(enum.Enum):
+    """An Enum class for the connection state of the websocket."""
+
+    disconnected = "disconnected"
+    connecting = "connecting"
+    connected = "connected"
+
+
+class WebsocketMetrics:
+    """Provides metrics of a supervised websocket connection."""
+
+    def __init__(self, heartbeat: float | None) -> None:
+        """Initialize the WebsocketMetrics class."""
+        self._heartbeat: float | None = heartbeat
+        self._connects: int = 0
+        self._disconnects: int = 0
+        self._failed_attempts: int = 0
+        self._downtime: float = 0.0
+        self._last_downtime: float | None = None
+        self._missed_intervals: int = 0
+
+    @property
+    def connects(self) -> int:
+        """Get the number of times the websocket connected."""
+        return self._connects
+
+    @property
+    def disconnects(self) -> int:
+        """Get the number of times the websocket connection was lost."""
+        return self._disconnects
+
+    @property
+    def failed_attempts(self) -> int:
+        """Get the number of failed connection attempts."""
+        return self._failed_attempts
+
+    @property
+    def downtime(self) -> float:
+        """Get the total seconds the websocket was disconnected."""
+        return self._downtime
+
+    @property
+    def last_downtime(self) -> float | None:
+        """Get the seconds of the last outage, None if there was none."""
+        return self._last_downtime
+
+    @property
+    def missed_intervals(self) -> int:
+        """Get the number of heartbeat intervals missed while disconnected."""
+        return self._missed_intervals
+
+    def record_connected(self, downtime: float | None):
+        """Record a connection, with the downtime when it was a reconnect."""
+        self._connects += 1
+        if downtime is None:
+            return
+
+        self._downtime += downtime
+        self._last_downtime = downtime
+        if self._heartbeat:
+            self._missed_intervals += int(downtime // self._heartbeat)
+
+    def record_disconnected(self):
+        """Record a lost connection."""
+        self._disconnects += 1
+
+    def record_failed_attempt(self):
+        """Record a failed connection attempt."""
+        self._failed_attempts += 1
+
+    def __repr__(self) -> str:
+        """Return a string representation of the metrics."""
+        return (
+            f"WebsocketMetrics(connects={self.connects}, "
+            f"disconnects={self.disconnects}, "
+            f"failed_attempts={self.failed_attempts}, "
+            f"downtime={self.downtime:.1f}, "
+            f"missed_intervals={self.missed_intervals})"
+        )
+
+
+class WebsocketSupervisor:
+    """Keeps the websocket connected and resynchronizes state after an outage."""
+
+    def __init__(
+        self,
+        api: FreeAtHomeApi,
+        callback: Callable[[WebsocketMessage], None] | None = None,
+        on_reconnect: Callable[[float], Awaitable[None]] | None = None,
+        reconnect_min_interval: float = DEFAULT_WS_RECONNECT_MIN_INTERVAL,
+        reconnect_max_interval: float = DEFAULT_WS_RECONNECT_MAX_INTERVAL,
+        stable_connection_interval: float = DEFAULT_WS_STABLE_CONNECTION_INTERVAL,
+        receive_queue_max_size: int = DEFAULT_RECEIVE_QUEUE_MAX_SIZE,
+        receive_queue_dispatchers: int = DEFAULT_RECEIVE_QUEUE_DISPATCHERS,
+        receive_queue_overflow_policy: ReceiveQueueOverflowPolicy = (
+            ReceiveQueueOverflowPolicy.block
+        ),
+    ) -> None:
+        """
+        Initialize the WebsocketSupervisor class.
+
+        Args:
+            api: The api the websocket is connected with.
+            callback: Called with every message received on the websocket. The
+                messages are passed to the callback by dispatcher tasks, so a
+                slow callback does not delay reading the websocket.
+            on_reconnect: Awaited in the background with the seconds the
+                websocket was disconnected, after every reconnect. Reconnects
+                while it runs are merged into a single call once it completed.
+            reconnect_min_interval: The base of the exponential backoff between
+                connection attempts in seconds.
+            reconnect_max_interval: The maximum backoff between connection
+                attempts in seconds. Every delay is jittered between zero and
+                the backoff.
+            stable_connection_interval: The seconds a connection has to stay up
+                to reset the backoff. A connection lost sooner is retried after
+                the next backoff delay.
+            receive_queue_max_size: The maximum number of received messages
+                waiting for the callback.
+            receive_queue_dispatchers: The number of messages passed to the
+                callback concurrently.
+            receive_queue_overflow_policy: What to do when a message is
+                received while the queue is full. Defaults to block.
+
+        """
+        self._api: FreeAtHomeApi = api
+        self._on_reconnect = on_reconnect
+        self._reconnect_min_interval: float = reconnect_min_interval
+        self._reconnect_max_interval: float = reconnect_max_interval
+        self._stable_connection_interval: float = stable_connection_interval
+        self._attempt: int = 0
+        self._state: WebsocketState = WebsocketState.disconnected
+        self._state_callbacks: set[Callable[[WebsocketState], None]] = set()
+        self._metrics: WebsocketMetrics = WebsocketMetrics(api.ws_heartbeat)
+        self._connected_at: float | None = None
+        self._disconnected_at: float | None = None
+        self._resync_task: asyncio.Task | None = None
+        self._resync_pending_downtime: float | None = None
+        self._receive_queue: ReceiveQueue | None = None
+        if callback is not None:
+            self._receive_queue = ReceiveQueue(
+                callback=callback,
+                max_size=receive_queue_max_size,
+                dispatchers=receive_queue_dispatchers,
+                overflow_policy=receive_queue_overflow_policy,
+            )
+
+    @property
+    def metrics(self) -> WebsocketMetrics:
+        """Get the metrics of the websocket connection."""
+        return self._metrics
+
+    @property
+    def receive_queue_metrics(self) -> ReceiveQueueMetrics | None:
+        """Get the metrics of the receive queue, None without a callback."""
+        if self._receive_queue is None:
+            return None
+        return self._receive_queue.metrics
+
+    @property
+    def state(self) -> WebsocketState:
+        """Get the connection state of the websocket."""
+        return self._state
+
+    def register_state_callback(self, callback: Callable[[WebsocketState], None]):
+        """Register callback, called with the new state when the state changes."""
+        self._state_callbacks.add(callback)
+
+    def remove_state_callback(self, callback: Callable[[WebsocketState], None]):
+        """Remove previously registered state callback."""
+        self._state_callbacks.discard(callback)
+
+    async def run(self):
+        """Keep the websocket connected and receive messages until cancelled."""
+        _callback = None
+        if self._receive_queue is not None:
+            _callback = self._receive_queue.put
+
+        try:
+            while True:
+                await self._connect()
+
+                while self._api.ws_connected:
+                    await self._api.ws_read(_callback)
+
+                self._disconnected_at = asyncio.get_running_loop().time()
+                self._metrics.record_disconnected()
+                self._set_state(WebsocketState.disconnected)
+
+                # Only a stable connection resets the backoff, so a connection
+                # dropped right after connecting isn't retried in a tight loop
+                if (
+                    self._disconnected_at - self._connected_at
+                    >= self._stable_connection_interval
+                ):
+                    self._attempt = 0
+                else:
+                    _delay = self._next_delay()
+                    _LOGGER.warning(
+                        "Websocket connection lost, reconnecting in %.1f seconds.",
+                        _delay,
+                    )
+                    await asyncio.sleep(_delay)
+        finally:
+            if self._resync_task is not None:
+                self._resync_task.cancel()
+
+            if self._receive_queue is not None:
+                await self._receive_queue.close()
+
+            self._set_state(WebsocketState.disconnected)
+
+    async def _connect(self):
+        """Connect the websocket, retrying with a jittered exponential backoff."""
+        self._set_state(WebsocketState.connecting)
+
+        while True:
+            try:
+                await self._api.ws_connect()
+            except AioClientSSLError as e:
+                raise SslErrorException(self._api.host) from e
+            except (
+                AioHttpWSServerHandshakeError,
+                AioHttpClientConnectionError,
+                TimeoutError,
+            ):
+                _delay = self._next_delay()
+                self._metrics.record_failed_attempt()
+                _LOGGER.exception(
+                    "Websocket connection failed, retrying in %.1f seconds.", _delay
+                )
+                await asyncio.sleep(_delay)
+            else:
+                break
+
+        self._connected_at = asyncio.get_running_loop().time()
+        _downtime = None
+        if self._disconnected_at is not None:
+            _downtime = self._connected_at - self._disconnected_at
+            self._disconnected_at = None
+
+        self._metrics.record_connected(_downtime)
+        self._set_state(WebsocketState.connected)
+
+        if _downtime is None or self._on_reconnect is None:
+            return
+
+        if self._resync_task is not None and not self._resync_task.done():
+            # Merge into a single resynchronization after the running one
+            self._resync_pending_downtime = (
+                self._resync_pending_downtime or 0.0
+            ) + _downtime
+            return
+
+        # Resynchronize in the background, so the websocket is read meanwhile
+        self._resync_task = asyncio.create_task(self._reconnected(_downtime))
+
+    async def _reconnected(self, downtime: float):
+        """Run the reconnect callback until no reconnect is pending, logging errors."""
+        _downtime = downtime
+        while _downtime is not None:
+            try:
+                await self._on_reconnect(_downtime)
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Failed to resynchronize after websocket reconnect.")
+
+            _downtime = self._resync_pending_downtime
+            self._resync_pending_downtime = None
+
+    def _next_delay(self) -> float:
+        """Get the jittered delay before the next connection attempt."""
+        _backoff = min(
+            self._reconnect_max_interval,
+            self._reconnect_min_interval * 2**self._attempt,
+        )
+
+        # Stop growing at the maximum, so a long outage can't overflow the backoff
+        if 0 < _backoff < self._reconnect_max_interval:
+            self._attempt += 1
+
+        return backoff.full_jitter(_backoff)
+
+    def _set_state(self, state: WebsocketState):
+        """Set the connection state, calling the state callbacks on a change."""
+        if state == self._state:
+            return
+
+        self._state = state
+        for _callback in list(self._state_callbacks):
+            _callback(state)
@@ -11,7 +11,8 @@ import pytest_asyncio
 import voluptuous as vol
 
 from src.abbfreeathome import api as api_module
-from src.abbfreeathome.api import FreeAtHomeApi, FreeAtHomeSettings
+from src.abbfreeathome.api import DatapointWrite, FreeAtHomeApi, FreeAtHomeSettings
+from src.abbfreeathome.connection_pool import ConnectionPool
 from src.abbfreeathome.exceptions import (
     BadRequestException,
     ClientConnectionError,
@@ -23,7 +24,10 @@ from src.abbfreeathome.exceptions import (
     SetDatapointFailureException,
     SslErrorException,
     UserNotFoundException,
+    WriteQueueFullException,
 )
+from src.abbfreeathome.message import WebsocketMessage
+from src.abbfreeathome.write_queue import WriteQueueOverflowPolicy
 
 
 @pytest_asyncio.fixture
@@ -359,6 +363,35 @@ async def test_set_datapoint(api):
         assert result is True
 
 
+@pytest.mark.asyncio
+async def test_set_datapoints(api):
+    """Test the set_datapoints function."""
+    with patch.object(
+        api, "_set_datapoint_request", new_callable=AsyncMock
+    ) as mock_request:
+        mock_request.side_effect = [
+            None,
+            SetDatapointFailureException("ABB7F62F6C0B", "ch0000", "idp0000", "1"),
+        ]
+
+        results = await api.set_datapoints(
+            [
+                ("ABB7F500E17A", "ch0003", "idp0000", "1"),
+                DatapointWrite("ABB7F500E17A", "ch0003", "idp0000", "0"),
+                ("ABB7F62F6C0B", "ch0000", "idp0000", "1"),
+            ],
+            wait_for_result=True,
+        )
+
+    # Only the last value of a datapoint is sent
+    assert mock_request.await_count == 2
+    mock_request.assert_any_await("ABB7F500E17A", "ch0003", "idp0000", "0")
+    assert results["ABB7F500E17A.ch0003.idp0000"] is None
+    assert isinstance(
+        results["ABB7F62F6C0B.ch0000.idp0000"], SetDatapointFailureException
+    )
+
+
 @pytest.mark.asyncio
 async def test_virtualdevice(api):
     """Test the virtualdevice function."""
@@ -392,44 +425,88 @@ async def test_set_datapoint_fire_and_forget(api):
     with patch.object(api, "_request", return_value=Mock()) as mock_request:
         mock_request.return_value.get.return_value = {"result": "ok"}
 
-        # Verify the background task set is initially empty
-        assert len(api._background_tasks) == 0
-
         result = await api.set_datapoint(
             "device_serial", "channel_id", "datapoint", "value", wait_for_result=False
         )
         assert result is True
 
-        # Verify task was added to the set
-        assert len(api._background_tasks) == 1
+        # Verify the write was queued
+        assert api.write_queue_metrics.depth == 1
 
-        # Wait for background tasks to complete deterministically
-        await asyncio.gather(*api._background_tasks)
+        # Wait for the queued writes to complete deterministically
+        await api.drain()
+        mock_request.assert_called_once()
 
-        # Verify task was removed from the set after completion
-        assert len(api._background_tasks) == 0
+    assert api.write_queue_metrics.depth == 0
+    assert api.write_queue_metrics.sent == 1
+    assert api.write_queue_metrics.failed == 0
 
 
 @pytest.mark.asyncio
-async def test_set_datapoint_background_exception(api):
+async def test_set_datapoint_background_exception(api, caplog):
     """Test the set_datapoint background exception handling."""
     with patch.object(api, "_request", side_effect=Exception("Test error")):
-        # Verify the background task set is initially empty
-        assert len(api._background_tasks) == 0
-
         result = await api.set_datapoint(
             "device_serial", "channel_id", "datapoint", "value", wait_for_result=False
         )
         assert result is True
 
-        # Verify task was added to the set
-        assert len(api._background_tasks) == 1
+        # Wait for the queued writes to complete (even with exceptions)
+        await api.drain()
+
+    assert api.write_queue_metrics.sent == 0
+    assert api.write_queue_metrics.failed == 1
+    assert "Test error" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_set_datapoint_fire_and_forget_queue_full():
+    """Test the set_datapoint function with a full write queue."""
+    api_fire_and_forget = FreeAtHomeApi(
+        host="http://192.168.1.1",
+        username="user",
+        password="pass",
+        wait_for_result=False,
+        write_queue_max_size=1,
+        write_queue_workers=1,
+        write_queue_overflow_policy=WriteQueueOverflowPolicy.raise_error,
+    )
+    try:
+        with patch.object(api_fire_and_forget, "_request") as mock_request:
+            mock_request.return_value = {
+                "00000000-0000-0000-0000-000000000000": {"result": "ok"}
+            }
+            await api_fire_and_forget.set_datapoint("serial", "ch0000", "idp0000", "1")
+            with pytest.raises(WriteQueueFullException):
+                await api_fire_and_forget.set_datapoint(
+                    "serial", "ch0000", "idp0000", "2"
+                )
+            await api_fire_and_forget.drain()
+            mock_request.assert_called_once()
+    finally:
+        await api_fire_and_forget.close_client_session()
+
 
-        # Wait for background tasks to complete (even with exceptions)
-        await asyncio.gather(*api._background_tasks, return_exceptions=True)
+@pytest.mark.asyncio
+async def test_aexit_drains_write_queue():
+    """Test the __aexit__ function sends the queued writes."""
+    with patch.object(FreeAtHomeApi, "_request") as mock_request:
+        mock_request.return_value = {
+            "00000000-0000-0000-0000-000000000000": {"result": "ok"}
+        }
+        async with FreeAtHomeApi(
+            host="http://192.168.1.1",
+            username="user",
+            password="pass",
+            wait_for_result=False,
+        ) as api_fire_and_forget:
+            for _value in ("1", "2", "3"):
+                await api_fire_and_forget.set_datapoint(
+                    "serial", "ch0000", "idp0000", _value
+                )
 
-        # Verify task was removed from the set even after exception
-        assert len(api._background_tasks) == 0
+        assert mock_request.call_count == 3
+        assert api_fire_and_forget.write_queue_metrics.sent == 3
 
 
 @pytest.mark.asyncio
@@ -450,8 +527,9 @@ async def test_api_class_level_wait_for_result():
                 "device_serial", "channel_id", "datapoint", "value"
             )
             assert result is True
-            # Wait for background tasks to complete deterministically
-            await asyncio.gather(*api_fire_and_forget._background_tasks)
+            # Wait for the queued writes to complete deterministically
+            await api_fire_and_forget.drain()
+            mock_request.assert_called_once()
     finally:
         await api_fire_and_forget.close_client_session()
 
@@ -479,14 +557,134 @@ async def test_api_class_level_wait_for_result_with_override():
                 wait_for_result=True,
             )
             assert result is True
-            # Verify no background tasks were created (synchronous mode)
-            assert len(api_fire_and_forget._background_tasks) == 0
+            # Verify no write was queued (synchronous mode)
+            assert api_fire_and_forget.write_queue_metrics.depth == 0
             # Verify request was called directly (not in background)
             mock_request.assert_called_once()
     finally:
         await api_fire_and_forget.close_client_session()
 
 
+@pytest_asyncio.fixture
+async def coalescing_api():
+    """Create FreeAtHome Api Fixture with coalesced writes."""
+    instance = FreeAtHomeApi(
+        host="http://192.168.1.1",
+        username="user",
+        password="pass",
+        coalesce_writes=True,
+    )
+    yield instance
+    await instance.close_client_session()
+
+
+@pytest.mark.asyncio
+async def test_set_datapoint_coalesced(coalescing_api):
+    """Test newer values replace a pending write while a write is in flight."""
+    release = asyncio.Event()
+    sent_values = []
+
+    async def request(path, method, data):
+        sent_values.append(data)
+        await release.wait()
+        return {"00000000-0000-0000-0000-000000000000": {"result": "ok"}}
+
+    with patch.object(coalescing_api, "_request", side_effect=request):
+        first = asyncio.create_task(
+            coalescing_api.set_datapoint("ABB7F500E17A", "ch0000", "idp0000", "1")
+        )
+        await asyncio.sleep(0)
+        superseded = asyncio.create_task(
+            coalescing_api.set_datapoint("ABB7F500E17A", "ch0000", "idp0000", "2")
+        )
+        await asyncio.sleep(0)
+        await coalescing_api.set_datapoint(
+            "ABB7F500E17A", "ch0000", "idp0000", "3", wait_for_result=False
+        )
+        latest = asyncio.create_task(
+            coalescing_api.set_datapoint("ABB7F500E17A", "ch0000", "idp0000", "4")
+        )
+        await asyncio.sleep(0)
+
+        release.set()
+        assert await asyncio.gather(first, superseded, latest) == [True, True, True]
+
+    # Only the value in flight and the latest value are sent, through the queue
+    assert sent_values == ["1", "4"]
+    await coalescing_api.drain()
+    assert coalescing_api.write_queue_metrics.sent == 1
+    assert coalescing_api._coalesced_keys == set()
+
+
+@pytest.mark.asyncio
+async def test_set_datapoint_coalesced_failure(coalescing_api):
+    """Test a failed coalesced write is raised to the waiting callers."""
+    with patch.object(coalescing_api, "_request", return_value=Mock()) as mock_request:
+        mock_request.return_value.get.return_value = {"result": "fail"}
+        with pytest.raises(SetDatapointFailureException):
+            await coalescing_api.set_datapoint("ABB7F500E17A", "ch0000", "idp0000", "1")
+
+
+@pytest.mark.asyncio
+async def test_set_datapoint_coalesced_fire_and_forget_failure(coalescing_api, caplog):
+    """Test a failed coalesced write is logged in fire-and-forget mode."""
+    with patch.object(coalescing_api, "_request", side_effect=Exception("Test error")):
+        result = await coalescing_api.set_datapoint(
+            "ABB7F500E17A", "ch0000", "idp0000", "1", wait_for_result=False
+        )
+        assert result is True
+
+        await coalescing_api.drain()
+
+    assert coalescing_api.write_queue_metrics.failed == 1
+    assert "Failed to send write" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_set_datapoint_coalesced_dropped():
+    """Test a coalesced write dropped from a full queue fails its callers."""
+    instance = FreeAtHomeApi(
+        host="http://192.168.1.1",
+        username="user",
+        password="pass",
+        coalesce_writes=True,
+        write_queue_max_size=1,
+        write_queue_workers=1,
+        write_queue_overflow_policy=WriteQueueOverflowPolicy.drop_oldest,
+    )
+    release = asyncio.Event()
+
+    async def request(path, method, data):
+        await release.wait()
+        return {"00000000-0000-0000-0000-000000000000": {"result": "ok"}}
+
+    try:
+        with patch.object(instance, "_request", side_effect=request):
+            await instance.set_datapoint(
+                "ABB7F500E17A", "ch0000", "idp0000", "1", wait_for_result=False
+            )
+            await asyncio.sleep(0)
+            dropped = asyncio.create_task(
+                instance.set_datapoint("ABB7F500E17A", "ch0001", "idp0000", "1")
+            )
+            await asyncio.sleep(0)
+            await instance.set_datapoint(
+                "ABB7F500E17A", "ch0002", "idp0000", "1", wait_for_result=False
+            )
+
+            with pytest.raises(WriteQueueFullException):
+                await dropped
+
+            release.set()
+            await instance.drain()
+
+        assert instance.write_queue_metrics.sent == 2
+        assert instance.write_queue_metrics.dropped == 1
+        assert instance._coalesced_keys == set()
+    finally:
+        await instance.close_client_session()
+
+
 @pytest.mark.asyncio
 async def test_ws_connect(api):
     """Test the ws_connect function."""
@@ -573,16 +771,26 @@ async def test_ws_receive(api):
         mock_ws_response.return_value.receive = AsyncMock(
             return_value=Mock(
                 type=aiohttp.WSMsgType.TEXT,
-                json=Mock(return_value={api._sysap_uuid: "data"}),
+                json=Mock(
+                    return_value={
+                        api._sysap_uuid: {
+                            "datapoints": {"ABB7F500E17A/ch0003/odp0000": "1"}
+                        }
+                    }
+                ),
             )
         )
         with patch("asyncio.sleep", new_callable=AsyncMock):
             # Check both async and non-async callbacks.
             await api.ws_receive(async_callback)
-            async_callback.assert_called_once_with("data")
+            async_callback.assert_called_once()
+            _message = async_callback.call_args.args[0]
+            assert isinstance(_message, WebsocketMessage)
+            assert _message.datapoints == (("ABB7F500E17A/ch0003/odp0000", "1"),)
 
             await api.ws_receive(mock_callback)
-            async_callback.assert_called_once_with("data")
+            mock_callback.assert_called_once()
+            assert isinstance(mock_callback.call_args.args[0], WebsocketMessage)
 
     # Test Different Connection Errors
     api._ws_response = None
@@ -925,6 +1133,53 @@ async def test_get_client_session_returns_existing_session(api):
     assert api._close_client_session is False
 
 
+@pytest.mark.asyncio
+async def test_get_client_session_shared_connection_pool():
+    """Test FreeAtHomeSettings and FreeAtHomeApi share the pool session."""
+    async with ConnectionPool() as pool:
+        settings = FreeAtHomeSettings(host="http://192.168.1.1", connection_pool=pool)
+        api = FreeAtHomeApi(
+            host="http://192.168.1.1",
+            username="user",
+            password="pass",
+            connection_pool=pool,
+        )
+
+        session = settings._get_client_session()
+        assert api._get_client_session() is session
+        assert settings._close_client_session is False
+        assert api._close_client_session is False
+
+        # Closing the api classes leaves the pool session open
+        await settings.close_client_session()
+        await api.close_client_session()
+        assert session.closed is False
+
+    assert session.closed is True
+
+
+@pytest.mark.asyncio
+async def test_get_ssl_context_shared_connection_pool():
+    """Test FreeAtHomeSettings and FreeAtHomeApi share the pool SSL context."""
+    pool = ConnectionPool()
+    settings = FreeAtHomeSettings(
+        host="http://192.168.1.1", ssl_cert_ca_file="dummy_path", connection_pool=pool
+    )
+    api = FreeAtHomeApi(
+        host="http://192.168.1.1",
+        username="user",
+        password="pass",
+        ssl_cert_ca_file="dummy_path",
+        connection_pool=pool,
+    )
+
+    with patch("ssl.create_default_context") as mock_create_context:
+        mock_create_context.return_value = Mock()
+        context = await settings._get_ssl_context()
+        assert await api._get_ssl_context() is context
+        mock_create_context.assert_called_once_with(cafile="dummy_path")
+
+
 @pytest.mark.asyncio
 async def test_ws_receive_with_non_async_callback(api):
     """Test the ws_receive function with non-async callback."""
@@ -941,12 +1196,13 @@ async def test_ws_receive_with_non_async_callback(api):
             mock_ws_response.return_value.receive = AsyncMock(
                 return_value=Mock(
                     type=aiohttp.WSMsgType.TEXT,
-                    json=Mock(return_value={api._sysap_uuid: "test_data"}),
+                    json=Mock(return_value={api._sysap_uuid: {"devicesAdded": ["A"]}}),
                 )
             )
 
             await api.ws_receive(callback)
-            callback.assert_called_once_with("test_data")
+            callback.assert_called_once()
+            assert callback.call_args.args[0].devices_added == ("A",)
 
 
 @pytest.mark.asyncio
@@ -963,7 +1219,7 @@ async def test_ws_receive_no_callback(api):
             mock_ws_response.return_value.receive = AsyncMock(
                 return_value=Mock(
                     type=aiohttp.WSMsgType.TEXT,
-                    json=Mock(return_value={api._sysap_uuid: "test_data"}),
+                    json=Mock(return_value={api._sysap_uuid: {"devicesAdded": ["A"]}}),
                 )
             )
 
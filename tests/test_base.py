@@ -1,13 +1,15 @@
 """Test class to test the Base channel."""
 
-from unittest.mock import MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.abbfreeathome.api import FreeAtHomeApi
 from src.abbfreeathome.bin.pairing import Pairing
 from src.abbfreeathome.bin.parameter import Parameter
-from src.abbfreeathome.channels.base import Base
+from src.abbfreeathome.callback_executor import CallbackExecutor
+from src.abbfreeathome.channels.base import Base, datapoint_handler
 from src.abbfreeathome.device import Device
 from src.abbfreeathome.exceptions import (
     InvalidDeviceChannelPairing,
@@ -95,6 +97,31 @@ def test_get_output_by_pairing(base_instance):
         base_instance.get_output_by_pairing(Pairing.AL_HSV)
 
 
+def test_get_output_by_pairing_after_update(base_instance):
+    """Test the pairing index reflects values updated from the websocket."""
+    base_instance.update_channel("ABB7F500E17A/ch0003/odp0000", "1")
+    output_id, value = base_instance.get_output_by_pairing(Pairing.AL_INFO_ON_OFF)
+    assert output_id == "odp0000"
+    assert value == "1"
+
+
+def test_get_input_by_pairing_first_match(mock_device):
+    """Test the first datapoint wins when a pairing id is used more than once."""
+    mock_device.device_serial = "ABB7F500E17A"
+    instance = Base(
+        device=mock_device,
+        channel_id="ch0000",
+        channel_name="Channel Name",
+        inputs={
+            "idp0000": {"pairingID": 1, "value": "0"},
+            "idp0001": {"pairingID": 1, "value": "1"},
+        },
+        outputs={},
+        parameters={},
+    )
+    assert instance.get_input_by_pairing(Pairing.AL_SWITCH_ON_OFF) == ("idp0000", "0")
+
+
 def test_get_channel_parameter(base_instance):
     """Test the get_channel_parameter function."""
     parameter_id, value = base_instance.get_channel_parameter(
@@ -107,6 +134,23 @@ def test_get_channel_parameter(base_instance):
         base_instance.get_channel_parameter(Parameter.PID_DIMMER_SWITCH_ON_MODE)
 
 
+def test_get_channel_parameter_invalid_id(mock_device):
+    """Test parameters with an unparsable id are ignored by the index."""
+    mock_device.device_serial = "ABB7F500E17A"
+    instance = Base(
+        device=mock_device,
+        channel_id="ch0000",
+        channel_name="Channel Name",
+        inputs={},
+        outputs={},
+        parameters={"parXYZ": "1", "par0007": "2"},
+    )
+    assert instance.get_channel_parameter(Parameter.PID_LED_OPERATION_MODE) == (
+        "par0007",
+        "2",
+    )
+
+
 def test_register_callback(base_instance):
     """Test register a callback."""
     callback = MagicMock()
@@ -149,6 +193,60 @@ def test_remove_callback(base_instance):
     assert callback not in base_instance._callbacks["test"]
 
 
+@pytest.mark.asyncio
+async def test_set_callback_debounce(base_instance):
+    """Test a burst of updates is collapsed into a single callback."""
+    callback = MagicMock()
+    base_instance.register_callback(callback_attribute="test", callback=callback)
+    base_instance.set_callback_debounce(interval=0.01, callback_attribute="test")
+
+    # The first update is delivered right away, the burst after it at the end
+    for _ in range(5):
+        base_instance.run_callbacks("test")
+    assert callback.call_count == 1
+
+    await asyncio.sleep(0.02)
+    assert callback.call_count == 2
+
+    # Removing the limit delivers a pending call and calls right away again
+    base_instance.run_callbacks("test")
+    base_instance.set_callback_debounce(interval=None)
+    assert callback.call_count == 3
+
+    base_instance.run_callbacks("test")
+    assert callback.call_count == 4
+    assert base_instance._callback_debouncers == {}
+
+    with pytest.raises(UnknownCallbackAttributeException):
+        base_instance.set_callback_debounce(
+            interval=1.0, callback_attribute="not_there"
+        )
+
+
+def test_set_callback_debounce_without_loop(base_instance):
+    """Test the callbacks are called right away without an event loop."""
+    callback = MagicMock()
+    base_instance.register_callback(callback_attribute="test", callback=callback)
+    base_instance.set_callback_debounce(interval=1.0)
+
+    base_instance.run_callbacks("test")
+    base_instance.run_callbacks("test")
+    assert callback.call_count == 2
+
+
+def test_set_callback_executor(base_instance):
+    """Test the callbacks are run by the callback executor."""
+    executor = MagicMock(spec=CallbackExecutor)
+    callback = MagicMock()
+    base_instance.register_callback(callback_attribute="test", callback=callback)
+    base_instance.set_callback_executor(executor)
+
+    base_instance.run_callbacks("test")
+
+    executor.submit.assert_called_once_with(callback)
+    callback.assert_not_called()
+
+
 def test_remove_callback_empty_set(base_instance):
     """Test removing a callback when the callback set is empty."""
     # Set up _callbacks with empty set for "test" attribute
@@ -182,6 +280,155 @@ def test_update_channel(base_instance):
     base_instance.update_channel("AL_SWITCH_ON_OFF/idp0000", "1")
 
 
+def test_update_datapoint(base_instance):
+    """Test updating a resolved datapoint without registered callbacks."""
+    _datapoint = base_instance.get_update_datapoints()["odp0000"]
+    base_instance.update_datapoint("ABB7F500E17A/ch0003/odp0000", _datapoint, "1")
+    assert _datapoint["value"] == "1"
+
+    # Base channels only update from output datapoints
+    assert "idp0000" not in base_instance.get_update_datapoints()
+
+
+class HandlerChannel(Base):
+    """Channel with datapoint handlers for testing the handler table."""
+
+    @datapoint_handler(Pairing.AL_INFO_ON_OFF, "state")
+    def _refresh_on_off(self, value: str):
+        self.state = value == "1"
+
+    @datapoint_handler(Pairing.AL_INFO_FORCE, "forced", refresh_from=None)
+    def _refresh_forced(self, value: str) -> bool:
+        if value == "2":
+            return False
+        self.forced = value == "1"
+        return True
+
+    @datapoint_handler(Pairing.AL_SWITCH_ON_OFF, "requested", refresh_from="inputs")
+    def _refresh_requested(self, value: str):
+        self.requested = value == "1"
+
+
+class OverrideHandlerChannel(HandlerChannel):
+    """Channel replacing a handler of its parent for testing."""
+
+    @datapoint_handler(Pairing.AL_TIMED_MOVEMENT, "state")
+    def _refresh_on_off(self, value: str):
+        self.state = value == "1"
+
+
+class PrecedenceHandlerChannel(HandlerChannel):
+    """Channel handling a pairing of its parent with another method for testing."""
+
+    @datapoint_handler(Pairing.AL_INFO_ON_OFF, "switched")
+    def _refresh_switched(self, value: str):
+        self.switched = value == "1"
+
+
+def test_datapoint_handler_table():
+    """Test the tables derived from the datapoint handlers."""
+    assert HandlerChannel._state_refresh_pairings == [Pairing.AL_INFO_ON_OFF]
+    assert HandlerChannel._input_state_refresh_pairings == [Pairing.AL_SWITCH_ON_OFF]
+    assert HandlerChannel._callback_attributes == ["state", "forced", "requested"]
+
+    # Overridden handlers are replaced, not added to
+    assert Pairing.AL_INFO_ON_OFF.value not in OverrideHandlerChannel._pairing_handlers
+    assert OverrideHandlerChannel._state_refresh_pairings == [Pairing.AL_TIMED_MOVEMENT]
+
+    # Handlers of a subclass take precedence and are refreshed first
+    assert PrecedenceHandlerChannel._pairing_handlers[Pairing.AL_INFO_ON_OFF.value] == (
+        "switched",
+        PrecedenceHandlerChannel._refresh_switched,
+    )
+    assert PrecedenceHandlerChannel._callback_attributes == [
+        "switched",
+        "forced",
+        "requested",
+    ]
+
+    # The base class itself handles no datapoints
+    assert Base._pairing_handlers == {}
+
+
+def test_refresh_state_from_datapoint_handlers(mock_device):
+    """Test dispatching datapoints to the handlers of a channel."""
+    channel = HandlerChannel(
+        device=mock_device,
+        channel_id="ch0003",
+        channel_name="Channel Name",
+        inputs={"idp0000": {"pairingID": 1, "value": "1"}},
+        outputs={
+            "odp0000": {"pairingID": 256, "value": "1"},
+            "odp0001": {"pairingID": 257, "value": "0"},
+        },
+        parameters={},
+    )
+    assert channel.state is True
+    assert channel.forced is False
+    assert not hasattr(channel, "requested")
+
+    assert (
+        channel._refresh_state_from_datapoint({"pairingID": 256, "value": "0"})
+        == "state"
+    )
+    assert channel.state is False
+
+    # A handler returning False reports no refreshed attribute
+    assert (
+        channel._refresh_state_from_datapoint({"pairingID": 257, "value": "2"}) is None
+    )
+    assert channel.forced is False
+
+    # Unknown pairings are ignored
+    assert channel._refresh_state_from_datapoint({"pairingID": 6, "value": "1"}) is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_state_from_handlers(mock_device):
+    """Test refreshing output and input pairings declared by the handlers."""
+    mock_device.device_serial = "ABB7F500E17A"
+    mock_device.api = AsyncMock()
+    mock_device.api.get_datapoint.return_value = ["1"]
+    channel = HandlerChannel(
+        device=mock_device,
+        channel_id="ch0003",
+        channel_name="Channel Name",
+        inputs={"idp0000": {"pairingID": 1, "value": "0"}},
+        outputs={"odp0000": {"pairingID": 256, "value": "0"}},
+        parameters={},
+    )
+    await channel.refresh_state()
+
+    assert channel.state is True
+    assert channel.requested is True
+    assert mock_device.api.get_datapoint.call_count == 2
+    mock_device.api.get_datapoint.assert_called_with(
+        device_serial="ABB7F500E17A",
+        channel_id="ch0003",
+        datapoint="idp0000",
+    )
+
+
+def test_refresh_state_from_data(base_instance):
+    """Test refreshing the channel from channel data of the api."""
+    base_instance.refresh_state_from_data(
+        {
+            "inputs": {"idp0000": {"pairingID": 1, "value": "1"}},
+            "outputs": {"odp0000": {"pairingID": 256, "value": "1"}},
+        }
+    )
+
+    # Only the datapoints updated from the websocket are refreshed
+    assert base_instance.get_output_by_pairing(Pairing.AL_INFO_ON_OFF) == (
+        "odp0000",
+        "1",
+    )
+    assert base_instance.get_input_by_pairing(Pairing.AL_SWITCH_ON_OFF) == (
+        "idp0000",
+        "0",
+    )
+
+
 def test_repr(base_instance):
     """Test the __repr__ method."""
     repr_str = repr(base_instance)
@@ -0,0 +1,70 @@
+"""Test code to test the CallbackExecutor class."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.abbfreeathome.callback_executor import CallbackExecutor
+
+
+@pytest.mark.asyncio
+async def test_submit_isolates_failures():
+    """Test a failing callback is counted and does not affect others."""
+    executor = CallbackExecutor()
+    failing = MagicMock(side_effect=ValueError)
+    failing_async = AsyncMock(side_effect=ValueError)
+    callback = MagicMock()
+    async_callback = AsyncMock()
+
+    for _callback in (failing, failing_async, callback, async_callback, failing):
+        executor.submit(_callback)
+    await executor.drain()
+
+    callback.assert_called_once_with()
+    async_callback.assert_awaited_once_with()
+    assert executor.metrics.completed == 2
+    assert executor.metrics.failed == 3
+    assert executor.metrics.failures == {failing: 2, failing_async: 1}
+    assert repr(executor.metrics) == (
+        "CallbackExecutorMetrics(pending=0, completed=2, failed=3, dropped=0)"
+    )
+
+
+@pytest.mark.asyncio
+async def test_submit_limits():
+    """Test the concurrency and pending limits of coroutine callbacks."""
+    executor = CallbackExecutor(max_concurrency=1, max_pending=2)
+    release = asyncio.Event()
+    running = []
+
+    async def callback():
+        running.append(True)
+        await release.wait()
+
+    for _ in range(3):
+        executor.submit(callback)
+    await asyncio.sleep(0)
+
+    assert running == [True]
+    assert executor.metrics.pending == 2
+    assert executor.metrics.dropped == 1
+
+    release.set()
+    await executor.drain()
+    assert running == [True, True]
+    assert executor.metrics.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_close():
+    """Test closing the executor cancels scheduled callbacks."""
+    executor = CallbackExecutor()
+    callback = AsyncMock(side_effect=asyncio.Event().wait)
+
+    executor.submit(callback)
+    await asyncio.sleep(0)
+    await executor.close()
+
+    assert executor.metrics.pending == 0
+    assert executor.metrics.completed == 0
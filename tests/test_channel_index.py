@@ -0,0 +1,80 @@
+"""Test code to test the channel indexes."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.abbfreeathome.api import FreeAtHomeApi
+from src.abbfreeathome.bin.function import Function
+from src.abbfreeathome.bin.interface import Interface
+from src.abbfreeathome.channel_index import ChannelIndex
+from src.abbfreeathome.channels.trigger import Trigger
+from src.abbfreeathome.channels.virtual.virtual_trigger import VirtualTrigger
+from src.abbfreeathome.device import Device
+
+
+def create_device(device_serial: str, interface: Interface, mock_floorplan) -> Device:
+    """Create a device with a single trigger channel."""
+    device = Device(
+        device_serial=device_serial,
+        device_id="910C",
+        display_name="Test Device",
+        api=AsyncMock(spec=FreeAtHomeApi),
+        interface=interface,
+        channels_data={
+            "ch0000": {"functionID": f"{Function.FID_TRIGGER.value:04X}"},
+        },
+    )
+    device.load_channels(mock_floorplan)
+    return device
+
+
+@pytest.fixture
+def devices(mock_floorplan):
+    """Create a wired and a virtual device with a trigger channel."""
+    return (
+        create_device("ABB7F500E17A", Interface.WIRED_BUS, mock_floorplan),
+        create_device("6000D2CB27B2", Interface.VIRTUAL_DEVICE, mock_floorplan),
+    )
+
+
+def test_channel_index(devices):
+    """Test querying the indexes."""
+    device, virtual_device = devices
+    assert virtual_device.get_channel_class("ch0000") is VirtualTrigger
+
+    index = ChannelIndex()
+    index.add("ABB7F500E17A/ch0000", device, Trigger)
+    index.add("6000D2CB27B2/ch0000", virtual_device, VirtualTrigger)
+
+    assert index.get_by_device("ABB7F500E17A") == ["ABB7F500E17A/ch0000"]
+    assert index.get_by_device("NONEXISTENT") == []
+    assert index.get_by_class(Trigger) == ["ABB7F500E17A/ch0000"]
+    assert index.get_by_class(Trigger, include_subclasses=True) == [
+        "ABB7F500E17A/ch0000",
+        "6000D2CB27B2/ch0000",
+    ]
+    assert index.get_by_interface(Interface.VIRTUAL_DEVICE) == ["6000D2CB27B2/ch0000"]
+
+
+def test_channel_index_remove(devices):
+    """Test removing channels from the indexes."""
+    device, virtual_device = devices
+
+    index = ChannelIndex()
+    index.add("ABB7F500E17A/ch0000", device, Trigger)
+    index.add("6000D2CB27B2/ch0000", virtual_device, VirtualTrigger)
+
+    # Adding a channel again does not duplicate it
+    index.add("ABB7F500E17A/ch0000", device, Trigger)
+    assert index.get_by_device("ABB7F500E17A") == ["ABB7F500E17A/ch0000"]
+
+    index.remove("ABB7F500E17A/ch0000")
+    index.remove("ABB7F500E17A/ch0000")
+    assert index.get_by_device("ABB7F500E17A") == []
+    assert index.get_by_class(Trigger) == []
+    assert index.get_by_interface(Interface.WIRED_BUS) == []
+    assert index._by_device == {"6000D2CB27B2": {"6000D2CB27B2/ch0000": VirtualTrigger}}
+
+    index.clear()
+    assert index.get_by_class(Trigger, include_subclasses=True) == []
@@ -0,0 +1,42 @@
+"""Test code to test the JSON codec."""
+
+import importlib
+import sys
+
+import pytest
+
+from src.abbfreeathome import codec
+
+
+def test_json_roundtrip():
+    """Test encoding and decoding a JSON document."""
+    document = {"datapoints": {"ABB7F500E17A/ch0003/odp0000": "1"}, "ttl": 180}
+
+    encoded = codec.json_dumps(document)
+    assert isinstance(encoded, str)
+    assert codec.json_loads(encoded) == document
+    assert codec.json_loads(encoded.encode()) == document
+
+
+@pytest.mark.parametrize(
+    ("blocked_modules", "expected_codec"),
+    [
+        (["orjson"], "msgspec"),
+        (["orjson", "msgspec"], "json"),
+    ],
+)
+def test_json_codec_fallback(monkeypatch, blocked_modules, expected_codec):
+    """Test the codec falls back when faster libraries are not installed."""
+    if expected_codec == "msgspec":
+        pytest.importorskip("msgspec")
+
+    for _module in blocked_modules:
+        monkeypatch.setitem(sys.modules, _module, None)
+
+    try:
+        _codec = importlib.reload(codec)
+        assert expected_codec == _codec.JSON_CODEC
+        assert _codec.json_loads(_codec.json_dumps({"value": "1"})) == {"value": "1"}
+    finally:
+        monkeypatch.undo()
+        importlib.reload(codec)
@@ -0,0 +1,90 @@
+"""Test code to test the ConnectionPool class."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.abbfreeathome.connection_pool import (
+    DEFAULT_POOL_KEEPALIVE_TIMEOUT,
+    DEFAULT_POOL_LIMIT,
+    DEFAULT_POOL_LIMIT_PER_HOST,
+    DEFAULT_POOL_TTL_DNS_CACHE,
+    ConnectionPool,
+    create_ssl_context,
+)
+
+
+def test_connection_pool_defaults():
+    """Test the default configuration of the pool."""
+    pool = ConnectionPool()
+
+    assert pool.limit == DEFAULT_POOL_LIMIT
+    assert pool.limit_per_host == DEFAULT_POOL_LIMIT_PER_HOST
+    assert pool.keepalive_timeout == DEFAULT_POOL_KEEPALIVE_TIMEOUT
+    assert pool.ttl_dns_cache == DEFAULT_POOL_TTL_DNS_CACHE
+    assert pool.keep_alive is True
+
+
+@pytest.mark.asyncio
+async def test_get_client_session_keep_alive():
+    """Test the session keeps connections open with the configured limits."""
+    async with ConnectionPool(
+        limit=4, limit_per_host=2, keepalive_timeout=30.0
+    ) as pool:
+        session = pool.get_client_session()
+        assert pool.get_client_session() is session
+
+        assert session.connector.limit == 4
+        assert session.connector.limit_per_host == 2
+        assert session.connector.force_close is False
+        assert session.version == (1, 1)
+
+    assert session.closed is True
+
+
+@pytest.mark.asyncio
+async def test_get_client_session_force_close():
+    """Test the session closes connections when keep-alive is disabled."""
+    async with ConnectionPool(keep_alive=False) as pool:
+        assert pool.get_client_session().connector.force_close is True
+
+
+@pytest.mark.asyncio
+async def test_get_client_session_after_close():
+    """Test a new session is created after the pool was closed."""
+    pool = ConnectionPool()
+    session = pool.get_client_session()
+    await pool.close()
+
+    new_session = pool.get_client_session()
+    assert new_session is not session
+    assert new_session.closed is False
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_get_ssl_context_cached():
+    """Test the SSL context is created once per configuration."""
+    pool = ConnectionPool()
+
+    with patch("ssl.create_default_context") as mock_create_context:
+        mock_create_context.return_value = Mock()
+        context = await pool.get_ssl_context(True, "dummy_path")
+
+        assert await pool.get_ssl_context(True, "dummy_path") is context
+        mock_create_context.assert_called_once_with(cafile="dummy_path")
+
+    assert await pool.get_ssl_context(False) is False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("verify_ssl", "expected"),
+    [
+        (True, True),
+        (False, False),
+    ],
+)
+async def test_create_ssl_context_without_ca_file(verify_ssl, expected):
+    """Test the SSL context without a custom CA file."""
+    assert await create_ssl_context(verify_ssl) is expected
@@ -0,0 +1,53 @@
+"""Test code to test the CallbackDebouncer class."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.abbfreeathome.debounce import CallbackDebouncer
+
+
+@pytest.mark.asyncio
+async def test_trigger():
+    """Test the callback is called at most once per interval."""
+    callback = MagicMock()
+    debouncer = CallbackDebouncer(callback=callback, interval=0.01)
+    assert debouncer.interval == 0.01
+
+    debouncer.trigger()
+    callback.assert_called_once_with()
+    assert debouncer.pending is False
+
+    debouncer.trigger()
+    debouncer.trigger()
+    assert debouncer.pending is True
+    assert callback.call_count == 1
+
+    await asyncio.sleep(0.02)
+    assert debouncer.pending is False
+    assert callback.call_count == 2
+
+    # After a quiet interval the callback is called right away again
+    await asyncio.sleep(0.02)
+    debouncer.trigger()
+    assert callback.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_flush_and_cancel():
+    """Test a scheduled call is made right away or cancelled."""
+    callback = MagicMock()
+    debouncer = CallbackDebouncer(callback=callback, interval=1.0)
+
+    debouncer.trigger()
+    debouncer.trigger()
+    debouncer.flush()
+    assert callback.call_count == 2
+    assert debouncer.pending is False
+
+    debouncer.trigger()
+    debouncer.cancel()
+    assert debouncer.pending is False
+    debouncer.flush()
+    assert callback.call_count == 2
@@ -7,11 +7,14 @@ import pytest
 from src.abbfreeathome.api import FreeAtHomeApi
 from src.abbfreeathome.bin.function import Function
 from src.abbfreeathome.bin.interface import Interface
+from src.abbfreeathome.bin.parameter import Parameter
+from src.abbfreeathome.callback_executor import CallbackExecutor
 from src.abbfreeathome.channels.switch_actuator import SwitchActuator
 from src.abbfreeathome.channels.virtual.virtual_switch_actuator import (
     VirtualSwitchActuator,
 )
 from src.abbfreeathome.device import Device
+from src.abbfreeathome.exceptions import InvalidDeviceParameter
 
 
 @pytest.fixture
@@ -147,6 +150,25 @@ def test_device_interface_enum(mock_api, mock_device):
         assert device.interface.value == expected_value
 
 
+def test_get_device_parameter(mock_api):
+    """Test getting a device parameter by its name."""
+    device = Device(
+        device_serial="ABB7F500E17A",
+        device_id="910C",
+        display_name="Test Device",
+        api=mock_api,
+        parameters={"par00ed": "1", "parXYZ": "ignored"},
+    )
+
+    assert device.get_device_parameter(Parameter.PID_CHANNEL_SELECTOR_1_GANG) == (
+        "par00ed",
+        "1",
+    )
+
+    with pytest.raises(InvalidDeviceParameter):
+        device.get_device_parameter(Parameter.PID_LED_DAY_BRIGHTNESS)
+
+
 def test_device_parameters_default(mock_api, mock_device):
     """Test device parameters default to empty dict when None."""
     device = Device(
@@ -413,6 +435,182 @@ def test_device_load_channels_with_valid_data(mock_floorplan):
     assert channel.room_name == "Living Room"
 
 
+def test_device_load_channels_callback_executor(mock_floorplan):
+    """Test the channels run their callbacks with the device callback executor."""
+    executor = MagicMock(spec=CallbackExecutor)
+    device = Device(
+        device_serial="ABB7F500E17A",
+        device_id="910C",
+        display_name="Test Device",
+        api=AsyncMock(spec=FreeAtHomeApi),
+        channels_data={
+            "ch0000": {
+                "displayName": "Test Switch",
+                "floor": "01",
+                "room": "18",
+                "functionID": f"{Function.FID_SWITCH_ACTUATOR.value:04X}",
+                "inputs": {"idp0000": {"pairingID": 1, "value": "0"}},
+                "outputs": {"odp0000": {"pairingID": 256, "value": "0"}},
+                "parameters": {},
+            }
+        },
+        callback_executor=executor,
+    )
+
+    channel = device.load_channels(mock_floorplan)["ch0000"]
+    callback = MagicMock()
+    channel.register_callback(callback_attribute="state", callback=callback)
+    channel.run_callbacks("state")
+
+    executor.submit.assert_called_once_with(callback)
+
+
+def test_device_update_configuration(mock_floorplan):
+    """Test updating a device keeps the channels with an unchanged class."""
+    mock_api = AsyncMock(spec=FreeAtHomeApi)
+
+    def channel_data(function: Function, value: str) -> dict:
+        return {
+            "displayName": "Test Switch",
+            "floor": "01",
+            "room": "18",
+            "functionID": f"{function.value:04X}",
+            "inputs": {"idp0000": {"pairingID": 1, "value": "0"}},
+            "outputs": {"odp0000": {"pairingID": 256, "value": value}},
+            "parameters": {},
+        }
+
+    device = Device(
+        device_serial="ABB7F500E17A",
+        device_id="910C",
+        display_name="Test Device",
+        api=mock_api,
+        channels_data={
+            "ch0000": channel_data(Function.FID_SWITCH_ACTUATOR, "0"),
+            "ch0001": channel_data(Function.FID_SWITCH_ACTUATOR, "0"),
+        },
+        event_listener=MagicMock(),
+    )
+    channels = device.load_channels(mock_floorplan)
+    channel = channels["ch0000"]
+    removed_channel = channels["ch0001"]
+    callback = MagicMock()
+    channel.register_callback(callback_attribute="state", callback=callback)
+
+    device.update_configuration(
+        device_id="910C",
+        display_name="Renamed Device",
+        floorplan=mock_floorplan,
+        channels_data={
+            "ch0000": channel_data(Function.FID_SWITCH_ACTUATOR, "1"),
+            "ch0002": channel_data(Function.FID_SWITCH_ACTUATOR, "0"),
+        },
+    )
+
+    assert device.display_name == "Renamed Device"
+    assert device.channels is channels
+    assert list(channels) == ["ch0000", "ch0002"]
+    assert channels["ch0000"] is channel
+    assert channel.state is True
+    callback.assert_called_once_with()
+
+    # Only the kept channels pass on their changes
+    assert channel._event_listener is not None
+    assert removed_channel._event_listener is None
+
+
+def test_device_load_channels_lazy(mock_floorplan):
+    """Test lazy channels are only created on first access."""
+    mock_api = AsyncMock(spec=FreeAtHomeApi)
+
+    channels_data = {
+        f"ch000{_index}": {
+            "displayName": f"Test Switch {_index}",
+            "functionID": f"{Function.FID_SWITCH_ACTUATOR.value:04X}",
+            "outputs": {"odp0000": {"pairingID": 256, "value": "0"}},
+        }
+        for _index in range(3)
+    }
+
+    device = Device(
+        device_serial="ABB7F500E17A",
+        device_id="910C",
+        display_name="Test Device",
+        api=mock_api,
+        channels_data=channels_data,
+        lazy_channels=True,
+    )
+
+    assert device.load_channels(mock_floorplan) == {}
+    assert device.is_multi_device is True
+    assert device.get_channel_class("ch0002") is SwitchActuator
+    assert device.get_channel_class("ch0009") is None
+    assert device.get_channel("ch0009") is None
+
+    channel = device.get_channel("ch0002")
+    assert isinstance(channel, SwitchActuator)
+    assert channel.channel_name == "Test Switch 2"
+    assert device.get_channel("ch0002") is channel
+    assert device.get_channel_class("ch0002") is SwitchActuator
+
+    # Removing a channel does not create it
+    assert device.remove_channel("ch0001") is True
+    assert device.remove_channel("ch0001") is False
+    assert device.get_channel_classes() == {
+        "ch0000": SwitchActuator,
+        "ch0002": SwitchActuator,
+    }
+    assert list(device._channels) == ["ch0002"]
+
+    assert list(device.channels) == ["ch0000", "ch0002"]
+    assert device.channels["ch0002"] is channel
+
+
+@pytest.mark.parametrize(
+    ("channel_classes", "include_orphan_channels", "expected_channels"),
+    [
+        (None, True, ["ch0000", "ch0001", "ch0002"]),
+        (None, False, ["ch0000", "ch0002"]),
+        ([SwitchActuator], True, ["ch0000", "ch0001"]),
+        ([SwitchActuator], False, ["ch0000"]),
+    ],
+)
+def test_device_load_channels_filtered(
+    mock_floorplan, channel_classes, include_orphan_channels, expected_channels
+):
+    """Test channels are filtered by class and floorplan when loading."""
+    mock_api = AsyncMock(spec=FreeAtHomeApi)
+
+    channels_data = {
+        "ch0000": {
+            "floor": "01",
+            "room": "18",
+            "functionID": f"{Function.FID_SWITCH_ACTUATOR.value:04X}",
+        },
+        "ch0001": {"functionID": f"{Function.FID_SWITCH_ACTUATOR.value:04X}"},
+        "ch0002": {
+            "floor": "01",
+            "room": "18",
+            "functionID": f"{Function.FID_TRIGGER.value:04X}",
+        },
+    }
+
+    device = Device(
+        device_serial="ABB7F500E17A",
+        device_id="910C",
+        display_name="Test Device",
+        api=mock_api,
+        channels_data=channels_data,
+        channel_classes=channel_classes,
+        include_orphan_channels=include_orphan_channels,
+    )
+
+    assert list(device.load_channels(mock_floorplan)) == expected_channels
+
+    # The filters don't change whether the device has multiple channels
+    assert device.is_multi_device is True
+
+
 def test_device_load_channels_with_existing_floor_room_names(mock_floorplan):
     """Test loading channels when floor_name and room_name are already provided."""
     mock_api = AsyncMock(spec=FreeAtHomeApi)
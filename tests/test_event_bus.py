@@ -0,0 +1,123 @@
+"""Test code to test the EventBus class."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.abbfreeathome.api import FreeAtHomeApi
+from src.abbfreeathome.callback_executor import CallbackExecutor
+from src.abbfreeathome.channels.base import Base
+from src.abbfreeathome.channels.switch_actuator import SwitchActuator
+from src.abbfreeathome.channels.switch_sensor import SwitchSensor
+from src.abbfreeathome.device import Device
+from src.abbfreeathome.event_bus import EventBus, EventSubscription
+
+
+def create_channel(channel_class: type[Base], device_serial: str, channel_id: str):
+    """Create a channel of a mocked device."""
+    device = MagicMock(spec=Device)
+    device.device_serial = device_serial
+    device.api = AsyncMock(spec=FreeAtHomeApi)
+    return channel_class(
+        device=device,
+        channel_id=channel_id,
+        channel_name="Channel Name",
+        inputs={},
+        outputs={},
+        parameters={},
+    )
+
+
+@pytest.fixture
+def channels():
+    """Create the channels fixture, of two devices."""
+    return [
+        create_channel(SwitchActuator, "ABB7F500E17A", "ch0000"),
+        create_channel(SwitchSensor, "ABB7F62F6A46", "ch0000"),
+    ]
+
+
+@pytest.fixture
+def event_bus(channels):
+    """Create the EventBus fixture with the channels on their own floor."""
+    bus = EventBus(executor=CallbackExecutor())
+    for channel, floor_id in zip(channels, ("01", "02"), strict=True):
+        bus.add_channel(
+            f"{channel.device_serial}/{channel.channel_id}",
+            channel.device,
+            type(channel),
+            floor_id=floor_id,
+            room_id=floor_id,
+        )
+    return bus
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected_serials"),
+    [
+        ({}, {"ABB7F500E17A/ch0000", "ABB7F62F6A46/ch0000"}),
+        ({"channel_class": SwitchActuator}, {"ABB7F500E17A/ch0000"}),
+        ({"channel_class": Base}, {"ABB7F500E17A/ch0000", "ABB7F62F6A46/ch0000"}),
+        ({"callback_attribute": "forced_position"}, {"ABB7F500E17A/ch0000"}),
+        ({"floor_id": "02"}, {"ABB7F62F6A46/ch0000"}),
+        ({"floor_id": "01", "room_id": "02"}, set()),
+        ({"device_serial": "ABB7F500E17A"}, {"ABB7F500E17A/ch0000"}),
+    ],
+)
+def test_subscribe_filters(event_bus, channels, filters, expected_serials):
+    """Test the changes of only the matching channels are passed on."""
+    callback = MagicMock()
+    event_bus.subscribe(EventSubscription(callback, **filters))
+
+    for _channel in channels:
+        for _callback_attribute in _channel.callback_attributes:
+            event_bus.publish(_channel, _callback_attribute)
+
+    assert {
+        _call.args[0].channel_serial for _call in callback.call_args_list
+    } == expected_serials
+    if "callback_attribute" in filters:
+        assert {
+            _call.args[0].callback_attribute for _call in callback.call_args_list
+        } == {filters["callback_attribute"]}
+
+
+def test_channel_changes(event_bus, channels):
+    """Test the routes follow added, replaced and removed channels."""
+    callback = MagicMock()
+    subscription = EventSubscription(callback, channel_class=SwitchActuator)
+    event_bus.subscribe(subscription)
+
+    old_channel = channels[0]
+    new_channel = create_channel(SwitchActuator, "ABB7F500E17A", "ch0000")
+    event_bus.add_channel(
+        "ABB7F500E17A/ch0000", new_channel.device, SwitchActuator, "01", "01"
+    )
+
+    # Changes of a channel of a replaced device are ignored
+    event_bus.publish(old_channel, "state")
+    callback.assert_not_called()
+
+    event_bus.publish(new_channel, "state")
+    callback.assert_called_once()
+
+    event_bus.clear_channels()
+    event_bus.publish(new_channel, "state")
+    assert callback.call_count == 1
+    assert event_bus._routes == {}
+
+    # The subscription is routed to channels added later
+    event_bus.add_channel(
+        "ABB7F500E17A/ch0000", new_channel.device, SwitchActuator, "01", "01"
+    )
+    event_bus.publish(new_channel, "state")
+    assert callback.call_count == 2
+
+    event_bus.unsubscribe(subscription)
+    event_bus.publish(new_channel, "state")
+    assert callback.call_count == 2
+    assert event_bus._routes == {}
+    assert repr(subscription) == (
+        f"EventSubscription(channel_class={SwitchActuator}, "
+        "callback_attribute=None, floor_id=None, room_id=None, device_serial=None)"
+    )
@@ -8,14 +8,18 @@ from src.abbfreeathome.exceptions import (
     ConnectionTimeoutException,
     ForbiddenAuthException,
     InvalidApiResponseException,
+    InvalidChannelCommandException,
     InvalidCredentialsException,
     InvalidDeviceChannelPairing,
     InvalidDeviceChannelParameter,
+    InvalidDeviceParameter,
     InvalidHostException,
+    QueueFullException,
     SetDatapointFailureException,
     SslErrorException,
     UnknownCallbackAttributeException,
     UserNotFoundException,
+    WriteQueueFullException,
 )
 
 
@@ -130,6 +134,15 @@ def test_invalid_device_channel_parameter():
     )
 
 
+def test_invalid_device_parameter():
+    """Test invalid device parameter exception."""
+    with pytest.raises(InvalidDeviceParameter) as excinfo:
+        raise InvalidDeviceParameter("device1", 123)
+    assert str(excinfo.value) == (
+        "Could not find parameter id for device: device1; parameter id: 123"
+    )
+
+
 def test_ssl_error_exception():
     """Test SSL error exception."""
     with pytest.raises(SslErrorException) as excinfo:
@@ -138,3 +151,28 @@ def test_ssl_error_exception():
         str(excinfo.value)
         == "SSL certificate verification failed for host https://192.168.1.1"
     )
+
+
+def test_write_queue_full_exception():
+    """Test the write queue full exception."""
+    with pytest.raises(WriteQueueFullException) as excinfo:
+        raise WriteQueueFullException(max_size=100)
+    assert str(excinfo.value) == "Background write queue is full; max size: 100"
+
+
+def test_queue_full_exception():
+    """Test the queue full exception."""
+    with pytest.raises(QueueFullException) as excinfo:
+        raise QueueFullException(name="receive queue", max_size=10)
+    assert str(excinfo.value) == "Receive queue is full; max size: 10"
+
+
+def test_invalid_channel_command_exception():
+    """Test the invalid channel command exception."""
+    with pytest.raises(InvalidChannelCommandException) as excinfo:
+        raise InvalidChannelCommandException(
+            channel_name="Study Area Light", command="open"
+        )
+    assert str(excinfo.value) == (
+        "Channel Study Area Light does not support command: open"
+    )
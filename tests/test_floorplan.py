@@ -1,6 +1,9 @@
 """Test code for the Floorplan class."""
 
-from src.abbfreeathome.floorplan import Floorplan
+from unittest.mock import MagicMock
+
+from src.abbfreeathome.device import Device
+from src.abbfreeathome.floorplan import Floorplan, FloorplanIndex
 
 
 def test_floorplan_fixture_realistic_data(mock_floorplan):
@@ -247,3 +250,55 @@ def test_floorplan_edge_cases_comprehensive():
     floorplan = Floorplan(floorplan_data)
     assert floorplan.has_room("01", "01") is False
     assert floorplan.get_room_name("01", "01") is None
+
+
+def test_floorplan_index_devices():
+    """Test indexing devices by floor and room."""
+    kitchen = MagicMock(spec=Device, device_serial="ABB7F500E17A", floor="01")
+    kitchen.room = "0C"
+    entry = MagicMock(spec=Device, device_serial="ABB7F62F6C0B", floor="01")
+    entry.room = "13"
+
+    index = FloorplanIndex()
+    index.add_device(kitchen)
+    index.add_device(entry)
+
+    assert index.get_devices_by_room("01", "0C") == [kitchen]
+    assert index.get_devices_by_floor("01") == [kitchen, entry]
+    assert index.get_devices_by_floor("02") == []
+
+    # Adding a device again moves it to its new room
+    kitchen.room = "13"
+    index.add_device(kitchen)
+    assert index.get_devices_by_room("01", "0C") == []
+    assert index.get_devices_by_room("01", "13") == [entry, kitchen]
+
+    index.remove_device("ABB7F500E17A")
+    index.remove_device("ABB7F500E17A")
+    index.remove_device("ABB7F62F6C0B")
+    assert index.get_devices_by_floor("01") == []
+    assert index._devices == {}
+
+    index.add_device(entry)
+    index.clear_devices()
+    assert index.get_devices_by_floor("01") == []
+
+
+def test_floorplan_index_channels():
+    """Test indexing channel serials by floor and room."""
+    index = FloorplanIndex()
+    index.add_channel("ABB7F500E17A/ch0003", floor_id="01", room_id="0C")
+    index.add_channel("ABB7F500E17A/ch0000", floor_id="01", room_id="13")
+
+    assert index.get_channel_serials_by_room("01", "0C") == ["ABB7F500E17A/ch0003"]
+    assert index.get_channel_serials_by_floor("01") == [
+        "ABB7F500E17A/ch0003",
+        "ABB7F500E17A/ch0000",
+    ]
+    assert index.get_channel_serials_by_room(None, None) == []
+
+    index.remove_channel("ABB7F500E17A/ch0003")
+    assert index.get_channel_serials_by_floor("01") == ["ABB7F500E17A/ch0000"]
+
+    index.clear_channels()
+    assert index.get_channel_serials_by_floor("01") == []
@@ -1,18 +1,24 @@
 """Test code to test all FreeAtHome class."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from copy import deepcopy
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.abbfreeathome.api import FreeAtHomeApi
 from src.abbfreeathome.bin.interface import Interface
+from src.abbfreeathome.channels.base import Base
 from src.abbfreeathome.channels.switch_actuator import SwitchActuator
 from src.abbfreeathome.channels.switch_sensor import SwitchSensor
 from src.abbfreeathome.channels.virtual.virtual_switch_actuator import (
     VirtualSwitchActuator,
 )
 from src.abbfreeathome.device import Device
+from src.abbfreeathome.exceptions import ClientConnectionError
 from src.abbfreeathome.freeathome import FreeAtHome
+from src.abbfreeathome.message import WebsocketMessage
+from src.abbfreeathome.snapshot import ConfigurationSnapshot
 
 
 @pytest.fixture
@@ -541,42 +547,658 @@ async def test_ws_close(freeathome, api_mock):
 
 
 @pytest.mark.asyncio
-async def test_ws_listen(freeathome, api_mock):
+async def test_ws_listen(freeathome):
     "Test the ws_listen function."
-    api_mock.ws_listen = AsyncMock()
-    await freeathome.ws_listen()
-    api_mock.ws_listen.assert_called_once_with(callback=freeathome.update)
+    with patch.object(
+        freeathome.ws_supervisor, "run", new_callable=AsyncMock
+    ) as mock_run:
+        await freeathome.ws_listen()
+        mock_run.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_resync(freeathome, api_mock):
+    """Test the resync after a reconnect applies the missed changes."""
+    # Nothing to resynchronize before the devices are loaded
+    await freeathome._resync(downtime=10.0)
+    api_mock.get_configuration.assert_not_called()
+
+    await freeathome.load()
+    channel = freeathome.get_channels()["ABB7F500E17A/ch0003"]
+    callback = MagicMock()
+    channel.register_callback(callback_attribute="state", callback=callback)
+
+    _config = deepcopy(api_mock.get_configuration.return_value)
+    _config["devices"]["ABB7F500E17A"]["channels"]["ch0003"]["outputs"]["odp0000"][
+        "value"
+    ] = "1"
+    api_mock.get_configuration.return_value = _config
+
+    await freeathome._resync(downtime=10.0)
+
+    assert api_mock.get_configuration.call_count == 2
+    assert channel.state is True
+    callback.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_update_callback_executor(freeathome):
+    """Test coroutine callbacks and isolation of failing callbacks on update."""
+    await freeathome.load()
+
+    channel = freeathome.get_channels()["ABB7F500E17A/ch0003"]
+    failing = MagicMock(side_effect=ValueError)
+    async_callback = AsyncMock()
+    channel.register_callback(callback_attribute="state", callback=failing)
+    channel.register_callback(callback_attribute="state", callback=async_callback)
+
+    await freeathome.update({"datapoints": {"ABB7F500E17A/ch0003/odp0000": "1"}})
+    await freeathome.callback_executor.drain()
+
+    async_callback.assert_awaited_once_with()
+    assert freeathome.callback_executor.metrics.failures == {failing: 1}
 
 
 @pytest.mark.asyncio
 async def test_update(freeathome):
     """Test the update function."""
-    # Create a mock channel
-    channel = MagicMock()
-
-    # Create a device with the channel that has floor/room info to pass orphan filtering
-    device = Device(
-        device_serial="ABB7F500E17A",
-        device_id="910C",
-        display_name="Test Device",
-        interface=Interface.WIRED_BUS,
-        channels_data={
-            "ch0003": {"functionID": "0", "floor": "floor1", "room": "room1"}
-        },
-        api=freeathome.api,
-    )
-
-    # Add the device to freeathome
-    freeathome._devices["ABB7F500E17A"] = device
+    await freeathome.load()
 
-    # Mock the device.channels to return our mock channel
-    device._channels = {"ch0003": channel}
+    channel = freeathome.get_channels()["ABB7F500E17A/ch0003"]
+    callback = MagicMock()
+    channel.register_callback(callback_attribute="state", callback=callback)
+    assert channel.state is False
 
     data = {
-        "datapoints": {"ABB7F500E17A/ch0003/256": "0", "ABB7F500E17A/ch0001/0": "0"}
+        "datapoints": {
+            "ABB7F500E17A/ch0003/odp0000": "1",
+            "ABB7F500E17A/ch0001/odp0000": "1",
+            "ABB7F500E17A/ch0003/odp9999": "1",
+        }
     }
     await freeathome.update(data)
-    channel.update_channel.assert_called_once_with("ABB7F500E17A/ch0003/256", "0")
+    assert channel.state is True
+    callback.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_update_message(freeathome):
+    """Test the update function with a decoded websocket message."""
+    await freeathome.load()
+
+    channel = freeathome.get_channels()["ABB7F500E17A/ch0003"]
+    await freeathome.update(
+        WebsocketMessage.from_data({"datapoints": {"ABB7F500E17A/ch0003/odp0000": "1"}})
+    )
+    assert channel.state is True
+
+
+@pytest.mark.asyncio
+async def test_refresh_states(freeathome, api_mock):
+    """Test refreshing all channels from a single configuration request."""
+    await freeathome.load()
+
+    channel = freeathome.get_channels()["ABB7F500E17A/ch0003"]
+    callback = MagicMock()
+    channel.register_callback(callback_attribute="state", callback=callback)
+    assert channel.state is False
+
+    _config = deepcopy(api_mock.get_configuration.return_value)
+    _config["devices"]["ABB7F500E17A"]["channels"]["ch0003"]["outputs"]["odp0000"][
+        "value"
+    ] = "1"
+    api_mock.get_configuration.return_value = _config
+    api_mock.get_configuration.reset_mock()
+
+    await freeathome.refresh_states()
+    api_mock.get_configuration.assert_called_once_with()
+    api_mock.get_datapoint.assert_not_called()
+    assert channel.state is True
+    callback.assert_called_once_with()
+
+    # Unchanged values do not trigger the callbacks again
+    await freeathome.refresh_states()
+    callback.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_refresh_states_keeps_config(freeathome, api_mock):
+    """Test refreshing the states does not hide changes from a reload."""
+    await freeathome.load()
+
+    _config = deepcopy(api_mock.get_configuration.return_value)
+    _config["devices"]["ABB7F500E17A"]["displayName"] = "Renamed"
+    api_mock.get_configuration.return_value = _config
+
+    await freeathome.refresh_states()
+    assert freeathome.get_device_by_serial("ABB7F500E17A").display_name != "Renamed"
+
+    await freeathome.load(refresh=True)
+    assert freeathome.get_device_by_serial("ABB7F500E17A").display_name == "Renamed"
+
+
+@pytest.mark.asyncio
+async def test_refresh_states_by_device(freeathome, api_mock):
+    """Test refreshing a list of channels with one request per device."""
+    await freeathome.load()
+
+    _channels = freeathome.get_channels_by_device("ABB7F500E17A")
+    _device = deepcopy(
+        api_mock.get_configuration.return_value["devices"]["ABB7F500E17A"]
+    )
+    _device["channels"]["ch0003"]["outputs"]["odp0000"]["value"] = "1"
+    _device["channels"].pop("ch0000")
+    api_mock.get_device.return_value = _device
+
+    await freeathome.refresh_states(channels=_channels)
+    api_mock.get_device.assert_called_once_with(device_serial="ABB7F500E17A")
+    assert freeathome.get_channels()["ABB7F500E17A/ch0003"].state is True
+
+
+@pytest.mark.asyncio
+async def test_refresh_channel_states(freeathome, api_mock):
+    """Test refreshing the channels concurrently from the api."""
+    await freeathome.load()
+    api_mock.get_datapoint.return_value = ["1"]
+
+    results = await freeathome.refresh_channel_states()
+    assert set(results.keys()) == set(freeathome.get_channels().keys())
+    assert all(_result is None for _result in results.values())
+    assert freeathome.get_channels()["ABB7F500E17A/ch0003"].state is True
+
+    # Refresh a single channel
+    channel = freeathome.get_channels()["ABB7F500E17A/ch0003"]
+    results = await freeathome.refresh_channel_states(channels=[channel])
+    assert results == {"ABB7F500E17A/ch0003": None}
+
+
+@pytest.mark.asyncio
+async def test_update_routes_inputs(freeathome):
+    """Test the update function routes input datapoints where supported."""
+    await freeathome.load()
+
+    channel = freeathome.get_channels()["ABB7F500E17A/ch0000"]
+    assert isinstance(channel, SwitchSensor)
+    assert "ABB7F500E17A/ch0000/idp0000" in freeathome._datapoint_routes
+
+    # SwitchActuator channels do not handle input datapoints
+    assert "ABB7F500E17A/ch0003/idp0000" not in freeathome._datapoint_routes
+
+    await freeathome.update({"datapoints": {"ABB7F500E17A/ch0000/odp0000": "1"}})
+    assert channel.state == "on"
+
+
+@pytest.mark.asyncio
+async def test_update_routes_after_unload(freeathome):
+    """Test the routing table is rebuilt after unloading a channel."""
+    await freeathome.load()
+
+    channel = freeathome.get_channels()["ABB7F500E17A/ch0003"]
+    freeathome.unload_channel(device_serial="ABB7F500E17A", channel_id="ch0003")
+
+    await freeathome.update({"datapoints": {"ABB7F500E17A/ch0003/odp0000": "1"}})
+    assert channel.state is False
+    assert "ABB7F500E17A/ch0003/odp0000" not in freeathome._datapoint_routes
+
+
+@pytest.mark.asyncio
+async def test_load_refresh(freeathome, api_mock):
+    """Test reloading applies only the changes to the loaded objects."""
+    await freeathome.load()
+
+    channels = freeathome.get_channels()
+    channel = channels["ABB7F500E17A/ch0003"]
+    other_device = freeathome.get_device_by_serial("ABB7F62F6A46")
+    callback = MagicMock()
+    channel.register_callback(callback_attribute="state", callback=callback)
+
+    _config = deepcopy(api_mock.get_configuration.return_value)
+    _config["floorplan"]["floors"]["01"]["name"] = "Main Floor"
+    _config["devices"]["ABB7F500E17A"]["channels"]["ch0003"]["outputs"]["odp0000"][
+        "value"
+    ] = "1"
+    _config["devices"]["ABB7F500E17B"] = _config["devices"].pop("ABB7F62F6C0B")
+    api_mock.get_configuration.return_value = _config
+
+    await freeathome.load(refresh=True)
+
+    assert freeathome.get_channels() is channels
+    assert channels["ABB7F500E17A/ch0003"] is channel
+    assert channel.state is True
+    assert channel.floor_name == "Main Floor"
+    callback.assert_called_once_with()
+
+    assert freeathome.get_device_by_serial("ABB7F62F6A46") is other_device
+    assert freeathome.get_device_by_serial("ABB7F62F6C0B") is None
+    assert "ABB7F62F6C0B/ch0000" not in channels
+    assert "ABB7F500E17B/ch0000" in channels
+    assert "ABB7F500E17A/ch0003/odp0000" in freeathome._datapoint_routes
+
+
+@pytest.mark.asyncio
+async def test_load_refresh_unchanged(freeathome, api_mock):
+    """Test reloading an unchanged configuration keeps all objects."""
+    await freeathome.load()
+
+    channels = dict(freeathome.get_channels())
+    api_mock.get_configuration.return_value = deepcopy(
+        api_mock.get_configuration.return_value
+    )
+
+    with patch.object(Device, "update_configuration") as mock_update:
+        await freeathome.load(refresh=True)
+        mock_update.assert_not_called()
+
+    assert api_mock.get_configuration.call_count == 2
+    assert freeathome.get_channels() == channels
+
+
+@pytest.mark.asyncio
+async def test_load_snapshot(api_mock, tmp_path):
+    """Test loading from a snapshot and revalidating in the background."""
+    snapshot = ConfigurationSnapshot(tmp_path / "snapshot", "0000", "3.3.0")
+
+    # Without a snapshot the configuration is loaded from the api and saved
+    freeathome = FreeAtHome(api=api_mock, snapshot=snapshot)
+    await freeathome.load()
+    assert freeathome._revalidate_task is None
+    assert await snapshot.load() == api_mock.get_configuration.return_value
+
+    _config = deepcopy(api_mock.get_configuration.return_value)
+    _config["devices"]["ABB7F500E17A"]["channels"]["ch0003"]["outputs"]["odp0000"][
+        "value"
+    ] = "1"
+    api_mock.get_configuration.return_value = _config
+    api_mock.get_configuration.reset_mock()
+
+    # The devices are loaded from the snapshot, then revalidated
+    freeathome = FreeAtHome(api=api_mock, snapshot=snapshot)
+    await freeathome.load()
+    channel = freeathome.get_channels()["ABB7F500E17A/ch0003"]
+    assert channel.state is False
+
+    await freeathome._revalidate_task
+    api_mock.get_configuration.assert_called_once_with()
+    assert freeathome.get_channels()["ABB7F500E17A/ch0003"] is channel
+    assert channel.state is True
+    assert await snapshot.load() == _config
+
+
+@pytest.mark.asyncio
+async def test_load_snapshot_revalidate_error(api_mock, tmp_path):
+    """Test a failed revalidation keeps the devices from the snapshot."""
+    snapshot = ConfigurationSnapshot(tmp_path / "snapshot", "0000", "3.3.0")
+    await snapshot.save(api_mock.get_configuration.return_value)
+    api_mock.get_configuration.side_effect = ClientConnectionError("host")
+
+    freeathome = FreeAtHome(api=api_mock, snapshot=snapshot)
+    await freeathome.load()
+    await freeathome._revalidate_task
+
+    assert "ABB7F500E17A/ch0003" in freeathome.get_channels()
+
+
+@pytest.mark.asyncio
+async def test_load_snapshot_revalidate_running(api_mock, tmp_path):
+    """Test a reload waits for the revalidation, which is cancelled on close."""
+    snapshot = ConfigurationSnapshot(tmp_path / "snapshot", "0000", "3.3.0")
+    await snapshot.save(api_mock.get_configuration.return_value)
+
+    fetched = asyncio.Event()
+    _config = api_mock.get_configuration.return_value
+
+    async def get_configuration():
+        await fetched.wait()
+        return deepcopy(_config)
+
+    api_mock.get_configuration.side_effect = get_configuration
+    api_mock.ws_close = AsyncMock()
+
+    freeathome = FreeAtHome(api=api_mock, snapshot=snapshot)
+    await freeathome.load()
+    revalidate_task = freeathome._revalidate_task
+
+    reload_task = asyncio.create_task(freeathome.load(refresh=True))
+    await asyncio.sleep(0)
+    assert api_mock.get_configuration.call_count == 1
+
+    fetched.set()
+    await reload_task
+    assert revalidate_task.done()
+    assert api_mock.get_configuration.call_count == 2
+
+    # A running revalidation is cancelled on close
+    fetched.clear()
+    freeathome = FreeAtHome(api=api_mock, snapshot=snapshot)
+    await freeathome.load()
+    revalidate_task = freeathome._revalidate_task
+
+    await freeathome.ws_close()
+    assert revalidate_task.cancelled()
+    assert freeathome._revalidate_task is None
+
+
+@pytest.mark.asyncio
+async def test_load_lazy_channels(api_mock):
+    """Test lazy channels filtered out by class are never created."""
+    freeathome = FreeAtHome(
+        api=api_mock,
+        interfaces=[Interface.WIRED_BUS],
+        channel_classes=[SwitchActuator],
+        lazy_channels=True,
+    )
+    await freeathome.load()
+
+    device = freeathome.get_device_by_serial("ABB7F500E17A")
+    assert device._channels == {}
+
+    channels = freeathome.get_channels()
+    assert isinstance(channels["ABB7F500E17A/ch0003"], SwitchActuator)
+    assert list(device._channels) == ["ch0003"]
+
+    freeathome.unload_channel(device_serial="ABB7F500E17A", channel_id="ch0000")
+    assert list(device._channels) == ["ch0003"]
+
+    await freeathome.update({"datapoints": {"ABB7F500E17A/ch0003/odp0000": "1"}})
+    assert channels["ABB7F500E17A/ch0003"].state is True
+
+
+@pytest.mark.asyncio
+async def test_load_lazy_channels_unfiltered(api_mock):
+    """Test lazy channels are only created when targeted or returned."""
+    freeathome = FreeAtHome(
+        api=api_mock, interfaces=[Interface.WIRED_BUS], lazy_channels=True
+    )
+    await freeathome.load()
+
+    def created_channels() -> dict[str, list[str]]:
+        return {
+            _serial: list(_device._channels)
+            for _serial, _device in freeathome.get_devices().items()
+            if _device._channels
+        }
+
+    callback = MagicMock()
+    freeathome.subscribe(callback, callback_attribute="state")
+    assert created_channels() == {}
+
+    # An update only creates the channel it targets
+    await freeathome.update({"datapoints": {"ABB7F500E17A/ch0003/odp0000": "1"}})
+    assert created_channels() == {"ABB7F500E17A": ["ch0003"]}
+    channel = freeathome.get_device_by_serial("ABB7F500E17A").get_channel("ch0003")
+    assert channel.state is True
+    assert callback.call_args.args[0].channel is channel
+
+    # The queries only create the channels they return
+    assert freeathome.get_channels_by_device("ABB7F62F6C0B") == [
+        freeathome.get_device_by_serial("ABB7F62F6C0B").get_channel("ch0000"),
+        freeathome.get_device_by_serial("ABB7F62F6C0B").get_channel("ch0003"),
+    ]
+    assert freeathome.get_channels_by_room("01", "18") == [
+        freeathome.get_device_by_serial("ABB7F62F6A46").get_channel("ch0000")
+    ]
+    assert freeathome.get_channels_by_class(SwitchActuator)[0] is channel
+    assert created_channels() == {
+        "ABB7F500E17A": ["ch0003"],
+        "ABB7F62F6C0B": ["ch0000", "ch0003"],
+        "ABB7F62F6A46": ["ch0000"],
+    }
+
+    # Getting all channels creates the remaining ones
+    assert len(freeathome.get_channels()) == 5
+    assert created_channels()["ABB7F500E17A"] == ["ch0003", "ch0000"]
+
+
+@pytest.mark.asyncio
+async def test_channel_indexes_incremental(freeathome):
+    """Test the channel indexes follow unloading and reloading devices."""
+    await freeathome.load()
+
+    assert len(freeathome.get_channels_by_device("ABB7F500E17A")) == 2
+    assert len(freeathome.get_channels_by_interface(Interface.WIRED_BUS)) == len(
+        freeathome.get_channels()
+    )
+    assert set(freeathome.get_channels_by_class(Base, include_subclasses=True)) == set(
+        freeathome.get_channels().values()
+    )
+
+    freeathome.unload_channel(device_serial="ABB7F500E17A", channel_id="ch0003")
+    assert [
+        _channel.channel_id
+        for _channel in freeathome.get_channels_by_device("ABB7F500E17A")
+    ] == ["ch0000"]
+
+    freeathome.unload_device("ABB7F500E17A")
+    assert freeathome.get_channels_by_device("ABB7F500E17A") == []
+    assert all(
+        _channel.device_serial != "ABB7F500E17A"
+        for _channel in freeathome.get_channels_by_class(SwitchActuator)
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_by_floor_and_room(freeathome):
+    """Test getting devices and channels by floor and room."""
+    await freeathome.load()
+
+    assert [
+        _device.device_serial for _device in freeathome.get_devices_by_room("02", "02")
+    ] == ["ABB7F62F6C0B"]
+    assert {
+        _device.device_serial for _device in freeathome.get_devices_by_floor("01")
+    } == {"ABB7F500E17A", "ABB7F62F6A46"}
+
+    channels = freeathome.get_channels()
+    assert freeathome.get_channels_by_room("01", "01") == [
+        channels["ABB7F500E17A/ch0000"],
+        channels["ABB7F500E17A/ch0003"],
+    ]
+    assert len(freeathome.get_channels_by_floor("01")) >= 2
+
+    freeathome.unload_device("ABB7F500E17A")
+    assert freeathome.get_channels_by_room("01", "01") == []
+    assert {
+        _device.device_serial for _device in freeathome.get_devices_by_floor("01")
+    } == {"ABB7F62F6A46"}
+
+
+@pytest.mark.asyncio
+async def test_subscribe(freeathome, api_mock):
+    """Test subscribing to channel changes across the installation."""
+    await freeathome.load()
+
+    callback = MagicMock()
+    other_callback = MagicMock()
+    subscription = freeathome.subscribe(
+        callback,
+        channel_class=SwitchActuator,
+        callback_attribute="state",
+        floor_id="01",
+        room_id="01",
+    )
+    freeathome.subscribe(other_callback, device_serial="ABB7F62F6A46")
+
+    await freeathome.update({"datapoints": {"ABB7F500E17A/ch0003/odp0000": "1"}})
+
+    channel = freeathome.get_channels()["ABB7F500E17A/ch0003"]
+    callback.assert_called_once()
+    event = callback.call_args.args[0]
+    assert event.channel_serial == "ABB7F500E17A/ch0003"
+    assert event.channel is channel
+    assert event.callback_attribute == "state"
+    assert event.value is True
+    other_callback.assert_not_called()
+
+    # The subscription is kept valid when the channels are reloaded
+    freeathome.unload_device("ABB7F500E17A")
+    freeathome.load_device(
+        "ABB7F500E17A",
+        api_mock.get_configuration.return_value["devices"]["ABB7F500E17A"],
+    )
+    await freeathome.update({"datapoints": {"ABB7F500E17A/ch0003/odp0000": "0"}})
+    assert callback.call_count == 2
+    assert callback.call_args.args[0].channel is not channel
+
+    freeathome.unsubscribe(subscription)
+    await freeathome.update({"datapoints": {"ABB7F500E17A/ch0003/odp0000": "1"}})
+    assert callback.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_subscribe_reload(freeathome, api_mock):
+    """Test subscriptions see the changes applied by reloading devices."""
+    await freeathome.load()
+
+    callback = MagicMock()
+    freeathome.subscribe(callback, callback_attribute="state")
+
+    _config = deepcopy(api_mock.get_configuration.return_value)
+    _device_data = _config["devices"]["ABB7F500E17A"]
+    _device_data["channels"]["ch0003"]["outputs"]["odp0000"]["value"] = "1"
+    api_mock.get_configuration.return_value = _config
+
+    await freeathome.load(refresh=True)
+    await freeathome.callback_executor.drain()
+
+    callback.assert_called_once()
+    assert callback.call_args.args[0].channel_serial == "ABB7F500E17A/ch0003"
+    assert callback.call_args.args[0].value is True
+
+    # The same for devices updated by a websocket message
+    _device_data = deepcopy(_device_data)
+    _device_data["channels"]["ch0003"]["outputs"]["odp0000"]["value"] = "0"
+    await freeathome.update({"devices": {"ABB7F500E17A": _device_data}})
+    await freeathome.callback_executor.drain()
+
+    assert callback.call_count == 2
+    assert callback.call_args.args[0].value is False
+
+
+@pytest.mark.asyncio
+async def test_execute(freeathome, api_mock):
+    """Test running a group command on many channels."""
+    await freeathome.load()
+
+    channels = freeathome.get_channels_by_class(SwitchActuator)
+    callback = MagicMock()
+    channels[0].register_callback(callback_attribute="state", callback=callback)
+
+    results = await freeathome.execute(channels, "turn_on", notify_callbacks=True)
+
+    assert results == {
+        f"{_channel.device_serial}/{_channel.channel_id}": None for _channel in channels
+    }
+    assert api_mock.set_datapoint.await_count == len(channels)
+    assert all(_channel.state is True for _channel in channels)
+    callback.assert_called_once_with()
+
+    # Unchanged attributes do not call the callbacks
+    await freeathome.execute(channels, "turn_on", notify_callbacks=True)
+    callback.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_update_devices_removed(freeathome, api_mock):
+    """Test the update function unloads only the removed devices."""
+    await freeathome.load()
+    api_mock.get_configuration.reset_mock()
+
+    channels = freeathome.get_channels()
+    channel = channels["ABB7F62F6C0B/ch0000"]
+
+    await freeathome.update(
+        {
+            "devicesRemoved": ["ABB7F500E17A"],
+            "datapoints": {"ABB7F500E17A/ch0003/odp0000": "1"},
+        }
+    )
+
+    assert freeathome.get_device_by_serial("ABB7F500E17A") is None
+    assert freeathome.get_channels() is channels
+    assert "ABB7F500E17A/ch0003" not in channels
+    assert "ABB7F500E17A/ch0003/odp0000" not in freeathome._datapoint_routes
+    assert channels["ABB7F62F6C0B/ch0000"] is channel
+    assert "ABB7F500E17A" not in freeathome._config["devices"]
+    api_mock.get_configuration.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_devices_added(freeathome, api_mock):
+    """Test the update function loads only the added devices."""
+    device_data = deepcopy(
+        api_mock.get_configuration.return_value["devices"]["ABB7F500E17A"]
+    )
+    await freeathome.load()
+    freeathome.unload_device("ABB7F500E17A")
+    api_mock.get_configuration.reset_mock()
+    api_mock.get_device.return_value = device_data
+
+    channels = freeathome.get_channels()
+    assert "ABB7F500E17A/ch0003" not in channels
+
+    await freeathome.update(
+        {
+            "devicesAdded": ["ABB7F500E17A"],
+            "datapoints": {"ABB7F500E17A/ch0003/odp0000": "1"},
+        }
+    )
+
+    api_mock.get_device.assert_called_once_with(device_serial="ABB7F500E17A")
+    api_mock.get_configuration.assert_not_called()
+    assert freeathome.get_channels() is channels
+    assert isinstance(channels["ABB7F500E17A/ch0003"], SwitchActuator)
+    assert channels["ABB7F500E17A/ch0003"].state is True
+
+
+@pytest.mark.asyncio
+async def test_update_devices_added_failure(freeathome, api_mock, caplog):
+    """Test a failure to load an added device still applies the datapoints."""
+    await freeathome.load()
+    api_mock.get_device.side_effect = ClientConnectionError("host")
+
+    channel = freeathome.get_channels()["ABB7F500E17A/ch0003"]
+    assert channel.state is False
+
+    await freeathome.update(
+        {
+            "devicesAdded": ["ABB7F62F6C0C"],
+            "datapoints": {"ABB7F500E17A/ch0003/odp0000": "1"},
+        }
+    )
+
+    api_mock.get_device.assert_called_once_with(device_serial="ABB7F62F6C0C")
+    assert "Failed to load the added device ABB7F62F6C0C." in caplog.text
+    assert freeathome.get_device_by_serial("ABB7F62F6C0C") is None
+    assert channel.state is True
+
+
+@pytest.mark.asyncio
+async def test_update_devices_updated(freeathome, api_mock):
+    """Test the update function reloads the updated devices."""
+    await freeathome.load()
+    device_data = deepcopy(
+        api_mock.get_configuration.return_value["devices"]["ABB7F500E17A"]
+    )
+    device_data["channels"]["ch0003"]["displayName"] = "Study Lamp"
+
+    channels = freeathome.get_channels()
+    other_channel = channels["ABB7F62F6C0B/ch0000"]
+
+    await freeathome.update({"devices": {"ABB7F500E17A": device_data}})
+
+    api_mock.get_device.assert_not_called()
+    assert channels["ABB7F500E17A/ch0003"].channel_name == "Study Lamp"
+    assert channels["ABB7F62F6C0B/ch0000"] is other_channel
+
+
+@pytest.mark.asyncio
+async def test_load_device_filtered(freeathome, api_mock):
+    """Test loading a device excluded by the interface filter."""
+    await freeathome.load()
+
+    device = freeathome.load_device("60002AE2F1BE", {"interface": "VD"})
+    assert device is None
+    assert freeathome.get_device_by_serial("60002AE2F1BE") is None
 
 
 @pytest.mark.asyncio
@@ -876,6 +1498,11 @@ async def test_channel_class_filtering(api_mock):
     for channel in channels.values():
         assert isinstance(channel, SwitchActuator)
 
+    # Channels of other classes are never created
+    for device in freeathome.get_devices().values():
+        for channel in device.channels.values():
+            assert isinstance(channel, SwitchActuator)
+
 
 @pytest.mark.asyncio
 async def test_unload_channel_by_id(api_mock):
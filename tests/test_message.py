@@ -0,0 +1,47 @@
+"""Test code to test the decoded websocket message."""
+
+from src.abbfreeathome.message import DatapointUpdate, WebsocketMessage
+
+
+def test_websocket_message_from_data():
+    """Test decoding all sections of a websocket message."""
+    message = WebsocketMessage.from_data(
+        {
+            "datapoints": {"ABB7F500E17A/ch0003/odp0000": "1"},
+            "devices": {"ABB7F500E17A": {"displayName": "Switch"}},
+            "devicesAdded": ["ABB7F62F6C0B"],
+            "devicesRemoved": ["ABB28CBC3651"],
+            "scenesTriggered": {"FFFF48010001": {"channels": {}}},
+        }
+    )
+
+    assert message.datapoints == (DatapointUpdate("ABB7F500E17A/ch0003/odp0000", "1"),)
+    assert message.devices == {"ABB7F500E17A": {"displayName": "Switch"}}
+    assert message.devices_added == ("ABB7F62F6C0B",)
+    assert message.devices_removed == ("ABB28CBC3651",)
+    assert message.scenes_triggered == {"FFFF48010001": {"channels": {}}}
+    assert repr(message) == (
+        "WebsocketMessage(datapoints=1, devices=1, devices_added=1, "
+        "devices_removed=1, scenes_triggered=1)"
+    )
+
+
+def test_websocket_message_empty():
+    """Test decoding a websocket message with missing sections."""
+    for data in (None, {}, {"datapoints": None}):
+        message = WebsocketMessage.from_data(data)
+        assert message.datapoints == ()
+        assert message.devices == {}
+        assert message.devices_added == ()
+        assert message.devices_removed == ()
+        assert message.scenes_triggered == {}
+
+
+def test_datapoint_update():
+    """Test the parts of a datapoint key."""
+    datapoint = DatapointUpdate("ABB7F500E17A/ch0003/odp0000", "1")
+
+    assert datapoint.device_serial == "ABB7F500E17A"
+    assert datapoint.channel_id == "ch0003"
+    assert datapoint.datapoint_id == "odp0000"
+    assert datapoint.value == "1"
@@ -0,0 +1,131 @@
+"""Test code to test the websocket receive queue."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.abbfreeathome.receive_queue import ReceiveQueue, ReceiveQueueOverflowPolicy
+
+
+class Recorder:
+    """Record the messages dispatched by a queue, blocking until released."""
+
+    def __init__(self) -> None:
+        """Initialize the Recorder class."""
+        self.release = asyncio.Event()
+        self.messages = []
+
+    async def callback(self, message: str):
+        """Record a message."""
+        await self.release.wait()
+        if message == "fail":
+            raise ValueError(message)
+        self.messages.append(message)
+
+
+@pytest.mark.asyncio
+async def test_receive_queue_block():
+    """Test a full queue with the block policy waits for a free slot."""
+    recorder = Recorder()
+    queue = ReceiveQueue(recorder.callback, max_size=1)
+
+    await queue.put("1")
+    await asyncio.sleep(0)
+    await queue.put("2")
+    assert queue.metrics.depth == 1
+
+    blocked = asyncio.create_task(queue.put("3"))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+
+    recorder.release.set()
+    await blocked
+    await queue.drain()
+
+    assert recorder.messages == ["1", "2", "3"]
+    assert queue.metrics.received == 3
+    assert queue.metrics.dispatched == 3
+    assert queue.metrics.dropped == 0
+    await queue.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("overflow_policy", "expected_messages"),
+    [
+        (ReceiveQueueOverflowPolicy.drop_oldest, ["1", "3", "4"]),
+        (ReceiveQueueOverflowPolicy.drop_newest, ["1", "2", "3"]),
+    ],
+)
+async def test_receive_queue_drop(overflow_policy, expected_messages):
+    """Test a full queue with a drop policy never blocks the reader."""
+    recorder = Recorder()
+    queue = ReceiveQueue(recorder.callback, max_size=2, overflow_policy=overflow_policy)
+
+    await queue.put("1")
+    await asyncio.sleep(0)
+    await queue.put("2")
+    await queue.put("3")
+    await queue.put("4")
+
+    recorder.release.set()
+    await queue.drain()
+
+    assert recorder.messages == expected_messages
+    assert queue.metrics.received == 4
+    assert queue.metrics.dropped == 1
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_receive_queue_metrics():
+    """Test the failures and latency of each stage are recorded."""
+    recorder = Recorder()
+    queue = ReceiveQueue(recorder.callback)
+    assert queue.metrics.average_queue_latency is None
+    assert queue.metrics.average_dispatch_latency is None
+
+    recorder.release.set()
+    await queue.put("1")
+    await queue.put("fail")
+    await queue.drain()
+
+    assert queue.metrics.dispatched == 1
+    assert queue.metrics.failed == 1
+    assert queue.metrics.average_queue_latency >= 0
+    assert queue.metrics.max_queue_latency >= 0
+    assert queue.metrics.average_dispatch_latency >= 0
+    assert queue.metrics.max_dispatch_latency >= 0
+    assert repr(queue.metrics) == (
+        "ReceiveQueueMetrics(depth=0, received=2, dispatched=1, failed=1, dropped=0)"
+    )
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_receive_queue_sync_callback():
+    """Test a callback, which is not a coroutine function."""
+    callback = MagicMock()
+    queue = ReceiveQueue(callback, dispatchers=2)
+
+    await queue.put("1")
+    await queue.drain()
+
+    callback.assert_called_once_with("1")
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_receive_queue_close():
+    """Test closing the queue stops the dispatchers."""
+    recorder = Recorder()
+    queue = ReceiveQueue(recorder.callback)
+
+    await queue.put("1")
+    await asyncio.sleep(0)
+    await queue.close()
+
+    recorder.release.set()
+    await asyncio.sleep(0)
+    assert recorder.messages == []
@@ -0,0 +1,193 @@
+"""Test code to test the refresh scheduler."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.abbfreeathome.channels.base import Base
+from src.abbfreeathome.exceptions import (
+    InvalidChannelCommandException,
+    InvalidDeviceChannelPairing,
+)
+from src.abbfreeathome.scheduler import CommandScheduler, RefreshScheduler, TokenBucket
+
+
+def create_channel(channel_id: str, refresh_state=None):
+    """Create a mock channel."""
+    channel = MagicMock(spec=Base)
+    channel.device_serial = "ABB7F500E17A"
+    channel.channel_id = channel_id
+    channel.channel_name = f"Channel {channel_id}"
+    channel.refresh_request_count = 1
+    channel.refresh_state.side_effect = refresh_state
+    return channel
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_burst():
+    """Test the bucket allows a burst up to its capacity without waiting."""
+    bucket = TokenBucket(rate=1, capacity=3)
+    assert bucket.rate == 1
+    assert bucket.capacity == 3
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for _ in range(3):
+        await bucket.acquire()
+    assert loop.time() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_rate():
+    """Test the bucket waits for tokens once it's empty."""
+    bucket = TokenBucket(rate=50)
+
+    loop = asyncio.get_running_loop()
+    await bucket.acquire(50)
+    start = loop.time()
+    await bucket.acquire(5)
+    assert loop.time() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_over_capacity():
+    """Test acquiring more tokens than the capacity puts the bucket in debt."""
+    bucket = TokenBucket(rate=100, capacity=1)
+
+    loop = asyncio.get_running_loop()
+    await bucket.acquire(5)
+    start = loop.time()
+    await bucket.acquire()
+    assert loop.time() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_refresh_scheduler():
+    """Test refreshing channels with per channel results."""
+    failure = InvalidDeviceChannelPairing("ABB7F500E17A", "ch0001", 256)
+    channels = [
+        create_channel("ch0000"),
+        create_channel("ch0001", refresh_state=failure),
+    ]
+
+    scheduler = RefreshScheduler(max_concurrency=2, request_rate=100)
+    assert scheduler.max_concurrency == 2
+    assert scheduler.request_rate == 100
+
+    results = await scheduler.refresh(channels)
+    assert results == {
+        "ABB7F500E17A/ch0000": None,
+        "ABB7F500E17A/ch0001": failure,
+    }
+    for channel in channels:
+        channel.refresh_state.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_refresh_scheduler_max_concurrency():
+    """Test the scheduler limits the number of concurrent refreshes."""
+    running = 0
+    max_running = 0
+
+    async def refresh_state():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    channels = [
+        create_channel(f"ch000{_index}", refresh_state=refresh_state)
+        for _index in range(6)
+    ]
+
+    scheduler = RefreshScheduler(max_concurrency=2, request_rate=1000)
+    results = await scheduler.refresh(channels)
+
+    assert len(results) == 6
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_scheduler_get_devices():
+    """Test getting devices concurrently within the concurrency limit."""
+    running = 0
+    max_running = 0
+
+    async def get_device(device_serial: str) -> dict:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"serial": device_serial}
+
+    api = MagicMock()
+    api.get_device = AsyncMock(side_effect=get_device)
+    serials = ["ABB7F500E17A", "ABB7F62F6A46", "ABB7F500E17A", "ABB7F62F6C0B"]
+
+    scheduler = RefreshScheduler(max_concurrency=2, request_rate=1000)
+    results = await scheduler.get_devices(api, serials)
+
+    assert results == {
+        _serial: {"serial": _serial}
+        for _serial in ["ABB7F500E17A", "ABB7F62F6A46", "ABB7F62F6C0B"]
+    }
+    assert api.get_device.await_count == 3
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_command_scheduler():
+    """Test running a command on channels with per channel results."""
+    failure = InvalidDeviceChannelPairing("ABB7F500E17A", "ch0001", 256)
+    channels = [create_channel("ch0000"), create_channel("ch0001")]
+    channels[0].turn_off = AsyncMock()
+    channels[1].turn_off = AsyncMock(side_effect=failure)
+
+    scheduler = CommandScheduler(max_concurrency=2)
+    assert scheduler.max_concurrency == 2
+
+    results = await scheduler.execute(channels, "turn_off")
+    assert results == {
+        "ABB7F500E17A/ch0000": None,
+        "ABB7F500E17A/ch0001": failure,
+    }
+    for channel in channels:
+        channel.turn_off.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_command_scheduler_arguments_and_callbacks():
+    """Test passing arguments and calling the callbacks of changed attributes."""
+    channel = create_channel("ch0000")
+    channel.set_brightness = AsyncMock()
+    channel.get_callback_attribute_values.side_effect = [
+        {"state": False, "brightness": 10},
+        {"state": True, "brightness": 10},
+    ]
+
+    scheduler = CommandScheduler()
+    await scheduler.execute(
+        [channel], "set_brightness", 50, transition=1, notify_callbacks=True
+    )
+
+    channel.set_brightness.assert_awaited_once_with(50, transition=1)
+    channel.run_callbacks.assert_called_once_with("state")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "command",
+    ["unknown_command", "_set_switching_datapoint", "register_callback", "device"],
+)
+async def test_command_scheduler_invalid_command(command):
+    """Test an unsupported command raises before anything is sent."""
+    channel = create_channel("ch0000")
+
+    scheduler = CommandScheduler()
+    with pytest.raises(InvalidChannelCommandException):
+        await scheduler.execute([channel], command)
+
+    channel.refresh_state.assert_not_called()
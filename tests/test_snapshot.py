@@ -0,0 +1,67 @@
+"""Test code to test the configuration snapshot."""
+
+import asyncio
+from copy import deepcopy
+
+import pytest
+
+from src.abbfreeathome.snapshot import SNAPSHOT_FORMAT, ConfigurationSnapshot
+
+CONFIG = {"devices": {"ABB7F500E17A": {"displayName": "Study Area Rocker"}}}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_roundtrip(tmp_path):
+    """Test saving and loading a snapshot."""
+    snapshot = ConfigurationSnapshot(tmp_path / "snapshot", "0000", "3.3.0")
+    assert snapshot.path == tmp_path / "snapshot"
+    assert snapshot.key == "0000/3.3.0"
+
+    # No snapshot saved yet
+    assert await snapshot.load() is None
+
+    await snapshot.save(CONFIG)
+    assert (tmp_path / "snapshot").read_bytes().startswith(SNAPSHOT_FORMAT)
+    assert await snapshot.load() == CONFIG
+
+
+@pytest.mark.asyncio
+async def test_snapshot_concurrent_save(tmp_path):
+    """Test concurrent saves each write a complete snapshot of their config."""
+    snapshot = ConfigurationSnapshot(tmp_path / "snapshot", "0000", "3.3.0")
+    config = deepcopy(CONFIG)
+
+    _saves = [asyncio.create_task(snapshot.save(config)) for _ in range(5)]
+    await asyncio.sleep(0)
+
+    # Changes while the snapshot is written are not part of it
+    config["devices"].clear()
+    await asyncio.gather(*_saves)
+
+    assert await snapshot.load() == CONFIG
+    assert [_path.name for _path in tmp_path.iterdir()] == ["snapshot"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("sysap_serial", "sysap_version"),
+    [("0001", "3.3.0"), ("0000", "3.4.0")],
+)
+async def test_snapshot_other_sysap(tmp_path, sysap_serial, sysap_version):
+    """Test a snapshot of another SysAP or firmware version is not loaded."""
+    await ConfigurationSnapshot(tmp_path / "snapshot", "0000", "3.3.0").save(CONFIG)
+
+    snapshot = ConfigurationSnapshot(tmp_path / "snapshot", sysap_serial, sysap_version)
+    assert await snapshot.load() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "data", [b"{}", SNAPSHOT_FORMAT + b"corrupt"], ids=["format", "corrupt"]
+)
+async def test_snapshot_invalid(tmp_path, data):
+    """Test an invalid snapshot is not loaded."""
+    (tmp_path / "snapshot").write_bytes(data)
+
+    snapshot = ConfigurationSnapshot(tmp_path / "snapshot", "0000", "3.3.0")
+    assert await snapshot.load() is None
@@ -0,0 +1,113 @@
+"""Test code to test the bounded worker queue."""
+
+import asyncio
+import enum
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.abbfreeathome.exceptions import QueueFullException
+from src.abbfreeathome.worker_queue import (
+    WorkerQueue,
+    WorkerQueueMetrics,
+    WorkerQueueOverflowPolicy,
+)
+
+
+class CountingMetrics(WorkerQueueMetrics):
+    """Metrics recording the handler latencies."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the CountingMetrics class."""
+        super().__init__(*args, **kwargs)
+        self.handler_latencies = []
+
+    def record_completed(self, queue_latency: float, handler_latency: float):
+        """Record a handled item and its handler latency."""
+        super().record_completed(queue_latency, handler_latency)
+        self.handler_latencies.append(handler_latency)
+
+
+class OtherOverflowPolicy(enum.Enum):
+    """An overflow policy Enum of another queue."""
+
+    drop_newest = "drop_newest"
+
+
+@pytest.mark.asyncio
+async def test_worker_queue_sync_handler():
+    """Test a synchronous handler gets the arguments and a metrics class is used."""
+    handler = MagicMock(side_effect=[None, ValueError])
+    queue = WorkerQueue(handler, max_size=10, workers=1, metrics_class=CountingMetrics)
+
+    await queue.put("a", 1)
+    await queue.put("b", 2)
+    await queue.drain()
+
+    handler.assert_any_call("a", 1)
+    handler.assert_any_call("b", 2)
+    assert isinstance(queue.metrics, CountingMetrics)
+    assert len(queue.metrics.handler_latencies) == 1
+    assert repr(queue.metrics) == (
+        "CountingMetrics(depth=0, queued=2, completed=1, failed=1, dropped=0)"
+    )
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_worker_queue_drop_newest():
+    """Test a full queue with a foreign drop_newest policy drops the new item."""
+    release = asyncio.Event()
+    handled = []
+    on_drop = MagicMock()
+
+    async def handler(item: str):
+        await release.wait()
+        handled.append(item)
+
+    queue = WorkerQueue(
+        handler,
+        max_size=1,
+        workers=1,
+        overflow_policy=OtherOverflowPolicy.drop_newest,
+        on_drop=on_drop,
+    )
+
+    await queue.put("1")
+    await asyncio.sleep(0)
+    await queue.put("2")
+    await queue.put("3")
+
+    release.set()
+    await queue.drain()
+
+    assert handled == ["1", "2"]
+    on_drop.assert_called_once_with("3")
+    assert queue.metrics.dropped == 1
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_worker_queue_raise():
+    """Test a full queue with the raise policy raises a QueueFullException."""
+    release = asyncio.Event()
+
+    async def handler():
+        await release.wait()
+
+    queue = WorkerQueue(
+        handler,
+        max_size=1,
+        workers=1,
+        overflow_policy=WorkerQueueOverflowPolicy.raise_error,
+    )
+
+    await queue.put()
+    await asyncio.sleep(0)
+    await queue.put()
+
+    with pytest.raises(QueueFullException, match="Worker queue is full"):
+        await queue.put()
+
+    assert queue.max_size == 1
+    await queue.close()
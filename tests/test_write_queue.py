@@ -0,0 +1,136 @@
+"""Test code to test the background write queue."""
+
+import asyncio
+
+import pytest
+
+from src.abbfreeathome.exceptions import WriteQueueFullException
+from src.abbfreeathome.write_queue import WriteQueue, WriteQueueOverflowPolicy
+
+
+class Recorder:
+    """Record the writes sent by a queue, blocking until released."""
+
+    def __init__(self) -> None:
+        """Initialize the Recorder class."""
+        self.release = asyncio.Event()
+        self.values = []
+
+    async def handler(self, value: str):
+        """Record a write."""
+        await self.release.wait()
+        if value == "fail":
+            raise ValueError(value)
+        self.values.append(value)
+
+
+@pytest.mark.asyncio
+async def test_write_queue_block():
+    """Test a full queue with the block policy waits for a free slot."""
+    recorder = Recorder()
+    queue = WriteQueue(recorder.handler, max_size=1, workers=1)
+
+    await queue.put("1")
+    await asyncio.sleep(0)
+    await queue.put("2")
+    assert queue.metrics.depth == 1
+
+    blocked = asyncio.create_task(queue.put("3"))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+
+    recorder.release.set()
+    await blocked
+    await queue.drain()
+
+    assert recorder.values == ["1", "2", "3"]
+    assert queue.metrics.sent == 3
+    assert queue.metrics.dropped == 0
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_write_queue_drop_oldest():
+    """Test a full queue with the drop_oldest policy drops the oldest write."""
+    recorder = Recorder()
+    queue = WriteQueue(
+        recorder.handler,
+        max_size=2,
+        workers=1,
+        overflow_policy=WriteQueueOverflowPolicy.drop_oldest,
+    )
+
+    await queue.put("1")
+    await asyncio.sleep(0)
+    for _value in ("2", "3", "4"):
+        await queue.put(_value)
+
+    recorder.release.set()
+    await queue.drain()
+
+    assert recorder.values == ["1", "3", "4"]
+    assert queue.metrics.dropped == 1
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_write_queue_raise():
+    """Test a full queue with the raise policy raises an exception."""
+    recorder = Recorder()
+    queue = WriteQueue(
+        recorder.handler,
+        max_size=1,
+        workers=1,
+        overflow_policy=WriteQueueOverflowPolicy.raise_error,
+    )
+
+    await queue.put("1")
+    await asyncio.sleep(0)
+    await queue.put("2")
+    with pytest.raises(WriteQueueFullException):
+        await queue.put("3")
+
+    recorder.release.set()
+    await queue.drain()
+    assert recorder.values == ["1", "2"]
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_write_queue_metrics():
+    """Test the metrics of the queue."""
+    recorder = Recorder()
+    recorder.release.set()
+    queue = WriteQueue(recorder.handler)
+    assert queue.metrics.average_latency is None
+
+    await queue.put("1")
+    await queue.put("fail")
+    await queue.drain()
+
+    assert queue.metrics.sent == 1
+    assert queue.metrics.failed == 1
+    assert queue.metrics.average_latency >= 0
+    assert queue.metrics.max_latency >= queue.metrics.average_latency
+    assert repr(queue.metrics) == (
+        "WriteQueueMetrics(depth=0, sent=1, failed=1, dropped=0)"
+    )
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_write_queue_close():
+    """Test closing the queue discards the queued writes."""
+    recorder = Recorder()
+    queue = WriteQueue(recorder.handler, workers=1)
+
+    # Draining a queue without workers returns immediately
+    await queue.drain()
+
+    await queue.put("1")
+    await queue.put("2")
+    await asyncio.sleep(0)
+    await queue.close()
+
+    assert recorder.values == []
+    assert queue.metrics.depth == 1
@@ -0,0 +1,304 @@
+"""Test code to test the WebsocketSupervisor class."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, call, patch
+
+import aiohttp
+import pytest
+
+from src.abbfreeathome.api import FreeAtHomeApi
+from src.abbfreeathome.exceptions import SslErrorException
+from src.abbfreeathome.message import WebsocketMessage
+from src.abbfreeathome.ws_supervisor import (
+    WebsocketMetrics,
+    WebsocketState,
+    WebsocketSupervisor,
+)
+
+
+@pytest.fixture
+def api_mock():
+    """Mock-up the api class."""
+    api = MagicMock(spec=FreeAtHomeApi)
+    api.host = "http://192.168.1.1"
+    api.ws_heartbeat = 30
+    api.ws_connect = AsyncMock()
+    api.ws_read = AsyncMock()
+    return api
+
+
+def set_connected(api: MagicMock, *values: bool):
+    """Set the values returned by ws_connected, raising CancelledError after."""
+    type(api).ws_connected = PropertyMock(
+        side_effect=[*values, asyncio.CancelledError()]
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_reconnect(api_mock):
+    """Test the supervisor reconnects and resynchronizes after an outage."""
+    callback = MagicMock()
+    on_reconnect = AsyncMock()
+    state_callback = MagicMock()
+    supervisor = WebsocketSupervisor(
+        api=api_mock,
+        callback=callback,
+        on_reconnect=on_reconnect,
+        stable_connection_interval=0,
+    )
+    supervisor.register_state_callback(state_callback)
+    assert supervisor.state == WebsocketState.disconnected
+
+    # Connected, read one frame, lost, one failed attempt, connected again
+    api_mock.ws_connect.side_effect = [None, aiohttp.ClientConnectionError, None]
+    set_connected(api_mock, True, False)
+
+    with (
+        patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await supervisor.run()
+
+    api_mock.ws_read.assert_called_once_with(supervisor._receive_queue.put)
+    mock_sleep.assert_called_once()
+    assert state_callback.call_args_list == [
+        call(WebsocketState.connecting),
+        call(WebsocketState.connected),
+        call(WebsocketState.disconnected),
+        call(WebsocketState.connecting),
+        call(WebsocketState.connected),
+        call(WebsocketState.disconnected),
+    ]
+    assert supervisor.state == WebsocketState.disconnected
+
+    assert supervisor.metrics.connects == 2
+    assert supervisor.metrics.disconnects == 1
+    assert supervisor.metrics.failed_attempts == 1
+    assert supervisor.metrics.last_downtime is not None
+
+
+@pytest.mark.asyncio
+async def test_run_reconnect_callback(api_mock):
+    """Test the reconnect callback gets the downtime and errors are logged."""
+    on_reconnect = AsyncMock(side_effect=ValueError)
+    supervisor = WebsocketSupervisor(api=api_mock, on_reconnect=on_reconnect)
+    set_connected(api_mock, False, True)
+
+    # The reconnect callback runs in the background while reading
+    async def read(_callback):
+        await asyncio.sleep(0)
+
+    api_mock.ws_read.side_effect = read
+
+    with pytest.raises(asyncio.CancelledError):
+        await supervisor.run()
+
+    on_reconnect.assert_awaited_once()
+    assert on_reconnect.call_args.args[0] >= 0
+
+
+@pytest.mark.asyncio
+async def test_run_backoff(api_mock):
+    """Test the delay between connection attempts grows up to the maximum."""
+    supervisor = WebsocketSupervisor(
+        api=api_mock, reconnect_min_interval=1.0, reconnect_max_interval=5.0
+    )
+    api_mock.ws_connect.side_effect = [
+        aiohttp.WSServerHandshakeError(request_info=MagicMock(), history=()),
+        aiohttp.ClientConnectionError,
+        TimeoutError,
+        TimeoutError,
+        None,
+    ]
+    set_connected(api_mock)
+
+    with (
+        patch("backoff.full_jitter", side_effect=lambda value: value),
+        patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await supervisor.run()
+
+    assert mock_sleep.call_args_list == [call(1.0), call(2.0), call(4.0), call(5.0)]
+    assert supervisor.metrics.failed_attempts == 4
+    assert supervisor.metrics.connects == 1
+
+
+@pytest.mark.asyncio
+async def test_run_backoff_long_outage(api_mock):
+    """Test a long outage keeps retrying at the maximum backoff."""
+    supervisor = WebsocketSupervisor(
+        api=api_mock, reconnect_min_interval=1.0, reconnect_max_interval=60.0
+    )
+    api_mock.ws_connect.side_effect = [*([TimeoutError] * 2000), None]
+    set_connected(api_mock)
+
+    with (
+        patch("backoff.full_jitter", side_effect=lambda value: value),
+        patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await supervisor.run()
+
+    assert mock_sleep.call_count == 2000
+    assert mock_sleep.call_args == call(60.0)
+    assert supervisor.metrics.failed_attempts == 2000
+    assert supervisor.metrics.connects == 1
+
+
+@pytest.mark.asyncio
+async def test_run_backoff_quick_drop(api_mock):
+    """Test a connection lost right away doesn't reset the backoff."""
+    supervisor = WebsocketSupervisor(
+        api=api_mock, reconnect_min_interval=1.0, reconnect_max_interval=60.0
+    )
+
+    # Connected, lost, connected, lost, one failed attempt, connected again
+    api_mock.ws_connect.side_effect = [None, None, TimeoutError, None]
+    set_connected(api_mock, False, False)
+
+    with (
+        patch("backoff.full_jitter", side_effect=lambda value: value),
+        patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await supervisor.run()
+
+    assert mock_sleep.call_args_list == [call(1.0), call(2.0), call(4.0)]
+    assert supervisor.metrics.connects == 3
+    assert supervisor.metrics.disconnects == 2
+
+
+@pytest.mark.asyncio
+async def test_run_backoff_stable_connection(api_mock):
+    """Test a stable connection resets the backoff."""
+    supervisor = WebsocketSupervisor(
+        api=api_mock, reconnect_min_interval=1.0, stable_connection_interval=0
+    )
+
+    # One failed attempt, connected, lost, one failed attempt, connected again
+    api_mock.ws_connect.side_effect = [TimeoutError, None, TimeoutError, None]
+    set_connected(api_mock, False)
+
+    with (
+        patch("backoff.full_jitter", side_effect=lambda value: value),
+        patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await supervisor.run()
+
+    assert mock_sleep.call_args_list == [call(1.0), call(1.0)]
+
+
+@pytest.mark.asyncio
+async def test_run_reconnect_merged(api_mock):
+    """Test reconnects during a resynchronization are merged into one more."""
+    resynced = asyncio.Event()
+    downtimes = []
+
+    async def on_reconnect(downtime: float):
+        downtimes.append(downtime)
+        await resynced.wait()
+
+    async def ws_read(callback):
+        resynced.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    supervisor = WebsocketSupervisor(
+        api=api_mock, on_reconnect=on_reconnect, stable_connection_interval=0
+    )
+
+    # Three reconnects while the first resynchronization is running
+    api_mock.ws_connect.side_effect = [None, None, None, None]
+    api_mock.ws_read.side_effect = ws_read
+    set_connected(api_mock, False, False, False, True)
+
+    with pytest.raises(asyncio.CancelledError):
+        await supervisor.run()
+
+    assert len(downtimes) == 2
+    assert supervisor.metrics.connects == 4
+
+
+@pytest.mark.asyncio
+async def test_run_ssl_error(api_mock):
+    """Test an SSL error stops the supervisor."""
+    supervisor = WebsocketSupervisor(api=api_mock)
+    api_mock.ws_connect.side_effect = aiohttp.ClientSSLError(
+        connection_key=MagicMock(), os_error=OSError()
+    )
+
+    with pytest.raises(SslErrorException):
+        await supervisor.run()
+
+    assert supervisor.state == WebsocketState.disconnected
+
+
+def test_remove_state_callback(api_mock):
+    """Test a removed state callback is not called."""
+    supervisor = WebsocketSupervisor(api=api_mock)
+    state_callback = MagicMock()
+
+    supervisor.register_state_callback(state_callback)
+    supervisor.remove_state_callback(state_callback)
+    supervisor._set_state(WebsocketState.connecting)
+
+    state_callback.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_receive_queue(api_mock):
+    """Test received messages are passed to the callback by a dispatcher."""
+    callback = MagicMock()
+    supervisor = WebsocketSupervisor(api=api_mock, callback=callback)
+    assert supervisor.receive_queue_metrics.received == 0
+    set_connected(api_mock, True)
+
+    message = WebsocketMessage()
+
+    async def read(read_callback):
+        await read_callback(message)
+        # A slow callback does not block reading the websocket
+        assert callback.call_count == 0
+        await asyncio.sleep(0)
+
+    api_mock.ws_read.side_effect = read
+
+    with pytest.raises(asyncio.CancelledError):
+        await supervisor.run()
+
+    callback.assert_called_once_with(message)
+    assert supervisor.receive_queue_metrics.dispatched == 1
+
+
+def test_run_without_callback(api_mock):
+    """Test there is no receive queue without a callback."""
+    assert WebsocketSupervisor(api=api_mock).receive_queue_metrics is None
+
+
+def test_metrics():
+    """Test the downtime and missed heartbeat intervals."""
+    metrics = WebsocketMetrics(heartbeat=30)
+    metrics.record_connected(downtime=None)
+    assert metrics.last_downtime is None
+
+    metrics.record_disconnected()
+    metrics.record_connected(downtime=95.0)
+    metrics.record_disconnected()
+    metrics.record_connected(downtime=10.0)
+
+    assert metrics.connects == 3
+    assert metrics.disconnects == 2
+    assert metrics.downtime == 105.0
+    assert metrics.last_downtime == 10.0
+    assert metrics.missed_intervals == 3
+    assert repr(metrics) == (
+        "WebsocketMetrics(connects=3, disconnects=2, failed_attempts=0, "
+        "downtime=105.0, missed_intervals=3)"
+    )
+
+    # Without a heartbeat no intervals are counted
+    metrics = WebsocketMetrics(heartbeat=None)
+    metrics.record_connected(downtime=95.0)
+    assert metrics.missed_intervals == 0